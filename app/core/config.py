@@ -6,6 +6,101 @@ class Settings:
     SECRET_KEY: str = os.getenv("SECRET_KEY", "your-secret-key")
     ALGORITHM: str = os.getenv("ALGORITHM", "HS256")
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
+
+    # Connection pool (app/database/connection.py)
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "5"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    DB_POOL_TIMEOUT: float = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+    DB_POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", "1").lower() in ("1", "true", "yes")
+    # Log a saturation warning when a checkout waits at least this long
+    DB_POOL_WAIT_ALARM_MS: float = float(os.getenv("DB_POOL_WAIT_ALARM_MS", "100"))
+    DB_POOL_ALARM_INTERVAL_S: float = float(os.getenv("DB_POOL_ALARM_INTERVAL_S", "30"))
+
+    # Read replicas (DATABASE_REPLICA_URLS, app/database/replicas.py): round_robin or least_loaded
+    DB_REPLICA_SELECTION: str = os.getenv("DB_REPLICA_SELECTION", "round_robin")
+    # A replica that fails is skipped for this long before it is tried again
+    DB_REPLICA_RETRY_S: float = float(os.getenv("DB_REPLICA_RETRY_S", "30"))
+    # A caller's reads go to the primary this long after it writes; 0 disables (keep above replica lag)
+    DB_READ_YOUR_WRITES_S: float = float(os.getenv("DB_READ_YOUR_WRITES_S", "5"))
+
+    # Run `alembic upgrade head` in the app lifespan; for single-process dev setups.
+    # Multi-worker deployments should migrate once as a deploy step instead.
+    DB_MIGRATE_ON_STARTUP: bool = os.getenv("DB_MIGRATE_ON_STARTUP", "0").lower() in ("1", "true", "yes")
+
+    # OpenAPI document written by scripts/build_openapi.py
+    OPENAPI_CACHE_PATH: str = os.getenv("OPENAPI_CACHE_PATH", "app/openapi.json")
+
+    # Per-route latency and SQL metrics (app/core/request_metrics.py, served on /metrics).
+    # Off removes the middleware and the engine hooks entirely.
+    REQUEST_METRICS_ENABLED: bool = os.getenv("REQUEST_METRICS_ENABLED", "1").lower() in ("1", "true", "yes")
+    # Log requests at least this slow with their SQL breakdown; 0 disables the log
+    SLOW_REQUEST_MS: float = float(os.getenv("SLOW_REQUEST_MS", "500"))
+
+    # Transactional outbox (app/utils/outbox.py): booking changes write an event in the
+    # same transaction; scripts/outbox_worker.py runs the side effects.
+    OUTBOX_ENABLED: bool = os.getenv("OUTBOX_ENABLED", "1").lower() in ("1", "true", "yes")
+    # Comma-separated modules whose @outbox.subscribe handlers the worker loads
+    OUTBOX_HANDLERS: str = os.getenv("OUTBOX_HANDLERS", "")
+    OUTBOX_BATCH_SIZE: int = int(os.getenv("OUTBOX_BATCH_SIZE", "100"))
+    OUTBOX_POLL_INTERVAL_S: float = float(os.getenv("OUTBOX_POLL_INTERVAL_S", "0.5"))
+    OUTBOX_MAX_ATTEMPTS: int = int(os.getenv("OUTBOX_MAX_ATTEMPTS", "8"))
+    OUTBOX_BACKOFF_BASE_S: float = float(os.getenv("OUTBOX_BACKOFF_BASE_S", "1"))
+    OUTBOX_BACKOFF_MAX_S: float = float(os.getenv("OUTBOX_BACKOFF_MAX_S", "300"))
+    # Processed events are deleted after this many hours; failed ones are kept
+    OUTBOX_RETENTION_H: float = float(os.getenv("OUTBOX_RETENTION_H", "24"))
+    # Worker's Prometheus endpoint; 0 disables it
+    OUTBOX_METRICS_PORT: int = int(os.getenv("OUTBOX_METRICS_PORT", "9101"))
+
+    # Live booking/availability streams (GET /live/..., app/utils/live_hub.py).
+    # "local" fans out inside each worker; "postgres" relays through LISTEN/NOTIFY
+    # so a change made on one worker reaches subscribers on all of them.
+    LIVE_BACKEND: str = os.getenv("LIVE_BACKEND", "local").lower()
+    # Undelivered events kept per subscriber before it is told to resync
+    LIVE_QUEUE_SIZE: int = int(os.getenv("LIVE_QUEUE_SIZE", "32"))
+    LIVE_MAX_SUBSCRIBERS: int = int(os.getenv("LIVE_MAX_SUBSCRIBERS", "10000"))
+    LIVE_HEARTBEAT_S: float = float(os.getenv("LIVE_HEARTBEAT_S", "15"))
+
+    # Serve the migrated routers (bookings, favorites) from the async database stack
+    DB_ASYNC: bool = os.getenv("DB_ASYNC", "0").lower() in ("1", "true", "yes")
+
+    # GET /bookings/ and GET /reviews/ encode Core rows straight to JSON, skipping
+    # response-model validation (app/utils/fast_json.py)
+    FAST_JSON_LISTS: bool = os.getenv("FAST_JSON_LISTS", "0").lower() in ("1", "true", "yes")
+
+    # Password hashing (app/core/hash.py)
+    BCRYPT_ROUNDS: int = int(os.getenv("BCRYPT_ROUNDS", "12"))
+    HASH_POOL_ENABLED: bool = os.getenv("HASH_POOL_ENABLED", "1").lower() in ("1", "true", "yes")
+    HASH_WORKERS: int = int(os.getenv("HASH_WORKERS", str(os.cpu_count() or 2)))
+    HASH_MAX_PENDING: int = int(os.getenv("HASH_MAX_PENDING", "64"))
+    HASH_TIMEOUT_S: float = float(os.getenv("HASH_TIMEOUT_S", "10"))
+
+    # Authenticated-principal cache (app/core/principal.py)
+    PRINCIPAL_CACHE_SIZE: int = int(os.getenv("PRINCIPAL_CACHE_SIZE", "10000"))
+    PRINCIPAL_CACHE_TTL_S: float = float(os.getenv("PRINCIPAL_CACHE_TTL_S", "60"))
+
+    # In-process catalog search index for databases without full-text search (app/utils/search_index.py);
+    # rebuilt after this long, picking up other workers' service writes
+    SEARCH_INDEX_TTL_S: float = float(os.getenv("SEARCH_INDEX_TTL_S", "60"))
+
+    # Serialized service detail (app/utils/service_cache.py)
+    SERVICE_CACHE_SIZE: int = int(os.getenv("SERVICE_CACHE_SIZE", "10000"))
+    SERVICE_CACHE_TTL_S: float = float(os.getenv("SERVICE_CACHE_TTL_S", "300"))
+    # Cache-Control max-age sent with GET /services/{id}
+    SERVICE_CACHE_MAX_AGE_S: int = int(os.getenv("SERVICE_CACHE_MAX_AGE_S", "30"))
+
+    # Rendered HTML pages (app/utils/page_cache.py); TTLs are per route in app/routers/pages.py
+    PAGE_CACHE_ENABLED: bool = os.getenv("PAGE_CACHE_ENABLED", "1").lower() in ("1", "true", "yes")
+    PAGE_CACHE_SIZE: int = int(os.getenv("PAGE_CACHE_SIZE", "2000"))
+
+    # In-process booking interval index (app/utils/booking_index.py); least recently used evicted first
+    BOOKING_INDEX_MAX_FREELANCERS: int = int(os.getenv("BOOKING_INDEX_MAX_FREELANCERS", "10000"))
+
+    # In-memory calendar bitmaps (app/utils/calendar_cache.py)
+    CALENDAR_CACHE_MAX_FREELANCERS: int = int(os.getenv("CALENDAR_CACHE_MAX_FREELANCERS", "1000"))
+    CALENDAR_CACHE_MAX_DAYS: int = int(os.getenv("CALENDAR_CACHE_MAX_DAYS", "120"))
+    # Reload a freelancer's bitmaps after this long, picking up other workers' changes
+    CALENDAR_CACHE_TTL_S: float = float(os.getenv("CALENDAR_CACHE_TTL_S", "60"))
     
     class config:
         env_file = ".env"  # 1 hour
@@ -2,10 +2,14 @@
 
 from fastapi import Depends, HTTPException, status, Request
 from jose import JWTError, jwt
+from sqlalchemy import select
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.config import settings
+from app.core.principal import Principal, principal_cache, token_signature
 from app.models.user import User
 from app.database.session import get_db
+from app.database.connection import get_async_db
 from fastapi.security import OAuth2PasswordBearer
 from typing import Optional
 import time
@@ -18,11 +22,7 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")  # Matches your rou
 # ----------------------------
 # Get Current User Dependency
 # ----------------------------
-def get_current_user(
-    request: Request,
-    token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db)
-) -> User:
+def decode_token(request: Request, token: Optional[str]) -> tuple[int, str]:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -49,25 +49,79 @@ def get_current_user(
     except JWTError:
         raise credentials_exception
 
-    user = db.query(User).filter(User.id == int(user_id)).first()
-    if user is None:
-        raise credentials_exception
+    return int(user_id), token
+
+
+def principal_query(user_id: int):
+    return select(User.id, User.role, User.username).where(User.id == user_id)
+
+
+def cached_principal(db: Session, user_id: int, token: str) -> Optional[Principal]:
+    key = (user_id, token_signature(token))
+    principal = principal_cache.get(key)
+    if principal is None:
+        row = db.execute(principal_query(user_id)).first()
+        if row is None:
+            return None
+        principal = Principal(*row)
+        principal_cache.set(key, principal)
+    return principal
+
+
+def get_current_user(
+    request: Request,
+    token: str = Depends(oauth2_scheme),
+    db: Session = Depends(get_db)
+) -> Principal:
+    user_id, token = decode_token(request, token)
+    principal = cached_principal(db, user_id, token)
+    if principal is None:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Could not validate credentials")
+
+    return principal
+
+
+async def get_current_user_async(
+    request: Request,
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_async_db)
+) -> Principal:
+    user_id, token = decode_token(request, token)
+    key = (user_id, token_signature(token))
+    principal = principal_cache.get(key)
+    if principal is None:
+        row = (await db.execute(principal_query(user_id))).first()
+        if row is None:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Could not validate credentials")
+        principal = Principal(*row)
+        principal_cache.set(key, principal)
+
+    return principal
+
 
+def get_current_user_model(
+    principal: Principal = Depends(get_current_user),
+    db: Session = Depends(get_db)
+) -> User:
+    """Full ORM row for handlers that read or modify more than id/role/username."""
+    user = db.get(User, principal.id)
+    if user is None:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Could not validate credentials")
     return user
 
 
-def admin_required(current_user: User = Depends(get_current_user)) -> User:
+def admin_required(current_user: Principal = Depends(get_current_user)) -> Principal:
     if current_user.role != "admin":
         raise HTTPException(status_code=403, detail="Admin access required")
     return current_user
 
-def freelancer_required(current_user: User = Depends(get_current_user)) -> User:
+def freelancer_required(current_user: Principal = Depends(get_current_user)) -> Principal:
     if current_user.role != "freelancer":
         raise HTTPException(status_code=403, detail="Freelancer access required")
     return current_user
 
 def role_required(allowed_roles: list[str]):
-    def role_dependency(current_user: User = Depends(get_current_user)) -> User:
+    def role_dependency(current_user: Principal = Depends(get_current_user)) -> Principal:
         if current_user.role not in allowed_roles:
             raise HTTPException(status_code=403, detail="Access denied: insufficient permissions")
         return current_user
@@ -76,7 +130,7 @@ def role_required(allowed_roles: list[str]):
 # --------------------------------------
 # Try get current user (no exception)
 # --------------------------------------
-def try_get_current_user(request: Request, db: Session = Depends(get_db)) -> Optional[User]:
+def try_get_current_user(request: Request, db: Session = Depends(get_db)) -> Optional[Principal]:
     """Best-effort decode of Authorization Bearer token; returns None on failure.
 
     Useful for server-rendered page routes where we want to redirect rather than
@@ -91,7 +145,6 @@ def try_get_current_user(request: Request, db: Session = Depends(get_db)) -> Opt
         user_id: str = payload.get("sub")
         if not user_id:
             return None
-        user = db.query(User).filter(User.id == int(user_id)).first()
-        return user
+        return cached_principal(db, int(user_id), token)
     except JWTError:
         return None
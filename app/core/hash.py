@@ -1,12 +1,135 @@
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeout
+from concurrent.futures.process import BrokenProcessPool
+
+from fastapi import HTTPException, status
 from passlib.context import CryptContext
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from app.core.config import settings
+
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.BCRYPT_ROUNDS)
+
+
+# Run in the worker processes; must stay importable top-level functions
+def _hash(password: str) -> str:
+    return pwd_context.hash(password)
+
+
+def _verify(plain_password: str, hashed_password: str) -> bool:
+    return pwd_context.verify(plain_password, hashed_password)
+
+
+def bcrypt_cost(hashed_password: str) -> int | None:
+    # $2b$12$<salt+digest>
+    try:
+        return int(hashed_password.split("$")[2])
+    except (IndexError, ValueError):
+        return None
+
+
+class HashPool:
+    """Bounded process pool for bcrypt so hashing doesn't eat request threads.
+
+    At most HASH_MAX_PENDING jobs are queued or running; beyond that callers
+    get an immediate 503 instead of piling up behind the CPU.
+    """
+
+    def __init__(self, workers: int, max_pending: int, timeout: float):
+        self.workers = workers
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self.rejected = 0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    # spawn: forking a process that holds DB connections and threads is unsafe
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+                    )
+        return self._executor
+
+    def run(self, fn, *args):
+        if not self._slots.acquire(blocking=False):
+            self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Authentication service is busy, please retry",
+                headers={"Retry-After": "1"},
+            )
+        try:
+            executor = self._get_executor()
+            future = executor.submit(fn, *args)
+        except BrokenProcessPool:
+            self._slots.release()
+            self._discard(executor)
+            raise self._restarting()
+        except BaseException:
+            self._slots.release()
+            raise
+        # The slot is held until the job really ends, not until we stop waiting:
+        # a timed-out bcrypt keeps its worker busy and cancel() can't stop it
+        future.add_done_callback(lambda _: self._slots.release())
+        try:
+            return future.result(timeout=self.timeout)
+        except BrokenProcessPool:
+            # A child died (OOM kill, crash, failed spawn import); the next call starts a fresh pool
+            self._discard(executor)
+            raise self._restarting()
+        except FutureTimeout:
+            future.cancel()  # only helps if it is still queued
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Authentication service timed out, please retry",
+                headers={"Retry-After": "1"},
+            )
+
+    @staticmethod
+    def _restarting() -> HTTPException:
+        return HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Authentication service restarting, please retry",
+            headers={"Retry-After": "1"},
+        )
+
+    def _discard(self, executor: ProcessPoolExecutor):
+        with self._lock:
+            # Concurrent callers all see the same broken pool; only the first replaces it
+            if self._executor is executor:
+                self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+hash_pool = HashPool(
+    workers=settings.HASH_WORKERS,
+    max_pending=settings.HASH_MAX_PENDING,
+    timeout=settings.HASH_TIMEOUT_S,
+)
+
 
 class Hash:
     @staticmethod
     def bcrypt(password: str):
-        return pwd_context.hash(password)
+        if not settings.HASH_POOL_ENABLED:
+            return _hash(password)
+        return hash_pool.run(_hash, password)
 
     @staticmethod
     def verify(plain_password: str, hashed_password: str):
-        return pwd_context.verify(plain_password, hashed_password)
+        if not settings.HASH_POOL_ENABLED:
+            return _verify(plain_password, hashed_password)
+        return hash_pool.run(_verify, plain_password, hashed_password)
+
+    @staticmethod
+    def needs_rehash(hashed_password: str) -> bool:
+        """True when the stored hash was made with a different bcrypt cost."""
+        return bcrypt_cost(hashed_password) != settings.BCRYPT_ROUNDS or pwd_context.needs_update(hashed_password)
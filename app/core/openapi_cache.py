@@ -0,0 +1,46 @@
+# app/core/openapi_cache.py
+#
+# The OpenAPI document is written to disk by scripts/build_openapi.py at
+# image build time and loaded from there on the first /docs or
+# /openapi.json hit, instead of every worker walking all routes again.
+
+import json
+import logging
+import os
+
+logger = logging.getLogger("app.openapi")
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def newest_source_mtime(root: str = APP_DIR) -> float:
+    newest = 0.0
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in ("__pycache__", "static", "templates")]
+        for name in filenames:
+            if name.endswith(".py"):
+                newest = max(newest, os.stat(os.path.join(dirpath, name)).st_mtime)
+    return newest
+
+
+def load_schema(path: str) -> dict | None:
+    """The cached document, or None if missing or older than any app/*.py file."""
+    try:
+        if os.stat(path).st_mtime < newest_source_mtime():
+            logger.info("OpenAPI cache %s is older than the code; regenerating", path)
+            return None
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning("Ignoring unreadable OpenAPI cache %s: %s", path, e)
+        return None
+
+
+def write_schema(path: str, schema: dict):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(schema, f, separators=(",", ":"))
+    os.replace(tmp, path)
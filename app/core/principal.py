@@ -0,0 +1,37 @@
+# app/core/principal.py
+
+from dataclasses import dataclass
+
+from app.core.config import settings
+from app.models.user import UserRole
+from app.utils.ttl_cache import TTLCache
+
+
+@dataclass(frozen=True, slots=True)
+class Principal:
+    """The authenticated caller, as returned by get_current_user.
+
+    Carries only what authorization checks need; handlers that need the full
+    row (email, password hash, relationships) depend on get_current_user_model.
+    """
+    id: int
+    role: UserRole
+    username: str
+
+
+# Keyed by (user_id, token signature) so a cached entry is only ever reused
+# for the exact token it was resolved from.
+principal_cache = TTLCache(maxsize=settings.PRINCIPAL_CACHE_SIZE, ttl=settings.PRINCIPAL_CACHE_TTL_S)
+
+
+def token_signature(token: str) -> str:
+    return token.rsplit(".", 1)[-1]
+
+
+def invalidate_principal(user_id: int):
+    """Call after changing a user's username or role.
+
+    Only this worker's cache is cleared; other workers converge within
+    PRINCIPAL_CACHE_TTL_S.
+    """
+    principal_cache.pop_where(lambda key: key[0] == user_id)
@@ -0,0 +1,252 @@
+# app/core/request_metrics.py
+
+import logging
+import threading
+import time
+from collections import deque
+
+from app.core.config import settings
+from app.database.query_metrics import QueryStats, current_queries
+
+logger = logging.getLogger("app.requests")
+
+# Upper bounds (seconds) of the latency histogram buckets
+LATENCY_BUCKETS_S = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Recent percentiles cover this many seconds, kept in SLOT_S slices
+WINDOW_S = 300
+SLOT_S = 60
+# Label for requests no route matched (404s), so raw paths never become labels
+UNMATCHED = "<unmatched>"
+STATEMENT_CHARS = 300
+
+
+def bucket_index(seconds: float) -> int:
+    for i, bound in enumerate(LATENCY_BUCKETS_S):
+        if seconds <= bound:
+            return i
+    return len(LATENCY_BUCKETS_S)
+
+
+def bucket_percentile(counts: list[int], pct: float) -> float | None:
+    """Upper bound (ms) of the bucket holding the pct-th percentile; None for the overflow bucket."""
+    total = sum(counts)
+    if not total:
+        return None
+    rank, seen = total * pct / 100, 0
+    for i, count in enumerate(counts):
+        seen += count
+        if seen >= rank:
+            return LATENCY_BUCKETS_S[i] * 1000 if i < len(LATENCY_BUCKETS_S) else None
+    return None
+
+
+class RouteMetrics:
+    """Counters for one (method, route template); mutated under RequestMetrics._lock."""
+
+    __slots__ = ("requests", "errors", "slow", "statuses", "seconds_total", "buckets", "queries_total",
+                 "sql_seconds_total", "recent")
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.slow = 0
+        self.statuses: dict[int, int] = {}
+        self.seconds_total = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS_S) + 1)
+        self.queries_total = 0
+        self.sql_seconds_total = 0.0
+        # (slot start, bucket counts) for the rolling window
+        self.recent: deque[tuple[int, list[int]]] = deque()
+
+    def observe(self, status: int, seconds: float, queries: QueryStats, slow: bool, now: float):
+        self.requests += 1
+        self.errors += status >= 500
+        self.slow += slow
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+        self.seconds_total += seconds
+        bucket = bucket_index(seconds)
+        self.buckets[bucket] += 1
+        self.queries_total += queries.count
+        self.sql_seconds_total += queries.total_ms / 1000
+
+        slot = int(now // SLOT_S) * SLOT_S
+        if not self.recent or self.recent[-1][0] != slot:
+            self.recent.append((slot, [0] * len(self.buckets)))
+        self.recent[-1][1][bucket] += 1
+        while self.recent[0][0] <= now - WINDOW_S - SLOT_S:
+            self.recent.popleft()
+
+    def copy(self) -> "RouteMetrics":
+        other = RouteMetrics()
+        for name in self.__slots__:
+            setattr(other, name, getattr(self, name))
+        other.statuses, other.buckets, other.recent = dict(self.statuses), list(self.buckets), deque()
+        return other
+
+    def recent_counts(self, now: float) -> list[int]:
+        counts = [0] * len(self.buckets)
+        for slot, slot_counts in self.recent:
+            if slot > now - WINDOW_S - SLOT_S:
+                counts = [a + b for a, b in zip(counts, slot_counts)]
+        return counts
+
+
+class RequestMetrics:
+    """Per-route latency and SQL totals for this worker process.
+
+    Prometheus computes windows from the cumulative histograms itself;
+    snapshot() adds bucket-resolution percentiles over the last WINDOW_S
+    for humans reading /health/requests.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._routes: dict[tuple[str, str], RouteMetrics] = {}
+
+    def observe(self, method: str, route: str, status: int, seconds: float, queries: QueryStats):
+        slow = 0 < settings.SLOW_REQUEST_MS <= seconds * 1000
+        with self._lock:
+            metrics = self._routes.get((method, route))
+            if metrics is None:
+                metrics = self._routes[(method, route)] = RouteMetrics()
+            metrics.observe(status, seconds, queries, slow, time.time())
+        if slow:
+            statement = " ".join((queries.slowest_statement or "-").split())[:STATEMENT_CHARS]
+            logger.warning(
+                "Slow request %s %s: %.0fms status=%s sql=%d queries in %.0fms, slowest %.0fms: %s",
+                method, route, seconds * 1000, status, queries.count, queries.total_ms, queries.slowest_ms, statement,
+            )
+
+    def items(self) -> list[tuple[tuple[str, str], RouteMetrics]]:
+        """Consistent copies, safe to read while requests keep updating the originals."""
+        with self._lock:
+            return sorted((key, metrics.copy()) for key, metrics in self._routes.items())
+
+    def snapshot(self) -> dict:
+        now = time.time()
+        result = {}
+        with self._lock:
+            for (method, route), m in sorted(self._routes.items()):
+                recent = m.recent_counts(now)
+                result[f"{method} {route}"] = {
+                    "requests": m.requests,
+                    "errors": m.errors,
+                    "slow": m.slow,
+                    "avg_ms": round(m.seconds_total * 1000 / m.requests, 3),
+                    "avg_queries": round(m.queries_total / m.requests, 2),
+                    "avg_sql_ms": round(m.sql_seconds_total * 1000 / m.requests, 3),
+                    "recent": {
+                        "window_s": WINDOW_S,
+                        "requests": sum(recent),
+                        **{f"p{pct}_ms": bucket_percentile(recent, pct) for pct in (50, 95, 99)},
+                    },
+                }
+        return result
+
+
+request_metrics = RequestMetrics()
+
+
+class RequestMetricsMiddleware:
+    """ASGI middleware timing each request and collecting the SQL it runs.
+
+    Requests are keyed by route template (scope["route"], set by routing),
+    not by raw path, so label cardinality stays bounded.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        queries = QueryStats()
+        token = current_queries.set(queries)
+        status = 500
+        streaming = False
+
+        async def send_with_status(message):
+            nonlocal status, streaming
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                streaming = any(name == b"content-type" and value.startswith(b"text/event-stream")
+                                for name, value in message.get("headers", ()))
+            await send(message)
+
+        t0 = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - t0
+            current_queries.reset(token)
+            # Event streams stay open for minutes: not a latency sample
+            if not streaming:
+                route = scope.get("route")
+                template = getattr(route, "path", None) or scope.get("root_path") or UNMATCHED
+                request_metrics.observe(scope["method"], template, status, elapsed, queries)
+
+
+def _label(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels) -> str:
+    return "{" + ",".join(f'{name}="{_label(value)}"' for name, value in labels.items()) + "}"
+
+
+def render_prometheus(pools: dict) -> str:
+    """Prometheus text exposition (format 0.0.4) of the request and pool metrics.
+
+    `pools` is app.database.pool_metrics.pool_metrics. Values are per worker
+    process: run one worker per scrape target (or per container) to see them all.
+    """
+    lines = []
+
+    def family(name: str, kind: str, help_text: str):
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+
+    routes = request_metrics.items()
+    family("http_requests_total", "counter", "Requests handled, by route template and status.")
+    for (method, route), m in routes:
+        for status, count in sorted(m.statuses.items()):
+            lines.append(f"http_requests_total{_labels(method=method, route=route, status=status)} {count}")
+
+    family("http_request_duration_seconds", "histogram", "Request latency, by route template.")
+    for (method, route), m in routes:
+        cumulative = 0
+        for bound, count in zip((*LATENCY_BUCKETS_S, "+Inf"), m.buckets):
+            cumulative += count
+            lines.append(f"http_request_duration_seconds_bucket{_labels(method=method, route=route, le=bound)} "
+                         f"{cumulative}")
+        lines.append(f"http_request_duration_seconds_sum{_labels(method=method, route=route)} {m.seconds_total:.6f}")
+        lines.append(f"http_request_duration_seconds_count{_labels(method=method, route=route)} {m.requests}")
+
+    family("http_requests_slow_total", "counter", "Requests slower than SLOW_REQUEST_MS.")
+    for (method, route), m in routes:
+        lines.append(f"http_requests_slow_total{_labels(method=method, route=route)} {m.slow}")
+
+    family("db_queries_total", "counter", "SQL statements executed while handling requests.")
+    for (method, route), m in routes:
+        lines.append(f"db_queries_total{_labels(method=method, route=route)} {m.queries_total}")
+
+    family("db_query_duration_seconds_total", "counter", "Time spent in SQL statements while handling requests.")
+    for (method, route), m in routes:
+        lines.append(f"db_query_duration_seconds_total{_labels(method=method, route=route)} "
+                     f"{m.sql_seconds_total:.6f}")
+
+    snapshots = {name: metrics.snapshot() for name, metrics in sorted(pools.items())}
+    for key, name, kind, help_text in (
+        ("checkouts", "db_pool_checkouts_total", "counter", "Connections checked out of the pool."),
+        ("connects", "db_pool_connects_total", "counter", "New DBAPI connections opened."),
+        ("invalidations", "db_pool_invalidations_total", "counter", "Connections invalidated."),
+        ("timeouts", "db_pool_timeouts_total", "counter", "Checkouts that timed out waiting."),
+        ("checked_out", "db_pool_checked_out", "gauge", "Connections currently checked out."),
+        ("size", "db_pool_size", "gauge", "Configured pool size."),
+    ):
+        family(name, kind, help_text)
+        for pool, snapshot in snapshots.items():
+            if key in snapshot:
+                lines.append(f"{name}{_labels(pool=pool)} {snapshot[key]}")
+    return "\n".join(lines) + "\n"
@@ -1,24 +1,166 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker, declarative_base
 from dotenv import load_dotenv
 import os
+import threading
+
+from app.core.config import settings
+from app.database.pool_metrics import instrument, pool_options
+from app.database.query_metrics import instrument_queries
+from app.database.replicas import ReadSession, ReplicaSet, use_replica
 
 from sqlalchemy.orm import Session
-from fastapi import Depends
+from fastapi import Depends, Request
 
 
 load_dotenv()
 DATABASE_URL = os.getenv("DATABASE_URL")
+# Comma-separated read replicas of DATABASE_URL, used by get_read_db (app/database/replicas.py)
+DATABASE_REPLICA_URLS = [url.strip() for url in os.getenv("DATABASE_REPLICA_URLS", "").split(",") if url.strip()]
+
+# The engine is built by init_engine() (called from the app lifespan), not
+# at import, so importing the app never loads a DB driver or needs the URL.
+# `from app.database.connection import engine` still works: it builds the
+# engine on first access via the module __getattr__ below.
+_engine = None
+_engine_lock = threading.Lock()
+
+
+class LazySessionmaker(sessionmaker):
+    """sessionmaker that builds the engine on first use (scripts, tests without lifespan)."""
 
-engine = create_engine(DATABASE_URL)
+    def __call__(self, **local_kw):
+        if self.kw.get("bind") is None:
+            init_engine()
+        return super().__call__(**local_kw)
 
-SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit= False)
+
+SessionLocal = LazySessionmaker(autoflush=False, autocommit= False)
+# Bound to the primary too (the fallback); init_engine() adds the replicas
+ReadSessionLocal = LazySessionmaker(class_=ReadSession, autoflush=False, autocommit=False)
+replicas = ReplicaSet(settings.DB_REPLICA_SELECTION)
 
 Base = declarative_base()
 
+
+def init_engine():
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                if not DATABASE_URL:
+                    raise RuntimeError("DATABASE_URL is not set")
+                engine = build_engine("sync", DATABASE_URL)
+                for i, url in enumerate(DATABASE_REPLICA_URLS):
+                    replicas.add(f"replica-{i}", build_engine(f"replica-{i}", url))
+                SessionLocal.configure(bind=engine)
+                ReadSessionLocal.configure(bind=engine, replicas=replicas)
+                _engine = engine
+    return _engine
+
+
+def build_engine(name: str, url: str):
+    engine = create_engine(url, **pool_options(make_url(url)))
+    instrument(name, engine)
+    if settings.REQUEST_METRICS_ENABLED:
+        instrument_queries(engine)
+    return engine
+
+
+def dispose_engine():
+    if _engine is not None:
+        _engine.dispose()
+        for replica in replicas.replicas:
+            replica.engine.dispose()
+
+
+def __getattr__(name: str):
+    if name == "engine":
+        return init_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+def get_read_db(request: Request):
+    """get_db for read-only handlers: queries go to a replica if any is configured and up.
+
+    Callers that wrote within DB_READ_YOUR_WRITES_S read from the primary.
+    """
+    db = ReadSessionLocal() if DATABASE_REPLICA_URLS and use_replica(request) else SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+# ----------------------------
+# Async stack (DB_ASYNC=1)
+# ----------------------------
+# Same database, async driver. Built on first use so sync-only deployments
+# don't need asyncpg (or aiosqlite for local SQLite) installed.
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+def async_database_url(url: str) -> str:
+    parsed = make_url(url)
+    driver = ASYNC_DRIVERS.get(parsed.get_backend_name())
+    if driver is None:
+        raise RuntimeError(f"No async driver configured for {parsed.get_backend_name()}")
+    return parsed.set(drivername=driver).render_as_string(hide_password=False)
+
+_async_sessionmaker = None
+_async_read_sessionmaker = None
+async_replicas = ReplicaSet(settings.DB_REPLICA_SELECTION)
+_async_replica_engines = []
+
+def get_async_sessionmaker():
+    global _async_sessionmaker, _async_read_sessionmaker
+    if _async_sessionmaker is None:
+        from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+        url = make_url(os.getenv("ASYNC_DATABASE_URL") or async_database_url(DATABASE_URL))
+        async_engine = build_async_engine("async", url)
+        for i, replica_url in enumerate(DATABASE_REPLICA_URLS):
+            replica_engine = build_async_engine(f"async-replica-{i}", make_url(async_database_url(replica_url)))
+            async_replicas.add(f"async-replica-{i}", replica_engine.sync_engine)
+            _async_replica_engines.append(replica_engine)
+        _async_read_sessionmaker = async_sessionmaker(bind=async_engine, class_=AsyncSession,
+                                                      sync_session_class=ReadSession, replicas=async_replicas,
+                                                      autoflush=False, expire_on_commit=False)
+        _async_sessionmaker = async_sessionmaker(bind=async_engine, class_=AsyncSession,
+                                                 autoflush=False, expire_on_commit=False)
+    return _async_sessionmaker
+
+def build_async_engine(name: str, url):
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    async_engine = create_async_engine(url, **pool_options(url, async_=True))
+    instrument(name, async_engine.sync_engine)
+    if settings.REQUEST_METRICS_ENABLED:
+        instrument_queries(async_engine.sync_engine)
+    return async_engine
+
+async def dispose_async_engine():
+    if _async_sessionmaker is not None:
+        await _async_sessionmaker.kw["bind"].dispose()
+        for replica_engine in _async_replica_engines:
+            await replica_engine.dispose()
+
+async def get_async_db():
+    async with get_async_sessionmaker()() as db:
+        yield db
+
+async def get_async_read_db(request: Request):
+    """get_read_db for the async stack."""
+    get_async_sessionmaker()
+    maker = _async_read_sessionmaker if DATABASE_REPLICA_URLS and use_replica(request) else _async_sessionmaker
+    async with maker() as db:
+        yield db
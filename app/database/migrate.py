@@ -0,0 +1,51 @@
+# app/database/migrate.py
+
+import logging
+import os
+
+ALEMBIC_INI = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "alembic.ini")
+
+# Databases built by the app's old import-time create_all have no
+# alembic_version table; their schema is 001_initial's plus the
+# availability_slots and favorites tables, which 006 adopts as they are.
+CREATE_ALL_REVISION = "001_initial"
+
+logger = logging.getLogger("app.database.migrate")
+
+
+def upgrade_head():
+    """Apply pending Alembic migrations (same as `alembic upgrade head`).
+
+    A database created by the old create_all is stamped at
+    CREATE_ALL_REVISION first, so the upgrade does not try to create its
+    tables again. Used by the app lifespan when DB_MIGRATE_ON_STARTUP is
+    set, and by `python -m app.database.migrate`. With several workers or
+    replicas, run the latter once as a deploy step instead, so they don't
+    race on the same revision.
+    """
+    from alembic import command
+    from alembic.config import Config
+
+    config = Config(ALEMBIC_INI)
+    config.set_main_option("script_location", os.path.join(os.path.dirname(ALEMBIC_INI), "migrations"))
+    # Keep the server's logging setup; env.py would otherwise apply alembic.ini's
+    config.attributes["configure_logger"] = False
+    if built_by_create_all():
+        logger.warning("Database has tables but no alembic_version: stamping %s before upgrading",
+                       CREATE_ALL_REVISION)
+        command.stamp(config, CREATE_ALL_REVISION)
+    command.upgrade(config, "head")
+
+
+def built_by_create_all() -> bool:
+    from sqlalchemy import inspect
+
+    from app.database.connection import init_engine
+
+    tables = set(inspect(init_engine()).get_table_names())
+    return "users" in tables and "alembic_version" not in tables
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    upgrade_head()
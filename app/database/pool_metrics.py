@@ -0,0 +1,204 @@
+# app/database/pool_metrics.py
+
+import logging
+import threading
+import time
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeout
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.core.config import settings
+
+logger = logging.getLogger("app.database.pool")
+
+# Upper bounds (ms) of the checkout-wait histogram buckets
+WAIT_BUCKETS_MS = (1, 5, 10, 50, 100, 500, 1000, 5000)
+
+
+class PoolMetrics:
+    """Counters for one connection pool, fed by pool events.
+
+    Everything here is updated in-process, so reading it (e.g. from /health)
+    never touches the database.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.engine = None
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.checkins = 0
+        self.connects = 0
+        self.invalidations = 0
+        self.timeouts = 0
+        self.wait_total_ms = 0.0
+        self.wait_max_ms = 0.0
+        self.wait_buckets = [0] * (len(WAIT_BUCKETS_MS) + 1)
+        self.last_error: str | None = None
+        self.last_error_at: float | None = None
+        self._last_alarm = 0.0
+
+    def incr(self, counter: str):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def record_wait(self, wait_ms: float, timed_out: bool = False):
+        with self._lock:
+            self.wait_total_ms += wait_ms
+            self.wait_max_ms = max(self.wait_max_ms, wait_ms)
+            for i, bound in enumerate(WAIT_BUCKETS_MS):
+                if wait_ms <= bound:
+                    self.wait_buckets[i] += 1
+                    break
+            else:
+                self.wait_buckets[-1] += 1
+            if timed_out:
+                self.timeouts += 1
+        if timed_out or wait_ms >= settings.DB_POOL_WAIT_ALARM_MS:
+            self._alarm(f"checkout waited {wait_ms:.0f}ms" + (" and timed out" if timed_out else ""))
+
+    def record_error(self, message: str):
+        with self._lock:
+            self.last_error = message
+            self.last_error_at = time.time()
+
+    def _alarm(self, reason: str):
+        # At most one log line per interval; the counters keep the full picture
+        now = time.monotonic()
+        if now - self._last_alarm < settings.DB_POOL_ALARM_INTERVAL_S:
+            return
+        self._last_alarm = now
+        logger.warning("Pool %s saturated: %s (%s)", self.name, reason, self.engine.pool.status() if self.engine else "-")
+
+    def health(self, error_window_s: float = 60) -> tuple[str, str]:
+        """("healthy" | "unhealthy", message) judged from the counters alone."""
+        gauges = self.gauges()
+        if self.last_error_at and time.time() - self.last_error_at < error_window_s:
+            return "unhealthy", self.last_error
+        if gauges.get("saturated"):
+            return "unhealthy", "Connection pool saturated"
+        return "healthy", "Connected" if self.connects else "No connections opened yet"
+
+    def gauges(self) -> dict:
+        pool = self.engine.pool if self.engine else None
+        if not isinstance(pool, QueuePool):
+            return {}
+        size = pool.size()
+        max_overflow = pool._max_overflow
+        checked_out = pool.checkedout()
+        return {
+            "size": size,
+            "max_overflow": max_overflow,
+            "checked_out": checked_out,
+            "checked_in": pool.checkedin(),
+            "overflow": max(pool.overflow(), 0),
+            "saturated": max_overflow >= 0 and checked_out >= size + max_overflow,
+        }
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                **self.gauges(),
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "connects": self.connects,
+                "invalidations": self.invalidations,
+                "timeouts": self.timeouts,
+                "wait_avg_ms": round(self.wait_total_ms / self.checkouts, 3) if self.checkouts else 0.0,
+                "wait_max_ms": round(self.wait_max_ms, 3),
+                "wait_histogram_ms": {
+                    **{f"le_{bound}": count for bound, count in zip(WAIT_BUCKETS_MS, self.wait_buckets)},
+                    "inf": self.wait_buckets[-1],
+                },
+                "last_error": self.last_error,
+                "last_error_at": self.last_error_at,
+            }
+
+
+pool_metrics: dict[str, PoolMetrics] = {}
+
+
+class _TimedCheckout:
+    """Mixin timing how long a checkout waits for a free connection."""
+
+    metrics: PoolMetrics | None = None
+
+    def _do_get(self):
+        t0 = time.perf_counter()
+        try:
+            conn = super()._do_get()
+        except PoolTimeout:
+            if self.metrics is not None:
+                self.metrics.record_wait((time.perf_counter() - t0) * 1000, timed_out=True)
+            raise
+        except Exception as e:
+            if self.metrics is not None:
+                self.metrics.record_error(str(e))
+            raise
+        if self.metrics is not None:
+            self.metrics.record_wait((time.perf_counter() - t0) * 1000)
+        return conn
+
+    def recreate(self):
+        # engine.dispose() swaps in a fresh pool; keep feeding the same metrics
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+class InstrumentedQueuePool(_TimedCheckout, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_TimedCheckout, AsyncAdaptedQueuePool):
+    pass
+
+
+def pool_options(url, async_: bool = False) -> dict:
+    """create_engine(...) keyword arguments for the configured pool."""
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        # In-memory SQLite lives in a single connection; keep the default pool
+        return {}
+    return {
+        "poolclass": InstrumentedAsyncQueuePool if async_ else InstrumentedQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+
+def instrument(name: str, engine) -> PoolMetrics:
+    """Attach pool/engine listeners and register the metrics under `name`."""
+    metrics = pool_metrics[name] = PoolMetrics(name)
+    pool = engine.pool
+    metrics.engine = engine
+    if isinstance(pool, _TimedCheckout):
+        pool.metrics = metrics
+
+    @event.listens_for(pool, "connect")
+    def on_connect(dbapi_conn, record):
+        metrics.incr("connects")
+
+    @event.listens_for(pool, "checkout")
+    def on_checkout(dbapi_conn, record, proxy):
+        metrics.incr("checkouts")
+
+    @event.listens_for(pool, "checkin")
+    def on_checkin(dbapi_conn, record):
+        metrics.incr("checkins")
+
+    @event.listens_for(pool, "invalidate")
+    def on_invalidate(dbapi_conn, record, exception):
+        metrics.incr("invalidations")
+        if exception is not None:
+            metrics.record_error(str(exception))
+
+    @event.listens_for(engine, "handle_error")
+    def on_error(context):
+        if context.is_disconnect:
+            metrics.record_error(str(context.original_exception))
+
+    return metrics
@@ -0,0 +1,54 @@
+# app/database/query_metrics.py
+
+import contextvars
+import time
+from dataclasses import dataclass
+
+from sqlalchemy import event
+
+
+@dataclass(slots=True)
+class QueryStats:
+    """SQL issued while handling one request."""
+    count: int = 0
+    total_ms: float = 0.0
+    slowest_ms: float = 0.0
+    slowest_statement: str | None = None
+
+
+# Set by app/core/request_metrics.RequestMetricsMiddleware for the duration of a
+# request. Threadpool endpoints and async-driver greenlets inherit the context.
+current_queries: contextvars.ContextVar[QueryStats | None] = contextvars.ContextVar("current_queries",
+                                                                                     default=None)
+
+
+def instrument_queries(engine):
+    """Attribute every statement run on `engine` (a sync Engine) to the current request.
+
+    Statements outside a request (scripts, startup) cost one ContextVar lookup.
+    """
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before(conn, cursor, statement, parameters, context, executemany):
+        if current_queries.get() is not None:
+            conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after(conn, cursor, statement, parameters, context, executemany):
+        stats = current_queries.get()
+        started = conn.info.get("query_started")
+        if stats is None or not started:
+            return
+        elapsed = (time.perf_counter() - started.pop()) * 1000
+        stats.count += 1
+        stats.total_ms += elapsed
+        if elapsed > stats.slowest_ms:
+            stats.slowest_ms = elapsed
+            stats.slowest_statement = statement
+
+    @event.listens_for(engine, "handle_error")
+    def on_error(context):
+        # after_cursor_execute never fires for a failed statement
+        started = context.connection.info.get("query_started") if context.connection is not None else None
+        if started:
+            started.pop()
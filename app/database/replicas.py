@@ -0,0 +1,227 @@
+# app/database/replicas.py
+#
+# Read replicas for read-only handlers (get_read_db / get_async_read_db in
+# app/database/connection.py). A ReadSession connects to a replica the first
+# time it runs a query, picked round-robin or by fewest checked-out
+# connections; a replica that fails to connect, or drops a connection, is
+# skipped for DB_REPLICA_RETRY_S and the session uses the primary instead.
+#
+# Read-your-writes: ReadYourWritesMiddleware remembers callers that just
+# wrote (by token in this worker, by cookie across workers) and their reads
+# go to the primary for DB_READ_YOUR_WRITES_S, which should exceed the
+# replicas' usual lag. Other callers may read slightly stale rows. Caches
+# that outlive the request must not be filled from them: a row read from a
+# lagging replica right after an invalidation would be cached again, so
+# they fill through primary_session (see app/utils/service_cache.py).
+
+import itertools
+import logging
+import threading
+import time
+from contextlib import contextmanager
+
+from sqlalchemy import event
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session
+from starlette.requests import Request
+
+from app.core.config import settings
+from app.utils.ttl_cache import TTLCache
+
+logger = logging.getLogger("app.database.replicas")
+
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+# Set on the browser after a write, so its next reads reach the primary on any worker
+STICKY_COOKIE = "db_read_primary"
+
+
+class Replica:
+    """One replica; `engine` is a sync Engine (an AsyncEngine's sync_engine on the async stack)."""
+
+    def __init__(self, name: str, engine):
+        self.name = name
+        self.engine = engine
+        self.down_until = 0.0
+        self.failures = 0
+        self.last_error: str | None = None
+        self.sessions = 0
+
+    @property
+    def up(self) -> bool:
+        return time.monotonic() >= self.down_until
+
+    def load(self) -> int:
+        pool = self.engine.pool
+        return pool.checkedout() if hasattr(pool, "checkedout") else 0
+
+
+class ReplicaSet:
+    """The replicas of one stack (sync or async) and their health."""
+
+    def __init__(self, selection: str):
+        if selection not in ("round_robin", "least_loaded"):
+            raise RuntimeError(f"Unknown DB_REPLICA_SELECTION {selection!r} (expected round_robin or least_loaded)")
+        self.replicas: list[Replica] = []
+        self.selection = selection
+        self._turn = itertools.count()
+        self._lock = threading.Lock()
+        self.fallbacks = 0
+
+    def add(self, name: str, engine):
+        replica = Replica(name, engine)
+        self.replicas.append(replica)
+
+        @event.listens_for(replica.engine, "handle_error")
+        def on_error(context):
+            # A replica that went away mid-query: this request fails, the next ones skip it
+            if context.is_disconnect:
+                self.mark_down(replica, context.original_exception)
+
+    def candidates(self) -> list[Replica]:
+        """Replicas that are up, in the order to try them."""
+        up = [replica for replica in self.replicas if replica.up]
+        if not up:
+            return up
+        # Rotate over the healthy ones only, so a down replica's turns are spread evenly
+        start = next(self._turn) % len(up)
+        ordered = up[start:] + up[:start]
+        if self.selection == "least_loaded":
+            # Stable sort: equally loaded replicas keep the round-robin order
+            ordered.sort(key=Replica.load)
+        return ordered
+
+    def mark_down(self, replica: Replica, error: BaseException):
+        with self._lock:
+            first = replica.up
+            replica.down_until = time.monotonic() + settings.DB_REPLICA_RETRY_S
+            replica.failures += 1
+            # First line only: SQLAlchemy appends a "Background on this error" link
+            message = str(error).partition("\n")[0]
+            replica.last_error = f"{type(error).__name__}: {message}"[:500]
+        if first:
+            logger.warning("Replica %s unavailable, skipping it for %ss: %s", replica.name,
+                           settings.DB_REPLICA_RETRY_S, replica.last_error)
+
+    def connect(self):
+        """A connection to the first replica that accepts one, or None (use the primary)."""
+        for replica in self.candidates():
+            try:
+                conn = replica.engine.connect()
+            except (DBAPIError, OSError) as e:
+                self.mark_down(replica, e)
+                continue
+            replica.sessions += 1
+            return conn
+        with self._lock:
+            self.fallbacks += 1
+        return None
+
+    def stats(self) -> dict:
+        return {
+            "selection": self.selection,
+            "fallbacks_to_primary": self.fallbacks,
+            "replicas": {
+                replica.name: {
+                    "up": replica.up,
+                    "retry_in_s": round(max(replica.down_until - time.monotonic(), 0.0), 1),
+                    "sessions": replica.sessions,
+                    "checked_out": replica.load(),
+                    "failures": replica.failures,
+                    "last_error": replica.last_error,
+                }
+                for replica in self.replicas
+            },
+        }
+
+
+class ReadSession(Session):
+    """Session whose queries run on a replica, or on its own bind (the primary) if none is up.
+
+    For read-only handlers: anything it flushes would go to the replica too.
+    """
+
+    def __init__(self, *args, replicas: ReplicaSet, **kw):
+        super().__init__(*args, **kw)
+        self.replicas = replicas
+        self._replica_conn = None
+        self._picked = False
+
+    def get_bind(self, mapper=None, **kw):
+        if not self._picked:
+            self._picked = True
+            self._replica_conn = self.replicas.connect()
+        return self._replica_conn if self._replica_conn is not None else super().get_bind(mapper, **kw)
+
+    def close(self):
+        super().close()
+        if self._replica_conn is not None:
+            self._replica_conn.close()
+            self._replica_conn = None
+        self._picked = False
+
+
+@contextmanager
+def primary_session(db: Session):
+    """`db` itself, or a short session on its primary if `db` is a ReadSession."""
+    if not isinstance(db, ReadSession):
+        yield db
+        return
+    with Session(bind=db.bind) as primary:
+        yield primary
+
+
+# Read-your-writes --------------------------------------------------------
+
+# Token signatures of callers that wrote recently, in this worker
+recent_writers = TTLCache(maxsize=100_000, ttl=settings.DB_READ_YOUR_WRITES_S)
+
+
+def caller_key(request: Request) -> str | None:
+    auth = request.headers.get("authorization", "")
+    token = auth[7:] if auth[:7].lower() == "bearer " else request.cookies.get("access_token")
+    # The JWT signature, as in app/core/principal.token_signature
+    return token.rsplit(".", 1)[-1] if token else None
+
+
+def use_replica(request: Request) -> bool:
+    """For get_read_db: False if the caller wrote recently and must read its own writes.
+
+    Also marks the request read-only, so a POST served this way (e.g. a
+    batch lookup) does not count as a write.
+    """
+    request.state.read_only = True
+    return not getattr(request.state, "read_primary", False)
+
+
+class ReadYourWritesMiddleware:
+    """ASGI middleware: after a successful write, send the caller's reads to the primary for a while.
+
+    Installed only when replicas are configured and DB_READ_YOUR_WRITES_S > 0.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        request = Request(scope)
+        if scope["method"] in SAFE_METHODS:
+            key = caller_key(request)
+            if STICKY_COOKIE in request.cookies or (key is not None and recent_writers.get(key)):
+                scope.setdefault("state", {})["read_primary"] = True
+            return await self.app(scope, receive, send)
+
+        async def send_marking_writer(message):
+            if (message["type"] == "http.response.start" and message["status"] < 400
+                    and not scope.get("state", {}).get("read_only")):
+                key = caller_key(request)
+                if key is not None:
+                    recent_writers.set(key, True)
+                cookie = (f"{STICKY_COOKIE}=1; Max-Age={max(int(settings.DB_READ_YOUR_WRITES_S), 1)}; "
+                          "Path=/; HttpOnly; SameSite=Lax")
+                message["headers"] = [*message.get("headers", ()), (b"set-cookie", cookie.encode())]
+            await send(message)
+
+        await self.app(scope, receive, send_marking_writer)
@@ -1,10 +1,5 @@
-from sqlalchemy.orm import Session
-from app.database.connection import SessionLocal
+from app.database.connection import SessionLocal, get_db, get_read_db  # noqa: F401
 
 # Dependency علشان نقدر نستخدم DB في الـ routers
-def get_db() -> Session:
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+# Re-exported (not redefined) so FastAPI caches one session per request even when
+# get_current_user and the router import get_db from different modules.
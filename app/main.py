@@ -1,16 +1,26 @@
 # app/main.py
 
+from contextlib import asynccontextmanager
 from datetime import datetime
 from fastapi import FastAPI, Request, Depends
-from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from app.database.connection import Base, engine, SessionLocal
+from app.database.connection import (DATABASE_REPLICA_URLS, async_replicas, dispose_async_engine, dispose_engine,
+                                     get_db, init_engine, replicas)
+from app.database.replicas import ReadYourWritesMiddleware
+from app.database.pool_metrics import pool_metrics
 from fastapi.openapi.utils import get_openapi
-from fastapi.responses import HTMLResponse
-from sqlalchemy import text
+from fastapi.responses import HTMLResponse, PlainTextResponse
+from sqlalchemy.orm import Session
 
 from app.core.jwt_bearer import JWTBearer
 from app.core.deps import get_current_user
+from app.core.hash import hash_pool
+from app.core.config import settings
+from app.core.openapi_cache import load_schema
+from app.core.request_metrics import RequestMetricsMiddleware, render_prometheus, request_metrics
+from app.utils.live_hub import live_hub
+from app.utils.outbox import outbox_backlog
+from app.utils.static_assets import STATIC_DIR, PrecompressedStaticFiles, static_url
 
 
 # Side-effect imports
@@ -20,32 +30,60 @@ import app.models.availability  # noqa: F401
 import app.models.booking       # noqa: F401
 import app.models.review        # noqa: F401
 import app.models.favorite      # noqa: F401
+import app.models.rating        # noqa: F401
+import app.models.outbox        # noqa: F401
 
 # App version
 APP_VERSION = "1.0.0"
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Schema changes go through Alembic (migrations/); nothing here touches the
+    # database unless DB_MIGRATE_ON_STARTUP asks for it.
+    init_engine()
+    if settings.DB_MIGRATE_ON_STARTUP:
+        from app.database.migrate import upgrade_head
+        upgrade_head()
+    await live_hub.start()
+    yield
+    await live_hub.stop()
+    hash_pool.shutdown()
+    dispose_engine()
+    await dispose_async_engine()
+
+app = FastAPI(lifespan=lifespan)
+
+if settings.REQUEST_METRICS_ENABLED:
+    app.add_middleware(RequestMetricsMiddleware)
+
+if DATABASE_REPLICA_URLS and settings.DB_READ_YOUR_WRITES_S > 0:
+    app.add_middleware(ReadYourWritesMiddleware)
 
 # Static and templates
-app.mount("/static", StaticFiles(directory="app/static"), name="static")
+app.mount("/static", PrecompressedStaticFiles(directory=STATIC_DIR), name="static")
 templates = Jinja2Templates(directory="app/templates")
+templates.env.globals["static_url"] = static_url
 
 
 from app.routers import auth
 from app.routers.users import router as users_router
 from app.routers.services import router as services_router
 from app.routers.availability import router as availability_router
-from app.routers.Booking import router as booking_router
 from app.routers.review import router as reviews_router
-from app.routers.pages import router as pages_router
-from app.routers.favorites import router as favorites_router
+from app.routers.live import router as live_router
+from app.routers.pages import cached_page, router as pages_router
 
+# Migrated routers: pick the sync or async database stack
+if settings.DB_ASYNC:
+    from app.routers.bookings_async import router as booking_router
+    from app.routers.favorites_async import router as favorites_router
+else:
+    from app.routers.Booking import router as booking_router
+    from app.routers.favorites import router as favorites_router
 
-Base.metadata.create_all(bind=engine)
 
-def custom_openapi():
-    if app.openapi_schema:
-        return app.openapi_schema
+def build_openapi():
+    """Walk the routes and build the document (scripts/build_openapi.py caches it)."""
     openapi_schema = get_openapi(
         title="Booking Platform",
         version="1.0.0",
@@ -66,11 +104,17 @@ def custom_openapi():
     for path in openapi_schema["paths"].values():
         for method in path.values():
             method.setdefault("security", [{"OAuth2PasswordBearer": []}])
-    app.openapi_schema = openapi_schema
+    return openapi_schema
+
+def custom_openapi():
+    if not app.openapi_schema:
+        app.openapi_schema = load_schema(settings.OPENAPI_CACHE_PATH) or build_openapi()
     return app.openapi_schema
 
 app.openapi = custom_openapi
 
+
+
 # Include routers
 app.include_router(auth.router)
 app.include_router(users_router)
@@ -79,12 +123,13 @@ app.include_router(availability_router)
 app.include_router(booking_router)
 app.include_router(reviews_router)
 app.include_router(favorites_router)
+app.include_router(live_router)
 app.include_router(pages_router)
 
 # Root page
 @app.get("/")
 def root(request: Request):
-    return templates.TemplateResponse("index.html", {"request": request})
+    return cached_page(request, "index", "index.html", public=True)
 
 @app.get("/login", response_class=HTMLResponse)
 def login_page(request: Request):
@@ -100,25 +145,53 @@ def health_check():
     """
     Health check endpoint for monitoring and CI/CD.
     Returns app status, database connection status, version, and timestamp.
+    Database state comes from the pool counters, so probes add no DB load.
     """
-    db_status = "healthy"
-    db_message = "Connected"
-    
-    try:
-        db = SessionLocal()
-        db.execute(text("SELECT 1"))
-        db.close()
-    except Exception as e:
-        db_status = "unhealthy"
-        db_message = str(e)
-    
+    db_status, db_message = pool_metrics["sync"].health()
+
     return {
         "status": "healthy" if db_status == "healthy" else "degraded",
         "version": APP_VERSION,
         "timestamp": datetime.utcnow().isoformat(),
         "database": {
             "status": db_status,
-            "message": db_message
+            "message": db_message,
+            "pool": pool_metrics["sync"].gauges(),
         }
     }
 
+
+@app.get("/health/pool", tags=["health"])
+def pool_stats():
+    """Checkout wait times, checked-out/overflow counts and errors per pool."""
+    return {name: metrics.snapshot() for name, metrics in pool_metrics.items()}
+
+
+@app.get("/health/requests", tags=["health"])
+def request_stats():
+    """Per-route request counts, average latency and SQL, plus recent percentiles (this worker)."""
+    return request_metrics.snapshot()
+
+
+@app.get("/health/outbox", tags=["health"])
+def outbox_stats(db: Session = Depends(get_db)):
+    """Outbox backlog: pending and failed events and the oldest pending event's age (all workers)."""
+    return outbox_backlog(db)
+
+
+@app.get("/health/live", tags=["health"])
+def live_stats():
+    """Live stream subscribers and published/delivered/lagged event counts (this worker)."""
+    return live_hub.stats()
+
+
+@app.get("/health/replicas", tags=["health"])
+def replica_stats():
+    """Read replicas: up/down, sessions served, failures and fallbacks to the primary (this worker)."""
+    return {"sync": replicas.stats(), "async": async_replicas.stats()}
+
+
+@app.get("/metrics", tags=["health"], response_class=PlainTextResponse)
+def metrics():
+    """Request, SQL and pool metrics in the Prometheus text format (this worker)."""
+    return PlainTextResponse(render_prometheus(pool_metrics), media_type="text/plain; version=0.0.4")
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, ForeignKey, Time, DateTime
+from sqlalchemy import Column, Integer, ForeignKey, Time, DateTime, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.database.connection import Base
@@ -14,6 +14,11 @@ class AvailabilitySlot(Base):
     end_time = Column(Time, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
+    __table_args__ = (
+        # Per-freelancer reads, the same-day overlap check and the (day, start) ordering
+        Index("ix_availability_slots_freelancer_day", "freelancer_id", "day_of_week", "start_time"),
+    )
+
     freelancer = relationship("User", backref="availability_slots")
 
 
@@ -1,4 +1,5 @@
-from sqlalchemy import Column, Integer, ForeignKey, DateTime, Enum
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, Enum, Index, DDL, event
+from sqlalchemy.dialects.postgresql import ExcludeConstraint
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.database.connection import Base
@@ -28,9 +29,33 @@ class Booking(Base):
     )
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
-   
+    __table_args__ = (
+        Index("ix_bookings_freelancer_start", "freelancer_id", "start_at"),
+        # Keyset pagination of GET /bookings/ (app/utils/pagination.py)
+        Index("ix_bookings_client_created", "client_id", "created_at", "id"),
+        Index("ix_bookings_freelancer_created", "freelancer_id", "created_at", "id"),
+        Index("ix_bookings_created", "created_at", "id"),
+        # Cascade from services
+        Index("ix_bookings_service", "service_id"),
+        # Database-level guarantee against double-booking across workers (Postgres only)
+        ExcludeConstraint(
+            (freelancer_id, "="),
+            (func.tstzrange(start_at, end_at, "[)"), "&&"),
+            name="bookings_no_overlap",
+            using="gist",
+            where="status IN ('pending', 'confirmed')",
+        ).ddl_if(dialect="postgresql"),
+    )
+
     client     = relationship("User", foreign_keys=[client_id])
     freelancer = relationship("User", foreign_keys=[freelancer_id])
     service    = relationship("Service")
-    review = relationship("Review", back_populates="booking", uselist=False)  # Lazy import for Review to avoid circular dependency
+    review = relationship("Review", back_populates="booking", uselist=False, cascade="all, delete-orphan")  # Lazy import for Review to avoid circular dependency
+
 
+# `freelancer_id WITH =` inside a GiST exclusion constraint needs btree_gist
+event.listen(
+    Booking.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS btree_gist").execute_if(dialect="postgresql"),
+)
@@ -1,8 +1,8 @@
 # app/models/favorite.py
 
-from sqlalchemy import Column, Integer, ForeignKey, DateTime, UniqueConstraint
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, UniqueConstraint, Index
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import backref, relationship
 from app.database.connection import Base
 
 
@@ -17,7 +17,11 @@ class Favorite(Base):
     # Ensure a user can only favorite a service once
     __table_args__ = (
         UniqueConstraint('user_id', 'service_id', name='unique_user_service_favorite'),
+        Index('ix_favorites_user_created', 'user_id', 'created_at', 'id'),
+        # Service.favorited_by and the cascade from services
+        Index('ix_favorites_service', 'service_id'),
     )
 
     user = relationship("User", backref="favorites")
-    service = relationship("Service", backref="favorited_by")
+    # Deleting a service drops its favorites instead of nulling service_id
+    service = relationship("Service", backref=backref("favorited_by", cascade="all, delete-orphan"))
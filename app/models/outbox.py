@@ -0,0 +1,39 @@
+from sqlalchemy import JSON, Column, DateTime, Index, Integer, String, Text, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.sql import func
+from app.database.connection import Base
+
+
+class OutboxEvent(Base):
+    """A side effect to run after a commit, written in the same transaction (app/utils/outbox.py).
+
+    Pending: processed_at and failed_at are both NULL. The worker retries a
+    failing event at available_at until OUTBOX_MAX_ATTEMPTS, then sets failed_at.
+    """
+    __tablename__ = "outbox_events"
+
+    id = Column(Integer, primary_key=True)
+    topic = Column(String, nullable=False)
+    aggregate_id = Column(Integer, nullable=True)
+    payload = Column(JSON().with_variant(JSONB(), "postgresql"), nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    available_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    attempts = Column(Integer, nullable=False, default=0, server_default="0")
+    last_error = Column(Text, nullable=True)
+    processed_at = Column(DateTime(timezone=True), nullable=True)
+    failed_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        # The worker's claim query: due pending events, oldest first
+        Index("ix_outbox_events_pending", "available_at", "id",
+              postgresql_where=text("processed_at IS NULL AND failed_at IS NULL"),
+              sqlite_where=text("processed_at IS NULL AND failed_at IS NULL")),
+        # Retention purge of processed events
+        Index("ix_outbox_events_processed", "processed_at",
+              postgresql_where=text("processed_at IS NOT NULL"),
+              sqlite_where=text("processed_at IS NOT NULL")),
+        # Dead events, counted by outbox_backlog()
+        Index("ix_outbox_events_failed", "failed_at",
+              postgresql_where=text("failed_at IS NOT NULL"),
+              sqlite_where=text("failed_at IS NOT NULL")),
+    )
@@ -0,0 +1,36 @@
+from sqlalchemy import Column, Integer, ForeignKey, DateTime
+from sqlalchemy.sql import func
+from app.database.connection import Base
+
+
+class RatingSummaryMixin:
+    """Running review totals; kept in step with `reviews` by app/utils/ratings.py."""
+
+    count = Column(Integer, nullable=False, default=0, server_default="0")
+    total = Column(Integer, nullable=False, default=0, server_default="0")
+    stars_1 = Column(Integer, nullable=False, default=0, server_default="0")
+    stars_2 = Column(Integer, nullable=False, default=0, server_default="0")
+    stars_3 = Column(Integer, nullable=False, default=0, server_default="0")
+    stars_4 = Column(Integer, nullable=False, default=0, server_default="0")
+    stars_5 = Column(Integer, nullable=False, default=0, server_default="0")
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    @property
+    def average(self) -> float | None:
+        return round(self.total / self.count, 2) if self.count else None
+
+    @property
+    def histogram(self) -> dict[int, int]:
+        return {stars: getattr(self, f"stars_{stars}") for stars in range(1, 6)}
+
+
+class ServiceRating(RatingSummaryMixin, Base):
+    __tablename__ = "service_ratings"
+
+    service_id = Column(Integer, ForeignKey("services.id", ondelete="CASCADE"), primary_key=True)
+
+
+class FreelancerRating(RatingSummaryMixin, Base):
+    __tablename__ = "freelancer_ratings"
+
+    freelancer_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, ForeignKey, DateTime, Text
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, Text, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.database.connection import Base
@@ -12,5 +12,11 @@ class Review(Base):
     rating = Column(Integer, nullable=False)
     comment = Column(Text, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    
+
+    __table_args__ = (
+        Index("ix_reviews_created", "created_at", "id"),
+        # Booking.review and the cascade from bookings
+        Index("ix_reviews_booking", "booking_id"),
+    )
+
     booking = relationship("Booking", back_populates="review")
@@ -1,9 +1,24 @@
-from sqlalchemy import Column, Integer, String, Float, ForeignKey, DateTime, Text
+from sqlalchemy import Column, Integer, String, Float, ForeignKey, DateTime, Text, Index, literal_column
 from sqlalchemy.sql import func
+import sqlalchemy.dialects.postgresql  # noqa: F401  registers the to_tsvector()/ts_rank() constructs
 from sqlalchemy.orm import relationship
 from app.database.connection import Base
 from sqlalchemy import Enum
 from app.core.enums import UserRole 
+from app.models.rating import ServiceRating  # noqa: F401  target of Service.rating_summary
+
+
+# Text search configuration, inlined so queries match the expression index
+SEARCH_CONFIG = literal_column("'english'::regconfig")
+
+
+def search_document(title=None, description=None):
+    """Weighted tsvector of a service: title ranks above description (Postgres only)."""
+    title = Service.title if title is None else title
+    description = Service.description if description is None else description
+    return func.setweight(func.to_tsvector(SEARCH_CONFIG, title), literal_column("'A'")).op("||")(
+        func.setweight(func.to_tsvector(SEARCH_CONFIG, description), literal_column("'B'"))
+    )
 
 
 class Service(Base):
@@ -18,5 +33,25 @@ class Service(Base):
     created_by_role = Column(Enum(UserRole, name="userrole_enum"), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
+    __table_args__ = (
+        # Catalog search filters and sorts (app/utils/catalog_search.py)
+        Index("ix_services_price", "price", "id"),
+        Index("ix_services_created", "created_at", "id"),
+        # Freelancer filter, newest first (also serves plain freelancer_id lookups)
+        Index("ix_services_freelancer_created", "freelancer_id", "created_at", "id"),
+        Index("ix_services_search", search_document(title, description), postgresql_using="gin")
+        .ddl_if(dialect="postgresql"),
+    )
+
     freelancer = relationship("User", back_populates= "services")
-    
+    # One row per rated service; joined so listings get ratings without extra queries
+    rating_summary = relationship("ServiceRating", uselist=False, lazy="joined", viewonly=True)
+
+    @property
+    def rating_count(self) -> int:
+        return self.rating_summary.count if self.rating_summary else 0
+
+    @property
+    def rating_avg(self) -> float | None:
+        return self.rating_summary.average if self.rating_summary else None
+
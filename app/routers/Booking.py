@@ -1,19 +1,105 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from collections import defaultdict
+
+from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
-from app.database.connection import get_db
+from app.database.connection import get_db, get_read_db
 from app.models import booking as models, service as service_models
-from app.schemas.booking import BookingCreate, BookingOut
+from app.schemas.booking import (
+    BatchItemStatus, BookingBatchCreate, BookingBatchOut, BookingCreate, BookingOut, BookingPage,
+)
+from app.core.config import settings
 from app.core.deps import get_current_user
 from app.models.user import User
-from datetime import timedelta
+from datetime import datetime, timedelta
 from app.models.booking import Booking, BookingStatus 
 from app.core.jwt_bearer import jwt_bearer
+from app.utils.booking_index import (
+    ACTIVE_STATUSES, FreelancerCalendar, booking_index, has_db_conflict, to_epoch,
+)
+from app.utils.calendar_cache import calendar_cache
+from app.utils.fast_json import fast_page, schema_columns
+from app.utils.live_hub import publish_booking
+from app.utils.outbox import (
+    BOOKING_CREATED, BOOKING_DELETED, BOOKING_STATUS_CHANGED, booking_event, booking_fields, enqueue,
+)
+from app.utils.pagination import PageParams, keyset, page_result
+from app.utils.ratings import apply_review_change
+from app.utils.service_cache import invalidate_service
 
 router = APIRouter(
     prefix= "/bookings",
     tags=["Bookings"]
 )
 
+# Shared with app/routers/bookings_async.py
+status_permissions_map = {
+    "canceled": lambda user, b: user.role == "client" and b.client_id == user.id,
+    "confirmed": lambda user, b: user.role == "freelancer" and b.freelancer_id == user.id,
+    "completed": lambda user, b: user.role in {"admin", "freelancer"},
+}
+
+delete_permissions_map = {
+    "client": lambda user, b: b.client_id == user.id,
+    "freelancer": lambda user, b: b.freelancer_id == user.id,
+    "admin": lambda user, b: True,
+}
+
+# Postgres SQLSTATE for exclusion_violation (bookings_no_overlap constraint)
+EXCLUSION_VIOLATION = "23P01"
+
+def is_exclusion_violation(e: IntegrityError) -> bool:
+    # psycopg2 exposes .pgcode, asyncpg exposes .sqlstate
+    return EXCLUSION_VIOLATION in (getattr(e.orig, "pgcode", None), getattr(e.orig, "sqlstate", None))
+
+def assert_slot_free(db: Session, cal, freelancer_id: int, start_at, end_at, ignore_id: int | None = None):
+    if cal.find_conflict(to_epoch(start_at), to_epoch(end_at), ignore_id) is None:
+        return
+    # The in-process index can be stale if another worker canceled the booking
+    if has_db_conflict(db, freelancer_id, start_at, end_at, ignore_id):
+        raise HTTPException(status_code=409, detail="Freelancer already has a booking at this time")
+    booking_index.reload(db, freelancer_id, cal)
+
+def commit_booking(db: Session, freelancer_id: int):
+    try:
+        db.commit()
+    except IntegrityError as e:
+        db.rollback()
+        if is_exclusion_violation(e):
+            # Another worker won the race; our calendar is missing its booking
+            booking_index.invalidate(freelancer_id)
+            raise HTTPException(status_code=409, detail="Freelancer already has a booking at this time")
+        raise
+
+def apply_status(db: Session, booking: Booking, status_enum: BookingStatus) -> Booking:
+    booking_id, freelancer_id = booking.id, booking.freelancer_id
+    start_at, end_at = booking.start_at, booking.end_at
+    was_active = booking.status in ACTIVE_STATUSES
+    is_active = status_enum in ACTIVE_STATUSES
+    with booking_index.locked(db, freelancer_id) as cal:
+        # Re-activating a canceled/completed booking must not create an overlap
+        if is_active and not was_active:
+            assert_slot_free(db, cal, freelancer_id, start_at, end_at, ignore_id=booking_id)
+
+        previous_status = booking.status
+        booking.status = status_enum
+        fields = booking_fields(booking)
+        if status_enum != previous_status:
+            enqueue(db, booking_event(BOOKING_STATUS_CHANGED, booking_id, **fields, previous_status=previous_status))
+        commit_booking(db, freelancer_id)
+        # Don't touch expired attributes while holding the lock: that needs a new pooled connection
+        if is_active:
+            cal.add(booking_id, to_epoch(start_at), to_epoch(end_at))
+        else:
+            cal.remove(booking_id)
+    if is_active != was_active:
+        calendar_cache.apply_booking(freelancer_id, start_at, end_at, 1 if is_active else -1)
+    if status_enum != previous_status:
+        publish_booking(BOOKING_STATUS_CHANGED, booking_id, **fields, previous_status=previous_status)
+    db.refresh(booking)
+    return booking
+
 @router.post("/", response_model=BookingOut, status_code=status.HTTP_201_CREATED)
 def create_booking(booking_data: BookingCreate, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
     if current_user.role != "client":
@@ -27,37 +113,195 @@ def create_booking(booking_data: BookingCreate, db: Session = Depends(get_db), c
     # Calculate end_at from duration
     end_time = booking_data.start_at + timedelta(minutes=service.duration)
 
-    new_booking = models.Booking(
-    client_id=current_user.id,
-    freelancer_id=service.freelancer_id,
-    service_id=booking_data.service_id,
-    start_at=booking_data.start_at,
-    end_at=end_time,
-    status=BookingStatus.pending  
-)
+    with booking_index.locked(db, service.freelancer_id) as cal:
+        assert_slot_free(db, cal, service.freelancer_id, booking_data.start_at, end_time)
 
-    db.add(new_booking)
-    db.commit()
+        new_booking = models.Booking(
+            client_id=current_user.id,
+            freelancer_id=service.freelancer_id,
+            service_id=booking_data.service_id,
+            start_at=booking_data.start_at,
+            end_at=end_time,
+            status=BookingStatus.pending
+        )
+
+        db.add(new_booking)
+        db.flush()
+        booking_id = new_booking.id
+        fields = booking_fields(new_booking)
+        enqueue(db, booking_event(BOOKING_CREATED, booking_id, **fields))
+        commit_booking(db, service.freelancer_id)
+        cal.add(booking_id, to_epoch(booking_data.start_at), to_epoch(end_time))
+    calendar_cache.apply_booking(service.freelancer_id, booking_data.start_at, end_time, 1)
+    publish_booking(BOOKING_CREATED, booking_id, **fields)
     db.refresh(new_booking)
     return new_booking
 
+# Upper bound on items per POST /bookings/batch
+MAX_BATCH_ITEMS = 500
+
+def batch_services_query(service_ids):
+    Service = service_models.Service
+    return select(Service.id, Service.freelancer_id, Service.duration).where(Service.id.in_(set(service_ids)))
+
+def batch_window_query(freelancer_ids, start_at, end_at):
+    """Active bookings of these freelancers that touch [start_at, end_at)."""
+    return select(Booking.freelancer_id, Booking.start_at, Booking.end_at).where(
+        Booking.freelancer_id.in_(freelancer_ids),
+        Booking.status.in_(ACTIVE_STATUSES),
+        Booking.start_at < end_at,
+        Booking.end_at > start_at,
+    )
+
+def plan_batch(client_id: int, items, services: dict, existing_rows) -> tuple[list[dict], list[tuple[int, dict]]]:
+    """Per-item results plus (index, values) of the rows to insert, in request order.
+
+    Items are checked against the existing bookings and against earlier
+    accepted items of the same batch; later items lose ties.
+    """
+    taken: dict[int, FreelancerCalendar] = defaultdict(FreelancerCalendar)
+    for pseudo_id, (freelancer_id, start_at, end_at) in enumerate(existing_rows, start=1):
+        taken[freelancer_id].add(-pseudo_id, to_epoch(start_at), to_epoch(end_at))
+
+    results, rows = [], []
+    for index, item in enumerate(items):
+        service = services.get(item.service_id)
+        if service is None:
+            results.append({"index": index, "status": BatchItemStatus.not_found, "detail": "Service not found"})
+            continue
+        freelancer_id, duration = service
+        end_at = item.start_at + timedelta(minutes=duration)
+        cal = taken[freelancer_id]
+        start, end = to_epoch(item.start_at), to_epoch(end_at)
+        if cal.find_conflict(start, end) is not None:
+            results.append({"index": index, "status": BatchItemStatus.conflict,
+                            "detail": "Freelancer already has a booking at this time"})
+            continue
+        cal.add(index, start, end)
+        results.append({"index": index, "status": BatchItemStatus.created})
+        rows.append((index, {
+            "client_id": client_id,
+            "freelancer_id": freelancer_id,
+            "service_id": item.service_id,
+            "start_at": item.start_at,
+            "end_at": end_at,
+            "status": BookingStatus.pending,
+        }))
+    return results, rows
+
+def batch_insert_stmt():
+    # One multi-row INSERT; sort_by_parameter_order keeps RETURNING aligned with `rows`
+    return insert(Booking).returning(Booking.id, Booking.created_at, sort_by_parameter_order=True)
+
+def batch_window(items, services: dict) -> tuple[datetime, datetime] | None:
+    spans = [(item.start_at, item.start_at + timedelta(minutes=services[item.service_id][1]))
+             for item in items if item.service_id in services]
+    if not spans:
+        return None
+    return min(start for start, _ in spans), max(end for _, end in spans)
+
+def batch_events(rows: list[tuple[int, dict]], returned) -> list:
+    return [booking_event(BOOKING_CREATED, booking_id, **values)
+            for (_, values), (booking_id, _) in zip(rows, returned)]
+
+def publish_batch(rows: list[tuple[int, dict]], returned):
+    for (_, values), (booking_id, _) in zip(rows, returned):
+        publish_booking(BOOKING_CREATED, booking_id, **values)
+
+def finish_batch(results: list[dict], rows: list[tuple[int, dict]], returned) -> dict:
+    for (index, values), (booking_id, created_at) in zip(rows, returned):
+        results[index]["booking"] = {**values, "id": booking_id, "created_at": created_at}
+    return {"created": len(rows), "results": results}
+
+def check_batch_request(batch: BookingBatchCreate, current_user):
+    if current_user.role != "client":
+        raise HTTPException(status_code=403, detail="Only clients can create bookings")
+    if len(batch.items) > MAX_BATCH_ITEMS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BATCH_ITEMS} bookings per batch")
+
+@router.post("/batch", response_model=BookingBatchOut)
+def create_bookings_batch(batch: BookingBatchCreate, db: Session = Depends(get_db),
+                          current_user: User = Depends(get_current_user)):
+    """Create many bookings in one transaction; each item reports created / conflict / not_found."""
+    check_batch_request(batch, current_user)
+    services = {sid: (fid, duration) for sid, fid, duration in db.execute(
+        batch_services_query(item.service_id for item in batch.items))} if batch.items else {}
+    freelancer_ids = sorted({fid for fid, _ in services.values()})
+
+    # A concurrent writer on another worker can still trip the exclusion
+    # constraint; replan once against the database before giving up.
+    for attempt in range(2):
+        with booking_index.locked_many(db, freelancer_ids) as calendars:
+            window = batch_window(batch.items, services)
+            existing = db.execute(batch_window_query(freelancer_ids, *window)).all() if window else []
+            results, rows = plan_batch(current_user.id, batch.items, services, existing)
+            returned = db.execute(batch_insert_stmt(), [values for _, values in rows]).all() if rows else []
+            enqueue(db, *batch_events(rows, returned))
+            try:
+                db.commit()
+            except IntegrityError as e:
+                db.rollback()
+                if not is_exclusion_violation(e):
+                    raise
+                for fid in freelancer_ids:
+                    booking_index.invalidate(fid)
+                if attempt:
+                    raise HTTPException(status_code=409, detail="Bookings changed concurrently, please retry")
+                continue
+            for (_, values), (booking_id, _) in zip(rows, returned):
+                calendars[values["freelancer_id"]].add(
+                    booking_id, to_epoch(values["start_at"]), to_epoch(values["end_at"]))
+        break
+
+    for _, values in rows:
+        calendar_cache.apply_booking(values["freelancer_id"], values["start_at"], values["end_at"], 1)
+    publish_batch(rows, returned)
+    return finish_batch(results, rows, returned)
+
 ##GET My Bookings
 
-@router.get("/" , response_model=list[BookingOut])
+# BookingOut as Core rows, for FAST_JSON_LISTS
+BOOKING_OUT_COLUMNS = schema_columns(BookingOut, Booking)
+
+def bookings_listing(current_user, booking_status: BookingStatus | None, freelancer_id: int | None,
+                     start_from: datetime | None, start_to: datetime | None):
+    """Filtered select() behind GET /bookings/, shared with the async router."""
+    scope_map = {
+        "client": lambda: select(Booking).where(Booking.client_id == current_user.id),
+        "freelancer": lambda: select(Booking).where(Booking.freelancer_id == current_user.id),
+        "admin": lambda: select(Booking),
+    }
+
+    if current_user.role not in scope_map:
+        raise HTTPException(status_code=403, detail="Not authorized to view bookings")
+
+    stmt = scope_map[current_user.role]()
+    if booking_status is not None:
+        stmt = stmt.where(Booking.status == booking_status)
+    if freelancer_id is not None:
+        stmt = stmt.where(Booking.freelancer_id == freelancer_id)
+    if start_from is not None:
+        stmt = stmt.where(Booking.start_at >= start_from)
+    if start_to is not None:
+        stmt = stmt.where(Booking.start_at < start_to)
+    return stmt
+
+@router.get("/" , response_model=BookingPage)
 def get_my_bookings(
-    db:Session = Depends(get_db),
+    booking_status: BookingStatus | None = Query(None, alias="status"),
+    freelancer_id: int | None = None,
+    start_from: datetime | None = None,
+    start_to: datetime | None = None,
+    page: PageParams = Depends(),
+    db:Session = Depends(get_read_db),
     current_user:User = Depends(get_current_user)
 ):
-    query_map = {
-        "client": lambda: db.query(Booking).filter(Booking.client_id == current_user.id).all(),
-        "freelancer": lambda: db.query(Booking).filter(Booking.freelancer_id == current_user.id).all(),
-        "admin": lambda: db.query(Booking).all()
-    }
-
-    if current_user.role not in query_map:
-         raise HTTPException(status_code=403, detail="Not authorized to view bookings")
-    
-    return query_map[current_user.role]()
+    stmt = bookings_listing(current_user, booking_status, freelancer_id, start_from, start_to)
+    if settings.FAST_JSON_LISTS:
+        stmt = keyset(stmt.with_only_columns(*BOOKING_OUT_COLUMNS), Booking.created_at, Booking.id, page)
+        return fast_page(db.execute(stmt).all(), page)
+    rows = db.scalars(keyset(stmt, Booking.created_at, Booking.id, page)).all()
+    return page_result(rows, page)
     
 
     ## put booking status
@@ -78,21 +322,13 @@ def update_booking_status(
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid status")
 
-    
-    status_permissions_map = {
-        "canceled": lambda user, b: user.role == "client" and b.client_id == user.id,
-        "confirmed": lambda user, b: user.role == "freelancer" and b.freelancer_id == user.id,
-        "completed": lambda user, b: user.role in {"admin", "freelancer"},
-    }
 
     check_permission = status_permissions_map.get(new_status)
     if check_permission and not check_permission(current_user, booking):
         raise HTTPException(status_code=403, detail=f"You are not allowed to mark this booking as {new_status}")
 
-    booking.status = status_enum
-    db.commit()
-    db.refresh(booking)
-    return booking
+    return apply_status(db, booking, status_enum)
+
 
 
 ## delete with query map
@@ -107,18 +343,25 @@ def delete_booking(
     if not booking:
         raise HTTPException(status_code=404, detail="Booking not found")
 
-    delete_permissions_map = {
-        "client": lambda user, b: b.client_id == user.id,
-        "freelancer": lambda user, b: b.freelancer_id == user.id,
-        "admin": lambda user, b: True,
-    }
-
     check_permission = delete_permissions_map.get(current_user.role)
     if not check_permission or not check_permission(current_user, booking):
         raise HTTPException(status_code=403, detail="You are not authorized to delete this booking")
 
+    freelancer_id, start_at, end_at = booking.freelancer_id, booking.start_at, booking.end_at
+    service_id, was_reviewed = booking.service_id, booking.review is not None
+    was_active = booking.status in ACTIVE_STATUSES
+    if was_reviewed:
+        apply_review_change(db, booking, booking.review.rating, None)
+    fields = booking_fields(booking)
+    enqueue(db, booking_event(BOOKING_DELETED, booking_id, **fields))
     db.delete(booking)
     db.commit()
+    if was_reviewed:
+        invalidate_service(service_id)
+    booking_index.discard(freelancer_id, booking_id)
+    if was_active:
+        calendar_cache.apply_booking(freelancer_id, start_at, end_at, -1)
+    publish_booking(BOOKING_DELETED, booking_id, **fields)
 
 
 # Admin-only status update (PATCH)
@@ -141,10 +384,7 @@ def admin_update_booking_status(
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid status")
 
-    booking.status = status_enum
-    db.commit()
-    db.refresh(booking)
-    return booking
+    return apply_status(db, booking, status_enum)
 
 @router.get("/protected", dependencies=[Depends(jwt_bearer)])
 def protected_route():
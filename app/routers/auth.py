@@ -9,7 +9,8 @@ from app.models.user import User
 from app.database.session import get_db
 from app.core.hash import Hash
 from app.core.security import create_access_token
-from app.core.deps import get_current_user
+from app.core.deps import get_current_user, admin_required
+from app.core.principal import principal_cache
 import traceback
 
 
@@ -27,6 +28,8 @@ def register(user: UserCreate, db: Session = Depends(get_db)):
             detail="Email is already registered."
         )
 
+    # Don't hold a pooled connection while bcrypt runs; the session reconnects on commit
+    db.close()
     hashed_password = Hash.bcrypt(user.password)
     new_user = User(
         username=user.username,
@@ -46,10 +49,22 @@ def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depend
     # Allow login by username OR email using the same OAuth2 form field
     identifier = form_data.username
     user = db.query(User).filter((User.username == identifier) | (User.email == identifier)).first()
+    # Release the connection before the slow verify; loaded attributes stay readable
+    db.close()
 
     if not user or not Hash.verify(form_data.password, user.password):
         raise HTTPException(status_code=400, detail="Incorrect username or password")
 
+    # Upgrade hashes made with an older bcrypt cost while we have the plaintext
+    if Hash.needs_rehash(user.password):
+        try:
+            new_hash = Hash.bcrypt(form_data.password)
+            db.query(User).filter(User.id == user.id).update({User.password: new_hash})
+            db.commit()
+        except HTTPException:
+            # Hash pool busy; the login itself already succeeded, retry next time
+            pass
+
     access_token = create_access_token(data={
         "sub": str(user.id),
         "username": user.username,
@@ -63,3 +78,8 @@ def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depend
 def logout(current_user: User = Depends(get_current_user)):
     # With stateless JWT, logout is client-side (remove token). We validate the token here for safety.
     return {"detail": "Logged out"}
+
+
+@router.get("/principal-cache/stats")
+def principal_cache_stats(_admin=Depends(admin_required)):
+    return principal_cache.stats()
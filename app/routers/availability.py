@@ -1,13 +1,23 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import delete, insert, select
 from sqlalchemy.orm import Session
+from datetime import datetime
 from app.database.connection import get_db
 from app.models.availability import AvailabilitySlot
-from app.schemas.availability import AvailabilityCreate, AvailabilityOut
+from app.schemas.availability import (
+    AvailabilityCreate, AvailabilityOut, AvailabilityTemplate, AvailabilityTemplateOut,
+)
 from app.models.user import User
 from app.models.review import Review
 
-from app.core.deps import get_current_user
+from app.core.deps import get_current_user, admin_required
 from app.schemas.review import ReviewCreate, ReviewOut
+from app.utils.availability_template import diff_template, merge_weekly, minutes_to_time, overlaps, slot_key
+from app.utils.calendar_cache import calendar_cache
+from app.utils.live_hub import (
+    AVAILABILITY_REPLACED, AVAILABILITY_SLOT_CREATED, AVAILABILITY_SLOT_DELETED, live_hub, publish_slot,
+)
+from app.utils.free_slots import MAX_RANGE, utc
 
 
 router = APIRouter(
@@ -23,24 +33,90 @@ def create_slot(
 ):
     if current_user.role != "freelancer":
          raise HTTPException(status_code=403, detail="Only freelancers can create availability slots")
+
+    same_day = db.execute(
+        select(AvailabilitySlot.day_of_week, AvailabilitySlot.start_time, AvailabilitySlot.end_time)
+        .where(AvailabilitySlot.freelancer_id == current_user.id, AvailabilitySlot.day_of_week == slot.day_of_week)
+    ).all()
+    if overlaps([slot_key(*row) for row in same_day], slot_key(slot.day_of_week, slot.start_time, slot.end_time)):
+        raise HTTPException(status_code=409, detail="Slot overlaps an existing slot")
     
     new_slot = AvailabilitySlot(
          **slot.dict(),
          freelancer_id = current_user.id
     )
 
+    freelancer_id = current_user.id
     db.add(new_slot)
     db.commit()
+    calendar_cache.apply_slot(freelancer_id, slot.day_of_week, slot.start_time, slot.end_time, 1)
     db.refresh(new_slot)
+    publish_slot(AVAILABILITY_SLOT_CREATED, freelancer_id, slot.day_of_week, slot.start_time, slot.end_time,
+                 new_slot.id)
     return new_slot
 
 
+def my_slots_query(freelancer_id: int):
+    return (
+        select(AvailabilitySlot)
+        .where(AvailabilitySlot.freelancer_id == freelancer_id)
+        .order_by(AvailabilitySlot.day_of_week, AvailabilitySlot.start_time)
+    )
+
+
+@router.put("/", response_model=AvailabilityTemplateOut)
+def replace_weekly_template(
+    template: AvailabilityTemplate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Replace the caller's weekly availability with `template`.
+
+    Overlapping and touching slots are merged first; only the rows that
+    differ from what is stored are deleted or inserted, in one transaction.
+    """
+    if current_user.role != "freelancer":
+        raise HTTPException(status_code=403, detail="Only freelancers can create availability slots")
+
+    freelancer_id = current_user.id
+    desired = merge_weekly([slot_key(s.day_of_week, s.start_time, s.end_time) for s in template.slots])
+
+    # Serialize concurrent uploads for the same freelancer (no-op on SQLite)
+    db.execute(select(User.id).where(User.id == freelancer_id).with_for_update())
+    existing = db.execute(
+        select(AvailabilitySlot.id, AvailabilitySlot.day_of_week, AvailabilitySlot.start_time,
+               AvailabilitySlot.end_time)
+        .where(AvailabilitySlot.freelancer_id == freelancer_id)
+    ).all()
+    delete_ids, to_insert, keep_ids = diff_template([(row[0], slot_key(*row[1:])) for row in existing], desired)
+
+    if delete_ids:
+        db.execute(delete(AvailabilitySlot).where(AvailabilitySlot.id.in_(delete_ids)))
+    if to_insert:
+        db.execute(insert(AvailabilitySlot), [
+            {"freelancer_id": freelancer_id, "day_of_week": day,
+             "start_time": minutes_to_time(start), "end_time": minutes_to_time(end)}
+            for day, start, end in to_insert
+        ])
+    db.commit()
+    if delete_ids or to_insert:
+        calendar_cache.invalidate(freelancer_id)
+        live_hub.publish(freelancer_id, AVAILABILITY_REPLACED, {"inserted": len(to_insert), "deleted": len(delete_ids)})
+
+    return {
+        "slots": db.scalars(my_slots_query(freelancer_id)).all(),
+        "inserted": len(to_insert),
+        "deleted": len(delete_ids),
+        "unchanged": len(keep_ids),
+    }
+
+
 @router.get("/", response_model=list[AvailabilityOut])
 def get_my_slots(db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
     if current_user.role != "freelancer":
         raise HTTPException(status_code=403, detail="Only freelancers can view their slots")
 
-    return db.query(AvailabilitySlot).filter_by(freelancer_id=current_user.id).all()
+    return db.scalars(my_slots_query(current_user.id)).all()
 
 
 @router.delete("/{slot_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -49,6 +125,26 @@ def delete_slot(slot_id: int, db: Session = Depends(get_db), current_user: User
     if not slot:
         raise HTTPException(status_code=404, detail="Slot not found or unauthorized")
 
+    freelancer_id, day_of_week = slot.freelancer_id, slot.day_of_week
+    start_time, end_time = slot.start_time, slot.end_time
     db.delete(slot)
     db.commit()
-    
\ No newline at end of file
+    calendar_cache.apply_slot(freelancer_id, day_of_week, start_time, end_time, -1)
+    publish_slot(AVAILABILITY_SLOT_DELETED, freelancer_id, day_of_week, start_time, end_time, slot_id)
+
+
+# Public route: answered from the in-memory calendar bitmaps
+@router.get("/freelancers/{freelancer_id}/is-free")
+def is_freelancer_free(freelancer_id: int, start_at: datetime, end_at: datetime, db: Session = Depends(get_db)):
+    # Naive values are UTC, as in services.get_free_slots; comparing naive with aware would raise
+    start_at, end_at = utc(start_at), utc(end_at)
+    if end_at <= start_at:
+        raise HTTPException(status_code=400, detail="end_at must be after start_at")
+    if end_at - start_at > MAX_RANGE:
+        raise HTTPException(status_code=400, detail=f"Range cannot exceed {MAX_RANGE.days} days")
+    return {"is_free": calendar_cache.is_free(db, freelancer_id, start_at, end_at)}
+
+
+@router.get("/cache/stats")
+def calendar_cache_stats(_admin: User = Depends(admin_required)):
+    return calendar_cache.stats()
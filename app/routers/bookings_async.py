@@ -0,0 +1,290 @@
+# app/routers/bookings_async.py
+#
+# Async twin of app/routers/Booking.py, mounted instead of it when DB_ASYNC=1.
+# Keep the two in step until the sync stack is retired.
+
+import asyncio
+import weakref
+from contextlib import AsyncExitStack
+from datetime import datetime, timedelta
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.deps import get_current_user_async
+from app.core.jwt_bearer import jwt_bearer
+from app.database.connection import get_async_db, get_async_read_db
+from app.models.booking import Booking, BookingStatus
+from app.models.review import Review
+from app.models.service import Service
+from app.models.user import User
+from app.routers.Booking import (
+    BOOKING_OUT_COLUMNS, batch_events, batch_insert_stmt, batch_services_query, batch_window, batch_window_query,
+    bookings_listing, check_batch_request, delete_permissions_map, finish_batch, is_exclusion_violation, plan_batch,
+    publish_batch, status_permissions_map,
+)
+from app.schemas.booking import BookingBatchCreate, BookingBatchOut, BookingCreate, BookingOut, BookingPage
+from app.utils.booking_index import (
+    ACTIVE_STATUSES, FreelancerCalendar, active_bookings_query, booking_index, calendar_from_rows,
+    db_conflict_query, to_epoch,
+)
+from app.utils.calendar_cache import calendar_cache
+from app.utils.fast_json import fast_page
+from app.utils.live_hub import publish_booking
+from app.utils.outbox import (
+    BOOKING_CREATED, BOOKING_DELETED, BOOKING_STATUS_CHANGED, booking_event, booking_fields, enqueue,
+)
+from app.utils.pagination import PageParams, keyset, page_result
+from app.utils.ratings import summary_statements
+from app.utils.service_cache import invalidate_service
+
+router = APIRouter(
+    prefix="/bookings",
+    tags=["Bookings"]
+)
+
+# Per-freelancer critical section. A threading.Lock can't be held across an
+# await on the event loop, so the async stack serializes with asyncio locks.
+# Weak values: a lock lives only while a holder or waiter references it, so
+# freelancers booked once don't keep one forever.
+freelancer_locks: weakref.WeakValueDictionary[int, asyncio.Lock] = weakref.WeakValueDictionary()
+
+
+def freelancer_lock(freelancer_id: int) -> asyncio.Lock:
+    lock = freelancer_locks.get(freelancer_id)
+    if lock is None:
+        lock = freelancer_locks[freelancer_id] = asyncio.Lock()
+    return lock
+
+
+async def get_calendar(db: AsyncSession, freelancer_id: int) -> FreelancerCalendar:
+    cal = booking_index.get(freelancer_id)
+    if cal is None:
+        rows = (await db.execute(active_bookings_query(freelancer_id))).all()
+        cal = booking_index.install(freelancer_id, calendar_from_rows(rows))
+    return cal
+
+
+async def assert_slot_free(db: AsyncSession, cal: FreelancerCalendar, freelancer_id: int, start_at, end_at,
+                           ignore_id: int | None = None):
+    if cal.find_conflict(to_epoch(start_at), to_epoch(end_at), ignore_id) is None:
+        return
+    # The in-process index can be stale if another worker canceled the booking
+    if await db.scalar(db_conflict_query(freelancer_id, start_at, end_at, ignore_id)):
+        raise HTTPException(status_code=409, detail="Freelancer already has a booking at this time")
+    booking_index.invalidate(freelancer_id)
+
+
+async def commit_booking(db: AsyncSession, freelancer_id: int):
+    try:
+        await db.commit()
+    except IntegrityError as e:
+        await db.rollback()
+        if is_exclusion_violation(e):
+            booking_index.invalidate(freelancer_id)
+            raise HTTPException(status_code=409, detail="Freelancer already has a booking at this time")
+        raise
+
+
+async def get_booking_or_404(db: AsyncSession, booking_id: int) -> Booking:
+    booking = await db.get(Booking, booking_id)
+    if not booking:
+        raise HTTPException(status_code=404, detail="Booking not found")
+    return booking
+
+
+async def apply_status(db: AsyncSession, booking: Booking, status_enum: BookingStatus) -> Booking:
+    booking_id, freelancer_id = booking.id, booking.freelancer_id
+    start_at, end_at = booking.start_at, booking.end_at
+    was_active = booking.status in ACTIVE_STATUSES
+    is_active = status_enum in ACTIVE_STATUSES
+    async with freelancer_lock(freelancer_id):
+        cal = await get_calendar(db, freelancer_id)
+        # Re-activating a canceled/completed booking must not create an overlap
+        if is_active and not was_active:
+            await assert_slot_free(db, cal, freelancer_id, start_at, end_at, ignore_id=booking_id)
+
+        previous_status = booking.status
+        booking.status = status_enum
+        fields = booking_fields(booking)
+        if status_enum != previous_status:
+            enqueue(db, booking_event(BOOKING_STATUS_CHANGED, booking_id, **fields, previous_status=previous_status))
+        await commit_booking(db, freelancer_id)
+        with cal.lock:
+            if is_active:
+                cal.add(booking_id, to_epoch(start_at), to_epoch(end_at))
+            else:
+                cal.remove(booking_id)
+    if is_active != was_active:
+        calendar_cache.apply_booking(freelancer_id, start_at, end_at, 1 if is_active else -1)
+    if status_enum != previous_status:
+        publish_booking(BOOKING_STATUS_CHANGED, booking_id, **fields, previous_status=previous_status)
+    await db.refresh(booking)
+    return booking
+
+
+@router.post("/", response_model=BookingOut, status_code=status.HTTP_201_CREATED)
+async def create_booking(booking_data: BookingCreate, db: AsyncSession = Depends(get_async_db),
+                         current_user: User = Depends(get_current_user_async)):
+    if current_user.role != "client":
+        raise HTTPException(status_code=403, detail="Only clients can create bookings")
+
+    service = await db.get(Service, booking_data.service_id)
+    if not service:
+        raise HTTPException(status_code=404, detail="Service not found")
+
+    end_time = booking_data.start_at + timedelta(minutes=service.duration)
+    freelancer_id = service.freelancer_id
+
+    async with freelancer_lock(freelancer_id):
+        cal = await get_calendar(db, freelancer_id)
+        await assert_slot_free(db, cal, freelancer_id, booking_data.start_at, end_time)
+
+        new_booking = Booking(
+            client_id=current_user.id,
+            freelancer_id=freelancer_id,
+            service_id=booking_data.service_id,
+            start_at=booking_data.start_at,
+            end_at=end_time,
+            status=BookingStatus.pending
+        )
+        db.add(new_booking)
+        await db.flush()
+        booking_id = new_booking.id
+        fields = booking_fields(new_booking)
+        enqueue(db, booking_event(BOOKING_CREATED, booking_id, **fields))
+        await commit_booking(db, freelancer_id)
+        with cal.lock:
+            cal.add(booking_id, to_epoch(booking_data.start_at), to_epoch(end_time))
+    calendar_cache.apply_booking(freelancer_id, booking_data.start_at, end_time, 1)
+    publish_booking(BOOKING_CREATED, booking_id, **fields)
+    await db.refresh(new_booking)
+    return new_booking
+
+
+@router.post("/batch", response_model=BookingBatchOut)
+async def create_bookings_batch(batch: BookingBatchCreate, db: AsyncSession = Depends(get_async_db),
+                                current_user: User = Depends(get_current_user_async)):
+    """Create many bookings in one transaction; each item reports created / conflict / not_found."""
+    check_batch_request(batch, current_user)
+    services = {sid: (fid, duration) for sid, fid, duration in await db.execute(
+        batch_services_query(item.service_id for item in batch.items))} if batch.items else {}
+    freelancer_ids = sorted({fid for fid, _ in services.values()})
+
+    for attempt in range(2):
+        async with AsyncExitStack() as locks:
+            # Fixed order so two batches over the same freelancers can't deadlock
+            for fid in freelancer_ids:
+                await locks.enter_async_context(freelancer_lock(fid))
+
+            window = batch_window(batch.items, services)
+            existing = (await db.execute(batch_window_query(freelancer_ids, *window))).all() if window else []
+            results, rows = plan_batch(current_user.id, batch.items, services, existing)
+            returned = (await db.execute(batch_insert_stmt(), [values for _, values in rows])).all() if rows else []
+            enqueue(db, *batch_events(rows, returned))
+            try:
+                await db.commit()
+            except IntegrityError as e:
+                await db.rollback()
+                if not is_exclusion_violation(e):
+                    raise
+                for fid in freelancer_ids:
+                    booking_index.invalidate(fid)
+                if attempt:
+                    raise HTTPException(status_code=409, detail="Bookings changed concurrently, please retry")
+                continue
+            # Calendars are only loaded under freelancer_locks, so unloaded ones will pick these rows up
+            for (_, values), (booking_id, _) in zip(rows, returned):
+                cal = booking_index.get(values["freelancer_id"])
+                if cal is not None:
+                    with cal.lock:
+                        cal.add(booking_id, to_epoch(values["start_at"]), to_epoch(values["end_at"]))
+        break
+
+    for _, values in rows:
+        calendar_cache.apply_booking(values["freelancer_id"], values["start_at"], values["end_at"], 1)
+    publish_batch(rows, returned)
+    return finish_batch(results, rows, returned)
+
+
+@router.get("/", response_model=BookingPage)
+async def get_my_bookings(booking_status: BookingStatus | None = Query(None, alias="status"),
+                          freelancer_id: int | None = None, start_from: datetime | None = None,
+                          start_to: datetime | None = None,
+                          page: PageParams = Depends(), db: AsyncSession = Depends(get_async_read_db),
+                          current_user: User = Depends(get_current_user_async)):
+    stmt = bookings_listing(current_user, booking_status, freelancer_id, start_from, start_to)
+    if settings.FAST_JSON_LISTS:
+        stmt = keyset(stmt.with_only_columns(*BOOKING_OUT_COLUMNS), Booking.created_at, Booking.id, page)
+        return fast_page((await db.execute(stmt)).all(), page)
+    rows = (await db.scalars(keyset(stmt, Booking.created_at, Booking.id, page))).all()
+    return page_result(rows, page)
+
+
+@router.put("/{booking_id}/status")
+async def update_booking_status(booking_id: int, new_status: str, db: AsyncSession = Depends(get_async_db),
+                                current_user: User = Depends(get_current_user_async)):
+    booking = await get_booking_or_404(db, booking_id)
+
+    try:
+        status_enum = BookingStatus(new_status)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid status")
+
+    check_permission = status_permissions_map.get(new_status)
+    if check_permission and not check_permission(current_user, booking):
+        raise HTTPException(status_code=403, detail=f"You are not allowed to mark this booking as {new_status}")
+
+    return await apply_status(db, booking, status_enum)
+
+
+@router.delete("/{booking_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_booking(booking_id: int, db: AsyncSession = Depends(get_async_db),
+                         current_user: User = Depends(get_current_user_async)):
+    booking = await get_booking_or_404(db, booking_id)
+
+    check_permission = delete_permissions_map.get(current_user.role)
+    if not check_permission or not check_permission(current_user, booking):
+        raise HTTPException(status_code=403, detail="You are not authorized to delete this booking")
+
+    freelancer_id, start_at, end_at = booking.freelancer_id, booking.start_at, booking.end_at
+    was_active = booking.status in ACTIVE_STATUSES
+    rating = await db.scalar(select(Review.rating).where(Review.booking_id == booking_id))
+    dialect = db.get_bind().dialect.name
+    service_id = booking.service_id
+    for stmt in summary_statements(dialect, service_id, freelancer_id, rating, None):
+        await db.execute(stmt)
+    fields = booking_fields(booking)
+    enqueue(db, booking_event(BOOKING_DELETED, booking_id, **fields))
+    await db.delete(booking)
+    await db.commit()
+    if rating is not None:
+        invalidate_service(service_id)
+    booking_index.discard(freelancer_id, booking_id)
+    if was_active:
+        calendar_cache.apply_booking(freelancer_id, start_at, end_at, -1)
+    publish_booking(BOOKING_DELETED, booking_id, **fields)
+
+
+@router.patch("/{booking_id}/status")
+async def admin_update_booking_status(booking_id: int, new_status: str, db: AsyncSession = Depends(get_async_db),
+                                      current_user: User = Depends(get_current_user_async)):
+    if current_user.role != "admin":
+        raise HTTPException(status_code=403, detail="Admins only")
+
+    booking = await get_booking_or_404(db, booking_id)
+
+    try:
+        status_enum = BookingStatus(new_status)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid status")
+
+    return await apply_status(db, booking, status_enum)
+
+
+@router.get("/protected", dependencies=[Depends(jwt_bearer)])
+async def protected_route():
+    return {"message": "You have access to this route"}
@@ -1,18 +1,24 @@
 # app/routers/favorites.py
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import select
 from sqlalchemy.orm import Session
-from typing import List
 
-from app.database.connection import get_db
+from app.database.connection import get_db, get_read_db
 from app.models.favorite import Favorite
 from app.models.service import Service
-from app.schemas.favorite import FavoriteCreate, FavoriteResponse, FavoriteWithService
+from app.schemas.favorite import (
+    FavoriteCreate, FavoritePage, FavoriteResponse, FavoriteStatusOut, FavoriteStatusRequest, FavoriteWithService,
+)
 from app.core.deps import get_current_user
 from app.models.user import User
+from app.utils.pagination import PageParams, keyset, page_result
 
 router = APIRouter(prefix="/favorites", tags=["favorites"])
 
+# Upper bound on ids per POST /favorites/check; one listing page is ~24 cards
+MAX_STATUS_IDS = 200
+
 
 @router.post("/", response_model=FavoriteResponse, status_code=status.HTTP_201_CREATED)
 def add_favorite(
@@ -52,26 +58,39 @@ def add_favorite(
     return new_favorite
 
 
-@router.get("/", response_model=List[FavoriteWithService])
+def favorites_listing(user_id: int):
+    """Favorites joined to their service in one query; shared with the async router."""
+    return (
+        select(Favorite.id, Favorite.service_id, Service.title, Service.price, Favorite.created_at)
+        .outerjoin(Service, Service.id == Favorite.service_id)
+        .where(Favorite.user_id == user_id)
+    )
+
+
+def favorites_page(rows, page: PageParams) -> dict:
+    result = page_result(rows, page)
+    result["items"] = [
+        FavoriteWithService(
+            id=fav_id,
+            service_id=service_id,
+            service_title=title,
+            service_price=price,
+            created_at=created_at
+        )
+        for fav_id, service_id, title, price, created_at in result["items"]
+    ]
+    return result
+
+
+@router.get("/", response_model=FavoritePage)
 def get_favorites(
-    db: Session = Depends(get_db),
+    page: PageParams = Depends(),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
-    """Get all favorite services for the current user"""
-    favorites = db.query(Favorite).filter(Favorite.user_id == current_user.id).all()
-    
-    result = []
-    for fav in favorites:
-        service = db.query(Service).filter(Service.id == fav.service_id).first()
-        result.append(FavoriteWithService(
-            id=fav.id,
-            service_id=fav.service_id,
-            service_title=service.title if service else None,
-            service_price=service.price if service else None,
-            created_at=fav.created_at
-        ))
-    
-    return result
+    """Get the current user's favorite services, newest first"""
+    stmt = keyset(favorites_listing(current_user.id), Favorite.created_at, Favorite.id, page)
+    return favorites_page(db.execute(stmt).all(), page)
 
 
 @router.delete("/{service_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -101,7 +120,7 @@ def remove_favorite(
 @router.get("/check/{service_id}")
 def check_favorite(
     service_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """Check if a service is in user's favorites"""
@@ -111,3 +130,34 @@ def check_favorite(
     ).first()
     
     return {"is_favorite": favorite is not None}
+
+
+def favorite_ids_query(user_id: int, service_ids: list[int]):
+    """Which of `service_ids` the user has favorited; served by the (user_id, service_id) unique index."""
+    if len(service_ids) > MAX_STATUS_IDS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {MAX_STATUS_IDS} service ids per request"
+        )
+    return select(Favorite.service_id).where(
+        Favorite.user_id == user_id,
+        Favorite.service_id.in_(service_ids)
+    )
+
+
+def favorite_status(service_ids: list[int], favorited) -> dict:
+    favorited = set(favorited)
+    return {"is_favorite": {service_id: service_id in favorited for service_id in service_ids}}
+
+
+@router.post("/check", response_model=FavoriteStatusOut)
+def check_favorites(
+    body: FavoriteStatusRequest,
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Check many services at once, e.g. every card on a listing page"""
+    if not body.service_ids:
+        return {"is_favorite": {}}
+    favorited = db.scalars(favorite_ids_query(current_user.id, body.service_ids)).all()
+    return favorite_status(body.service_ids, favorited)
@@ -0,0 +1,113 @@
+# app/routers/favorites_async.py
+#
+# Async twin of app/routers/favorites.py, mounted instead of it when DB_ASYNC=1.
+# Keep the two in step until the sync stack is retired.
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.deps import get_current_user_async
+from app.database.connection import get_async_db, get_async_read_db
+from app.models.favorite import Favorite
+from app.models.service import Service
+from app.models.user import User
+from app.routers.favorites import favorite_ids_query, favorite_status, favorites_listing, favorites_page
+from app.schemas.favorite import (
+    FavoriteCreate, FavoritePage, FavoriteResponse, FavoriteStatusOut, FavoriteStatusRequest,
+)
+from app.utils.pagination import PageParams, keyset
+
+router = APIRouter(prefix="/favorites", tags=["favorites"])
+
+
+async def find_favorite(db: AsyncSession, user_id: int, service_id: int) -> Favorite | None:
+    return await db.scalar(
+        select(Favorite).where(Favorite.user_id == user_id, Favorite.service_id == service_id)
+    )
+
+
+@router.post("/", response_model=FavoriteResponse, status_code=status.HTTP_201_CREATED)
+async def add_favorite(
+    favorite: FavoriteCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async)
+):
+    """Add a service to user's favorites"""
+    if await db.get(Service, favorite.service_id) is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Service not found"
+        )
+
+    if await find_favorite(db, current_user.id, favorite.service_id):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Service already in favorites"
+        )
+
+    new_favorite = Favorite(
+        user_id=current_user.id,
+        service_id=favorite.service_id
+    )
+    db.add(new_favorite)
+    await db.commit()
+    await db.refresh(new_favorite)
+
+    return new_favorite
+
+
+@router.get("/", response_model=FavoritePage)
+async def get_favorites(
+    page: PageParams = Depends(),
+    db: AsyncSession = Depends(get_async_read_db),
+    current_user: User = Depends(get_current_user_async)
+):
+    """Get the current user's favorite services, newest first"""
+    stmt = keyset(favorites_listing(current_user.id), Favorite.created_at, Favorite.id, page)
+    return favorites_page((await db.execute(stmt)).all(), page)
+
+
+@router.delete("/{service_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def remove_favorite(
+    service_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async)
+):
+    """Remove a service from user's favorites"""
+    favorite = await find_favorite(db, current_user.id, service_id)
+    if not favorite:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Favorite not found"
+        )
+
+    await db.delete(favorite)
+    await db.commit()
+
+    return None
+
+
+@router.get("/check/{service_id}")
+async def check_favorite(
+    service_id: int,
+    db: AsyncSession = Depends(get_async_read_db),
+    current_user: User = Depends(get_current_user_async)
+):
+    """Check if a service is in user's favorites"""
+    favorite = await find_favorite(db, current_user.id, service_id)
+
+    return {"is_favorite": favorite is not None}
+
+
+@router.post("/check", response_model=FavoriteStatusOut)
+async def check_favorites(
+    body: FavoriteStatusRequest,
+    db: AsyncSession = Depends(get_async_read_db),
+    current_user: User = Depends(get_current_user_async)
+):
+    """Check many services at once, e.g. every card on a listing page"""
+    if not body.service_ids:
+        return {"is_favorite": {}}
+    favorited = (await db.scalars(favorite_ids_query(current_user.id, body.service_ids))).all()
+    return favorite_status(body.service_ids, favorited)
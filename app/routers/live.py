@@ -0,0 +1,103 @@
+import asyncio
+
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import Response
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.database.connection import SessionLocal
+from app.models.user import User, UserRole
+from app.utils.live_hub import live_hub, sse_frame
+from app.utils.service_cache import get_cached_service
+
+router = APIRouter(
+    prefix="/live",
+    tags=["Live"]
+)
+
+# Browsers wait this long before reconnecting a dropped EventSource
+RETRY_MS = 3000
+KEEPALIVE = ": keepalive\n\n"
+
+
+def lookup_freelancer(freelancer_id: int) -> bool:
+    # Own short session: a Depends(get_db) session would stay open for the whole stream
+    db = SessionLocal()
+    try:
+        return db.scalar(select(User.id).where(User.id == freelancer_id, User.role == UserRole.freelancer)) is not None
+    finally:
+        db.close()
+
+
+def lookup_service_freelancer(service_id: int) -> int | None:
+    db = SessionLocal()
+    try:
+        cached = get_cached_service(db, service_id)
+        return cached.payload["freelancer_id"] if cached else None
+    finally:
+        db.close()
+
+
+class EventStreamResponse(Response):
+    """Server-Sent Events for one freelancer: a "ready" event, then changes as they commit.
+
+    Unlike StreamingResponse this keeps no disconnect-listener task per
+    stream (idle streams are what a worker holds thousands of); the client
+    is checked for a disconnect every LIVE_HEARTBEAT_S instead, when the
+    stream also sends a comment line so proxies keep it open.
+    """
+    media_type = "text/event-stream"
+
+    def __init__(self, freelancer_id: int):
+        self.freelancer_id = freelancer_id
+        self.status_code = 200
+        self.background = None
+        self.init_headers({"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+    async def __call__(self, scope, receive, send):
+        request = Request(scope, receive)
+        loop = asyncio.get_running_loop()
+        sub = live_hub.subscribe(self.freelancer_id)
+        try:
+            await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+            frame = f"retry: {RETRY_MS}\n" + sse_frame("ready", {"freelancer_id": self.freelancer_id})
+            check_at = loop.time() + settings.LIVE_HEARTBEAT_S
+            while True:
+                await send({"type": "http.response.body", "body": frame.encode(), "more_body": True})
+                if not live_hub.running:
+                    break
+                frame = "".join(await sub.wait(settings.LIVE_HEARTBEAT_S)) or KEEPALIVE
+                # A check costs an event-loop round trip: once per heartbeat period, busy or idle
+                if loop.time() >= check_at:
+                    if await request.is_disconnected():
+                        break
+                    check_at = loop.time() + settings.LIVE_HEARTBEAT_S
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+        finally:
+            live_hub.unsubscribe(sub)
+
+
+def event_stream(freelancer_id: int) -> EventStreamResponse:
+    if live_hub.full:
+        raise HTTPException(status_code=503, detail="Too many live subscribers, retry later",
+                            headers={"Retry-After": "10"})
+    return EventStreamResponse(freelancer_id)
+
+
+# Public routes: the events carry the same busy/free information as free-slots
+@router.get("/freelancers/{freelancer_id}")
+async def freelancer_events(freelancer_id: int):
+    if not await run_in_threadpool(lookup_freelancer, freelancer_id):
+        raise HTTPException(status_code=404, detail="Freelancer not found")
+    return event_stream(freelancer_id)
+
+
+@router.get("/services/{service_id}")
+async def service_events(service_id: int):
+    """A service's free slots depend on all of its freelancer's bookings, so this is the freelancer's stream."""
+    freelancer_id = await run_in_threadpool(lookup_service_freelancer, service_id)
+    if freelancer_id is None:
+        raise HTTPException(status_code=404, detail="Service not found")
+    return event_stream(freelancer_id)
+
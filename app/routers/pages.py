@@ -1,34 +1,58 @@
 from fastapi import APIRouter, Request, Depends
 from fastapi.responses import RedirectResponse
 from sqlalchemy.orm import Session
-from app.database.connection import get_db
+from app.database.connection import get_read_db
 from app.models.service import Service
 from app.models.booking import Booking
 from fastapi.templating import Jinja2Templates
-from app.core.deps import try_get_current_user, role_required
+from app.core.deps import admin_required, try_get_current_user, role_required
+from app.utils.page_cache import page_cache
+from app.utils.service_cache import get_cached_service
+from app.utils.static_assets import static_url
 
 router = APIRouter(tags=["Pages"])
 
 templates = Jinja2Templates(directory="app/templates")
+templates.env.globals["static_url"] = static_url
+
+# Page cache TTLs (seconds). Static pages change only on deploy; service
+# pages are also dropped on service writes, see invalidate_service.
+STATIC_TTL = 3600
+SERVICES_LIST_TTL = 30
+SERVICE_DETAIL_TTL = 300
+
+def cached_page(request: Request, route: str, template: str, context=dict, *, ttl: float = STATIC_TTL,
+                key: tuple = (), public: bool = False):
+    return page_cache.render(templates, request, route, template, context, ttl=ttl, key=key, public=public)
+
+@router.get("/page-cache/stats")
+def page_cache_stats(_admin=Depends(admin_required)):
+    return page_cache.stats()
 
 @router.get("/services")
-def services_list(request: Request, db: Session = Depends(get_db)):
+def services_list(request: Request, db: Session = Depends(get_read_db)):
     # Protect page: redirect unauthenticated to /login
     current_user = try_get_current_user(request, db)
     if not current_user:
         return RedirectResponse(url="/login?reason=auth", status_code=302)
-    services = db.query(Service).order_by(Service.created_at.desc()).limit(24).all()
-    return templates.TemplateResponse("services/list.html", {"request": request, "services": services})
+    def context():
+        return {"services": db.query(Service).order_by(Service.created_at.desc()).limit(24).all()}
+    # Same 24 newest services for every visitor
+    return cached_page(request, "services_list", "services/list.html", context, ttl=SERVICES_LIST_TTL)
 
 
 @router.get("/services/{service_id}/view")
-def service_detail(service_id: int, request: Request, db: Session = Depends(get_db)):
+def service_detail(service_id: int, request: Request, db: Session = Depends(get_read_db)):
     # Protect page
     current_user = try_get_current_user(request, db)
     if not current_user:
         return RedirectResponse(url="/login?reason=auth", status_code=302)
-    service = db.query(Service).filter(Service.id == service_id).first()
-    return templates.TemplateResponse("services/detail.html", {"request": request, "service": service})
+    cached = get_cached_service(db, service_id)
+    if cached is None:
+        # Not cached: the id may exist a moment later
+        return templates.TemplateResponse("services/detail.html", {"request": request, "service": None})
+    return cached_page(request, "service_detail", "services/detail.html", lambda: {"service": cached.payload},
+                       ttl=SERVICE_DETAIL_TTL, key=(service_id,))
 
 # Back-compat: if someone hits the JSON API path directly, show the page instead
 @router.get("/services/{service_id}")
@@ -36,7 +60,7 @@ def service_detail_redirect(service_id: int):
     return RedirectResponse(url=f"/services/{service_id}/view", status_code=302)
 
 @router.get("/dashboard")
-def dashboard_page(request: Request, db: Session = Depends(get_db)):
+def dashboard_page(request: Request, db: Session = Depends(get_read_db)):
     # Require auth and redirect to role-specific dashboard
     current_user = try_get_current_user(request, db)
     if not current_user:
@@ -52,24 +76,24 @@ def dashboard_page(request: Request, db: Session = Depends(get_db)):
 
 @router.get("/dashboard/admin")
 def dashboard_admin(request: Request, _user=Depends(role_required(["admin"]))):
-    return templates.TemplateResponse("dashboard/index.html", {"request": request})
+    return cached_page(request, "dashboard", "dashboard/index.html", key=(_user.role,))
 
 @router.get("/dashboard/freelancer")
 def dashboard_freelancer(request: Request, _user=Depends(role_required(["freelancer"]))):
-    return templates.TemplateResponse("dashboard/index.html", {"request": request})
+    return cached_page(request, "dashboard", "dashboard/index.html", key=(_user.role,))
 
 @router.get("/dashboard/client")
 def dashboard_client(request: Request, _user=Depends(role_required(["client"]))):
-    return templates.TemplateResponse("dashboard/index.html", {"request": request})
+    return cached_page(request, "dashboard", "dashboard/index.html", key=(_user.role,))
 
 
 @router.get("/login")
 def login_page(request: Request):
-    return templates.TemplateResponse("auth/login.html", {"request": request})
+    return cached_page(request, "login", "auth/login.html", public=True)
 
 
 @router.get("/my/bookings")
-def my_bookings(request: Request, db: Session = Depends(get_db)):
+def my_bookings(request: Request, db: Session = Depends(get_read_db)):
     current_user = try_get_current_user(request, db)
     if not current_user:
         return RedirectResponse(url="/login?reason=auth", status_code=302)
@@ -78,55 +102,55 @@ def my_bookings(request: Request, db: Session = Depends(get_db)):
 
 @router.get("/register")
 def register_page(request: Request):
-    return templates.TemplateResponse("auth/register.html", {"request": request})
+    return cached_page(request, "register", "auth/register.html", public=True)
 
 @router.get("/bookings/create")
-def booking_create_page(request: Request, db: Session = Depends(get_db)):
+def booking_create_page(request: Request, db: Session = Depends(get_read_db)):
     current_user = try_get_current_user(request, db)
     if not current_user:
         return RedirectResponse(url="/login?reason=auth", status_code=302)
-    return templates.TemplateResponse("bookings/create.html", {"request": request})
+    return cached_page(request, "booking_create", "bookings/create.html")
 
 @router.get("/book")
-def book_page(request: Request, db: Session = Depends(get_db)):
+def book_page(request: Request, db: Session = Depends(get_read_db)):
     current_user = try_get_current_user(request, db)
     if not current_user:
         return RedirectResponse(url="/login?reason=auth", status_code=302)
-    return templates.TemplateResponse("bookings/book.html", {"request": request})
+    return cached_page(request, "book", "bookings/book.html")
 
 @router.get("/availability/create")
-def availability_create_page(request: Request, db: Session = Depends(get_db)):
+def availability_create_page(request: Request, db: Session = Depends(get_read_db)):
     current_user = try_get_current_user(request, db)
     if not current_user:
         return RedirectResponse(url="/login?reason=auth", status_code=302)
-    return templates.TemplateResponse("availability/create.html", {"request": request})
+    return cached_page(request, "availability_create", "availability/create.html")
 
 @router.get("/reviews/create")
-def review_create_page(request: Request, db: Session = Depends(get_db)):
+def review_create_page(request: Request, db: Session = Depends(get_read_db)):
     current_user = try_get_current_user(request, db)
     if not current_user:
         return RedirectResponse(url="/login?reason=auth", status_code=302)
-    return templates.TemplateResponse("reviews/create.html", {"request": request})
+    return cached_page(request, "review_create", "reviews/create.html")
 
 # Category pages
 @router.get("/c/software-consultation")
 def page_software_consultation(request: Request):
-    return templates.TemplateResponse("categories/software-consultation.html", {"request": request})
+    return cached_page(request, "c/software-consultation", "categories/software-consultation.html", public=True)
 
 @router.get("/c/language-tutoring")
 def page_language_tutoring(request: Request):
-    return templates.TemplateResponse("categories/language-tutoring.html", {"request": request})
+    return cached_page(request, "c/language-tutoring", "categories/language-tutoring.html", public=True)
 
 @router.get("/c/business-coaching")
 def page_business_coaching(request: Request):
-    return templates.TemplateResponse("categories/business-coaching.html", {"request": request})
+    return cached_page(request, "c/business-coaching", "categories/business-coaching.html", public=True)
 
 @router.get("/c/personal-training")
 def page_personal_training(request: Request):
-    return templates.TemplateResponse("categories/personal-training.html", {"request": request})
+    return cached_page(request, "c/personal-training", "categories/personal-training.html", public=True)
 
 @router.get("/c/nutrition-consultation")
 def page_nutrition_consultation(request: Request):
-    return templates.TemplateResponse("categories/nutrition-consultation.html", {"request": request})
+    return cached_page(request, "c/nutrition-consultation", "categories/nutrition-consultation.html", public=True)
 
 
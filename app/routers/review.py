@@ -1,20 +1,36 @@
+from datetime import datetime
+
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from app.database.connection import get_db
+from app.core.config import settings
 from app.core.deps import get_current_user
 from app.models import Review, Booking, User
-from app.schemas.review import ReviewCreate, ReviewOut
+from app.models.rating import FreelancerRating, ServiceRating
+from app.schemas.review import RatingSummaryOut, ReviewCreate, ReviewOut, ReviewPage
+from app.utils.fast_json import fast_page, schema_columns
+from app.utils.pagination import PageParams, keyset, page_result
+from app.utils.ratings import apply_review_change
+from app.utils.service_cache import invalidate_service
 
 router = APIRouter(prefix="/reviews", tags=["Reviews"])
 
+# ReviewOut as Core rows, for FAST_JSON_LISTS
+REVIEW_OUT_COLUMNS = schema_columns(ReviewOut, Review)
+
 def get_booking_or_404(db:Session , booking_id:int)->Booking:
     booking= db.query(Booking).filter(Booking.id == booking_id).first()
     if not booking:
         raise HTTPException(status_code=404, detail="Booking not found")
     return booking
 
-def get_review_or_404(db:Session , review_id : int)->Review:
-    review = db.query(Review).filter(Review.id == review_id).first()
+def get_review_or_404(db:Session , review_id : int, lock: bool = False)->Review:
+    query = db.query(Review).filter(Review.id == review_id)
+    if lock:
+        # Rating deltas are computed from the current row; keep concurrent edits serial
+        query = query.with_for_update()
+    review = query.first()
     if not review:
         raise HTTPException(status_code=404, detail="Review not found")
     return review
@@ -37,19 +53,36 @@ def create_review(
     
     review = Review(**review_data.dict())
     db.add(review)
+    apply_review_change(db, booking, None, review.rating)
     db.commit()
+    invalidate_service(booking.service_id)
     db.refresh(review)
     return review
 
 
-@router.get("/", response_model=list[ReviewOut])
+@router.get("/", response_model=ReviewPage)
 def get_all_reviews(
+    freelancer_id: int | None = None,
+    created_from: datetime | None = None,
+    created_to: datetime | None = None,
+    page: PageParams = Depends(),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     if current_user.role != "admin":
         raise HTTPException(status_code=403, detail="Admins only")
-    return db.query (Review).all()
+
+    stmt = select(*REVIEW_OUT_COLUMNS) if settings.FAST_JSON_LISTS else select(Review)
+    if freelancer_id is not None:
+        stmt = stmt.join(Booking, Booking.id == Review.booking_id).where(Booking.freelancer_id == freelancer_id)
+    if created_from is not None:
+        stmt = stmt.where(Review.created_at >= created_from)
+    if created_to is not None:
+        stmt = stmt.where(Review.created_at < created_to)
+    if settings.FAST_JSON_LISTS:
+        return fast_page(db.execute(keyset(stmt, Review.created_at, Review.id, page)).all(), page)
+    rows = db.scalars(keyset(stmt, Review.created_at, Review.id, page)).all()
+    return page_result(rows, page)
 
 @router.put("/{review_id}", response_model=ReviewOut)
 def update_review(
@@ -58,12 +91,15 @@ def update_review(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    review = get_review_or_404(db, review_id)
+    review = get_review_or_404(db, review_id, lock=True)
     assert_client_owns_booking(review.booking, current_user)
 
+    apply_review_change(db, review.booking, review.rating, review_data.rating)
     review.rating = review_data.rating
     review.comment = review_data.comment
+    service_id = review.booking.service_id
     db.commit()
+    invalidate_service(service_id)
     db.refresh(review)
     return review
 
@@ -73,10 +109,27 @@ def delete_review(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    review = get_review_or_404(db, review_id)
+    review = get_review_or_404(db, review_id, lock=True)
     assert_client_owns_booking(review.booking, current_user)
 
+    apply_review_change(db, review.booking, review.rating, None)
+    service_id = review.booking.service_id
     db.delete(review)
     db.commit()
+    invalidate_service(service_id)
+
+
+def summary_out(summary) -> dict:
+    if summary is None:
+        return {"count": 0, "average": None, "histogram": {stars: 0 for stars in range(1, 6)}}
+    return {"count": summary.count, "average": summary.average, "histogram": summary.histogram}
+
+
+@router.get("/services/{service_id}/summary", response_model=RatingSummaryOut)
+def service_rating_summary(service_id: int, db: Session = Depends(get_db)):
+    return summary_out(db.get(ServiceRating, service_id))
+
 
-    
\ No newline at end of file
+@router.get("/freelancers/{freelancer_id}/summary", response_model=RatingSummaryOut)
+def freelancer_rating_summary(freelancer_id: int, db: Session = Depends(get_db)):
+    return summary_out(db.get(FreelancerRating, freelancer_id))
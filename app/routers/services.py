@@ -1,13 +1,23 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
+from datetime import datetime, timedelta, timezone
 
-from app.database.session import get_db
-from app.core.deps import get_current_user
+from app.database.session import get_db, get_read_db
+from app.core.deps import get_current_user, admin_required
 from app.core.roles import require_roles
-from app.schemas.service import ServiceCreate, ServiceOut,ServiceUpdate
+from app.schemas.service import ServiceCreate, ServiceOut,ServiceUpdate, FreeSlotsOut, ServiceSearchOut
 from app.models.service import Service
 from app.models.user import User
+from app.models.availability import AvailabilitySlot
+from app.models.booking import Booking, BookingStatus
+from app.utils.free_slots import MAX_RANGE, free_slot_starts, time_to_minutes, utc
+from app.utils.catalog_search import SearchSort, search_catalog
+from app.utils.pagination import PageParams
+from app.utils.search_index import catalog_index
+from app.utils.ratings import detach_service_ratings
+from app.utils.etags import etag_matches
+from app.utils.service_cache import cache_control, get_cached_service, invalidate_service, service_cache
 
 router = APIRouter(
     prefix="/services",
@@ -15,24 +25,87 @@ router = APIRouter(
 )
 
 # Public route
+@router.get("/", response_model=ServiceSearchOut)
+def search_services(
+    q: Optional[str] = Query(None, max_length=200, description="Full-text query over title and description"),
+    min_price: Optional[float] = Query(None, ge=0),
+    max_price: Optional[float] = Query(None, ge=0),
+    min_duration: Optional[int] = Query(None, ge=0),
+    max_duration: Optional[int] = Query(None, ge=0),
+    freelancer_id: Optional[int] = None,
+    sort: SearchSort = SearchSort.relevance,
+    facets: bool = Query(True, description="Include total and price/duration bucket counts"),
+    page: PageParams = Depends(),
+    db: Session = Depends(get_read_db),
+):
+    return search_catalog(
+        db, q, sort, page, with_facets=facets,
+        min_price=min_price, max_price=max_price,
+        min_duration=min_duration, max_duration=max_duration,
+        freelancer_id=freelancer_id,
+    )
 
 
-@router.get("/")
-def get_services(current_user: User = Depends(get_current_user)):
-    if current_user.role not in ["admin", "freelancer"]:
-        raise HTTPException(status_code=403, detail="Not authorized to view services")
 
-    return {"message": "Welcome to services!"}
+@router.get("/cache/stats")
+def service_cache_stats(_admin: User = Depends(admin_required)):
+    return service_cache.stats()
 
 
+# Public route: served from the service cache, revalidated with ETags
+@router.get("/{service_id}", response_model=ServiceOut)
+def read_service(service_id: int, if_none_match: Optional[str] = Header(None), db: Session = Depends(get_read_db)):
+    cached = get_cached_service(db, service_id)
+    if cached is None:
+        raise HTTPException(status_code=404, detail="Service not found")
+    headers = {"ETag": cached.etag, "Cache-Control": cache_control()}
+    if etag_matches(if_none_match, cached.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=cached.body, media_type="application/json", headers=headers)
+
 
 # Public route
-@router.get("/{service_id}", response_model=ServiceOut)
-def read_service(service_id: int, db: Session = Depends(get_db)):
+@router.get("/{service_id}/free-slots", response_model=FreeSlotsOut)
+def get_free_slots(
+    service_id: int,
+    from_: Optional[datetime] = Query(None, alias="from"),
+    to: Optional[datetime] = Query(None),
+    db: Session = Depends(get_read_db)
+):
     svc = db.query(Service).filter(Service.id == service_id).first()
     if not svc:
         raise HTTPException(status_code=404, detail="Service not found")
-    return svc
+    if svc.duration <= 0:
+        raise HTTPException(status_code=400, detail="Service has no bookable duration")
+
+    start = utc(from_) if from_ else datetime.now(timezone.utc)
+    end = utc(to) if to else start + timedelta(days=7)
+    if end <= start:
+        raise HTTPException(status_code=400, detail="'to' must be after 'from'")
+    if end - start > MAX_RANGE:
+        raise HTTPException(status_code=400, detail=f"Range cannot exceed {MAX_RANGE.days} days")
+
+    slots = [
+        (row.day_of_week, time_to_minutes(row.start_time), time_to_minutes(row.end_time, is_end=True))
+        for row in db.query(AvailabilitySlot.day_of_week, AvailabilitySlot.start_time, AvailabilitySlot.end_time)
+        .filter(AvailabilitySlot.freelancer_id == svc.freelancer_id)
+    ]
+    bookings = (
+        db.query(Booking.start_at, Booking.end_at)
+        .filter(
+            Booking.freelancer_id == svc.freelancer_id,
+            Booking.status != BookingStatus.canceled,
+            Booking.start_at < end,
+            Booking.end_at > start,
+        )
+        .all()
+    )
+
+    return {
+        "service_id": svc.id,
+        "duration": svc.duration,
+        "slots": free_slot_starts(slots, bookings, start, end, svc.duration),
+    }
 
 
 # Freelancer/admin only
@@ -60,6 +133,8 @@ def create_service(
     db.add(new_service)
     db.commit()
     db.refresh(new_service)
+    catalog_index.upsert(new_service.id, new_service.title, new_service.description)
+    invalidate_service()
     return new_service
 
 
@@ -77,8 +152,11 @@ def delete_service(
      raise HTTPException(status_code=403, detail="Only admins can delete services")
 
     
+    detach_service_ratings(db, service)
     db.delete(service)
     db.commit()
+    catalog_index.remove(service_id)
+    invalidate_service(service_id)
     return {"message": f"Service with id {service_id} deleted successfully"}
 
 
@@ -103,7 +181,9 @@ def update_service(
 
 
     db.commit()
+    invalidate_service(service_id)
     db.refresh(service)
+    catalog_index.upsert(service.id, service.title, service.description)
     return service
 
 
@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from app.core.deps import get_current_user
+from app.core.deps import get_current_user_model
+from app.core.principal import invalidate_principal
 from app.models.user import User
 from app.database.session import get_db
 from sqlalchemy.orm import Session
@@ -12,7 +13,7 @@ router = APIRouter(
 )
 
 @router.get("/me")
-def read_me(current_user:User= Depends(get_current_user)):
+def read_me(current_user:User= Depends(get_current_user_model)):
     return{
         "id": current_user.id,
         "username": current_user.username,
@@ -21,7 +22,7 @@ def read_me(current_user:User= Depends(get_current_user)):
     }
 
 @router.put("/me")
-def update_profile(payload: UserUpdate, current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+def update_profile(payload: UserUpdate, current_user: User = Depends(get_current_user_model), db: Session = Depends(get_db)):
     updated = False
     # Check username uniqueness
     if payload.username and payload.username != current_user.username:
@@ -48,5 +49,6 @@ def update_profile(payload: UserUpdate, current_user: User = Depends(get_current
         db.add(current_user)
         db.commit()
         db.refresh(current_user)
+        invalidate_principal(current_user.id)
 
     return {"detail": "Profile updated", "user": {"id": current_user.id, "username": current_user.username, "email": current_user.email}}
\ No newline at end of file
@@ -1,14 +1,43 @@
-from pydantic import BaseModel, conint
+from pydantic import BaseModel, conint, model_validator
 from datetime import time
 
-class AvailabilityCreate(BaseModel):
+from app.utils.free_slots import time_to_minutes
+
+# Upper bound on slots per template upload
+MAX_TEMPLATE_SLOTS = 1000
+
+class AvailabilityBase(BaseModel):
     day_of_week: conint(ge=0, le=6)  # 0=Monday, 6=Sunday
     start_time: time
-    end_time: time
+    end_time: time  # 00:00 means "until midnight"
 
-class AvailabilityOut(AvailabilityCreate):
+class AvailabilityCreate(AvailabilityBase):
+    @model_validator(mode="after")
+    def check_order(self):
+        if time_to_minutes(self.end_time, is_end=True) <= time_to_minutes(self.start_time):
+            raise ValueError("end_time must be after start_time")
+        return self
+
+class AvailabilityOut(AvailabilityBase):
     id: int
     freelancer_id: int
 
     class Config:
         orm_mode = True
+
+
+class AvailabilityTemplate(BaseModel):
+    slots: list[AvailabilityCreate]
+
+    @model_validator(mode="after")
+    def check_size(self):
+        if len(self.slots) > MAX_TEMPLATE_SLOTS:
+            raise ValueError(f"At most {MAX_TEMPLATE_SLOTS} slots per template")
+        return self
+
+
+class AvailabilityTemplateOut(BaseModel):
+    slots: list[AvailabilityOut]
+    inserted: int
+    deleted: int
+    unchanged: int
@@ -1,5 +1,8 @@
+import enum
+
 from pydantic import BaseModel, ConfigDict
 from datetime import datetime
+from typing import Optional
 from app.models.booking import BookingStatus
 
 class BookingCreate(BaseModel):
@@ -16,4 +19,31 @@ class BookingOut(BaseModel):
     status: BookingStatus
     created_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+
+
+class BookingPage(BaseModel):
+    items: list[BookingOut]
+    next_cursor: Optional[str] = None
+
+
+class BookingBatchCreate(BaseModel):
+    items: list[BookingCreate]
+
+
+class BatchItemStatus(str, enum.Enum):
+    created = "created"
+    conflict = "conflict"
+    not_found = "not_found"
+
+
+class BookingBatchItemOut(BaseModel):
+    index: int
+    status: BatchItemStatus
+    booking: Optional[BookingOut] = None
+    detail: Optional[str] = None
+
+
+class BookingBatchOut(BaseModel):
+    created: int
+    results: list[BookingBatchItemOut]
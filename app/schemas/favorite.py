@@ -2,13 +2,21 @@
 
 from pydantic import BaseModel
 from datetime import datetime
-from typing import Optional
+from typing import Dict, List, Optional
 
 
 class FavoriteCreate(BaseModel):
     service_id: int
 
 
+class FavoriteStatusRequest(BaseModel):
+    service_ids: List[int]
+
+
+class FavoriteStatusOut(BaseModel):
+    is_favorite: Dict[int, bool]
+
+
 class FavoriteResponse(BaseModel):
     id: int
     user_id: int
@@ -28,3 +36,8 @@ class FavoriteWithService(BaseModel):
 
     class Config:
         orm_mode = True
+
+
+class FavoritePage(BaseModel):
+    items: List[FavoriteWithService]
+    next_cursor: Optional[str] = None
@@ -17,4 +17,12 @@ class ReviewOut(BaseModel):
     created_at: datetime
 
 
-    
\ No newline at end of file
+class ReviewPage(BaseModel):
+    items: list[ReviewOut]
+    next_cursor: str | None = None
+
+
+class RatingSummaryOut(BaseModel):
+    count: int
+    average: float | None
+    histogram: dict[int, int]
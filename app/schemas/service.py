@@ -16,9 +16,31 @@ class ServiceOut(BaseModel):
     duration: int
     freelancer_id: int
     created_at: datetime
+    rating_count: int = 0
+    rating_avg: float | None = None
 
 class ServiceUpdate(BaseModel):
     title: str | None = None
     description: str | None = None
     price: float | None = None
-    duration: int | None = None
\ No newline at end of file
+    duration: int | None = None
+
+class FreeSlotsOut(BaseModel):
+    service_id: int
+    duration: int
+    slots: list[datetime]
+
+class FacetBucket(BaseModel):
+    min: float
+    max: float | None
+    count: int
+
+class SearchFacets(BaseModel):
+    total: int
+    price: list[FacetBucket]
+    duration: list[FacetBucket]
+
+class ServiceSearchOut(BaseModel):
+    items: list[ServiceOut]
+    next_cursor: str | None = None
+    facets: SearchFacets | None = None
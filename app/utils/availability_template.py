@@ -0,0 +1,58 @@
+# app/utils/availability_template.py
+
+from datetime import time
+
+from app.utils.free_slots import MINUTES_PER_DAY, time_to_minutes
+
+# (day_of_week, start_min, end_min); end_min == MINUTES_PER_DAY means "until midnight"
+WeeklyInterval = tuple[int, int, int]
+
+
+def slot_key(day_of_week: int, start_time: time, end_time: time) -> WeeklyInterval:
+    return day_of_week, time_to_minutes(start_time), time_to_minutes(end_time, is_end=True)
+
+
+def minutes_to_time(minutes: int) -> time:
+    # Stored the same way AvailabilityCreate accepts it: midnight end is 00:00
+    return time(0, 0) if minutes >= MINUTES_PER_DAY else time(minutes // 60, minutes % 60)
+
+
+def merge_weekly(intervals: list[WeeklyInterval]) -> list[WeeklyInterval]:
+    """Sweep-line merge of overlapping or touching intervals, per day.
+
+    Returns disjoint, non-adjacent intervals sorted by (day, start). Empty or
+    inverted intervals are dropped.
+    """
+    merged: list[WeeklyInterval] = []
+    for day, start, end in sorted(intervals):
+        if end <= start:
+            continue
+        if merged and merged[-1][0] == day and start <= merged[-1][2]:
+            if end > merged[-1][2]:
+                merged[-1] = (day, merged[-1][1], end)
+        else:
+            merged.append((day, start, end))
+    return merged
+
+
+def overlaps(intervals: list[WeeklyInterval], candidate: WeeklyInterval) -> bool:
+    day, start, end = candidate
+    return any(d == day and s < end and start < e for d, s, e in intervals)
+
+
+def diff_template(existing: list[tuple[int, WeeklyInterval]],
+                  desired: list[WeeklyInterval]) -> tuple[list[int], list[WeeklyInterval], list[int]]:
+    """(ids to delete, intervals to insert, ids kept) turning `existing` rows into `desired`.
+
+    `existing` is (row id, interval); a row is kept only if it exactly matches
+    a desired interval not already claimed by another row, so duplicates go.
+    """
+    wanted = set(desired)
+    delete_ids, keep_ids = [], []
+    for row_id, key in existing:
+        if key in wanted:
+            wanted.discard(key)
+            keep_ids.append(row_id)
+        else:
+            delete_ids.append(row_id)
+    return delete_ids, sorted(wanted), keep_ids
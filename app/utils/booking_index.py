@@ -0,0 +1,241 @@
+# app/utils/booking_index.py
+
+import threading
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from contextlib import ExitStack, contextmanager
+from datetime import datetime, timezone
+
+from sqlalchemy import exists, select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.booking import Booking, BookingStatus
+
+# Statuses that occupy the freelancer's calendar
+ACTIVE_STATUSES = (BookingStatus.pending, BookingStatus.confirmed)
+
+
+def to_epoch(value: datetime) -> int:
+    """Datetime -> epoch seconds. Naive values (SQLite) are treated as UTC."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return int(value.timestamp())
+
+
+class FreelancerCalendar:
+    """Sorted, non-overlapping active bookings of one freelancer.
+
+    Three parallel lists keep bisect lookups O(log n) without tuple allocation.
+    """
+
+    def __init__(self):
+        self.starts: list[int] = []
+        self.ends: list[int] = []
+        self.ids: list[int] = []
+        self.lock = threading.Lock()
+        # Set by BookingIntervalIndex.invalidate while the lock was held; reloaded by the next holder
+        self.stale = False
+
+    def find_conflict(self, start: int, end: int, ignore_id: int | None = None) -> int | None:
+        # Intervals are half-open: a booking ending at 10:00 does not block one starting at 10:00
+        i = bisect_right(self.starts, start)
+        if i > 0 and self.ends[i - 1] > start and self.ids[i - 1] != ignore_id:
+            return self.ids[i - 1]
+        if i < len(self.starts) and self.starts[i] < end and self.ids[i] != ignore_id:
+            return self.ids[i]
+        return None
+
+    def add(self, booking_id: int, start: int, end: int):
+        self.remove(booking_id)
+        i = bisect_left(self.starts, start)
+        self.starts.insert(i, start)
+        self.ends.insert(i, end)
+        self.ids.insert(i, booking_id)
+
+    def remove(self, booking_id: int):
+        try:
+            i = self.ids.index(booking_id)
+        except ValueError:
+            return
+        del self.starts[i], self.ends[i], self.ids[i]
+
+    def __len__(self):
+        return len(self.ids)
+
+
+def active_bookings_query(freelancer_id: int):
+    return (
+        select(Booking.id, Booking.start_at, Booking.end_at)
+        .where(Booking.freelancer_id == freelancer_id, Booking.status.in_(ACTIVE_STATUSES))
+        .order_by(Booking.start_at)
+    )
+
+
+def active_bookings_many_query(freelancer_ids):
+    return (
+        select(Booking.freelancer_id, Booking.id, Booking.start_at, Booking.end_at)
+        .where(Booking.freelancer_id.in_(freelancer_ids), Booking.status.in_(ACTIVE_STATUSES))
+        .order_by(Booking.freelancer_id, Booking.start_at)
+    )
+
+
+def calendars_from_rows(freelancer_ids, rows) -> dict[int, FreelancerCalendar]:
+    """Calendars for every id in `freelancer_ids` from (freelancer_id, id, start_at, end_at) rows."""
+    grouped: dict[int, list] = {freelancer_id: [] for freelancer_id in freelancer_ids}
+    for freelancer_id, booking_id, start_at, end_at in rows:
+        grouped[freelancer_id].append((booking_id, start_at, end_at))
+    return {freelancer_id: calendar_from_rows(group) for freelancer_id, group in grouped.items()}
+
+
+def calendar_from_rows(rows) -> FreelancerCalendar:
+    """Build a calendar from (id, start_at, end_at) rows sorted by start_at."""
+    cal = FreelancerCalendar()
+    for booking_id, start_at, end_at in rows:
+        cal.starts.append(to_epoch(start_at))
+        cal.ends.append(to_epoch(end_at))
+        cal.ids.append(booking_id)
+    return cal
+
+
+class BookingIntervalIndex:
+    """In-process interval index of active bookings, keyed by freelancer_id.
+
+    Calendars are loaded lazily from the `bookings` table and then kept in sync
+    by the write paths in app/routers/Booking.py. The database exclusion
+    constraint (migration 002) remains the cross-worker guarantee; this index
+    only makes the common "slot is free" answer cheap.
+
+    At most `max_freelancers` calendars are kept, least recently used evicted
+    first. A calendar whose lock is held (a booking being written) is never
+    dropped, by eviction or `invalidate`, so writers of one freelancer always
+    serialize on the same lock; `locked` hands calendars out that way.
+    """
+
+    def __init__(self, max_freelancers: int):
+        self.max_freelancers = max_freelancers
+        self._calendars: OrderedDict[int, FreelancerCalendar] = OrderedDict()
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def calendar(self, db: Session, freelancer_id: int) -> FreelancerCalendar:
+        cal = self.get(freelancer_id)
+        if cal is None:
+            cal = self.install(freelancer_id, calendar_from_rows(
+                db.execute(active_bookings_query(freelancer_id)).all()
+            ))
+        return cal
+
+    def calendars(self, db: Session, freelancer_ids) -> dict[int, FreelancerCalendar]:
+        """Like `calendar` for many freelancers, loading the missing ones in one query."""
+        found = {fid: self.get(fid) for fid in freelancer_ids}
+        missing = [fid for fid, cal in found.items() if cal is None]
+        if missing:
+            loaded = calendars_from_rows(missing, db.execute(active_bookings_many_query(missing)).all())
+            for fid, cal in loaded.items():
+                found[fid] = self.install(fid, cal)
+        return found
+
+    @contextmanager
+    def locked(self, db: Session, freelancer_id: int):
+        """`calendar`, with its lock held for the block.
+
+        An eviction or `invalidate` between the lookup and the lock would
+        leave the caller checking a calendar that the next request no longer
+        sees, so the lookup is retried until the locked one is still indexed.
+        """
+        with self._locked_many(db, lambda: {freelancer_id: self.calendar(db, freelancer_id)}) as calendars:
+            yield calendars[freelancer_id]
+
+    def locked_many(self, db: Session, freelancer_ids):
+        """`locked` for several freelancers, locking in id order so two callers can't deadlock."""
+        return self._locked_many(db, lambda: self.calendars(db, freelancer_ids))
+
+    @contextmanager
+    def _locked_many(self, db: Session, load):
+        while True:
+            calendars = load()
+            with ExitStack() as locks:
+                for fid in sorted(calendars):
+                    locks.enter_context(calendars[fid].lock)
+                if all(self.get(fid) is cal for fid, cal in calendars.items()):
+                    for fid, cal in calendars.items():
+                        if cal.stale:
+                            self.reload(db, fid, cal)
+                    yield calendars
+                    return
+
+    def reload(self, db: Session, freelancer_id: int, cal: FreelancerCalendar):
+        """Refill `cal` from the database in place; the caller holds `cal.lock`.
+
+        Unlike `invalidate`, other requests keep waiting on the same lock.
+        """
+        fresh = calendar_from_rows(db.execute(active_bookings_query(freelancer_id)).all())
+        cal.starts, cal.ends, cal.ids = fresh.starts, fresh.ends, fresh.ids
+        cal.stale = False
+
+    def get(self, freelancer_id: int) -> FreelancerCalendar | None:
+        with self._lock:
+            cal = self._calendars.get(freelancer_id)
+            if cal is not None:
+                self._calendars.move_to_end(freelancer_id)
+            return cal
+
+    def install(self, freelancer_id: int, cal: FreelancerCalendar) -> FreelancerCalendar:
+        """Register a freshly loaded calendar; if another thread got there first, its calendar wins."""
+        with self._lock:
+            cal = self._calendars.setdefault(freelancer_id, cal)
+            self._calendars.move_to_end(freelancer_id)
+            self._evict()
+            return cal
+
+    def discard(self, freelancer_id: int, booking_id: int):
+        with self._lock:
+            cal = self._calendars.get(freelancer_id)
+        if cal is not None:
+            with cal.lock:
+                cal.remove(booking_id)
+
+    def invalidate(self, freelancer_id: int | None = None):
+        with self._lock:
+            for fid in list(self._calendars) if freelancer_id is None else [freelancer_id]:
+                cal = self._calendars.get(fid)
+                if cal is None:
+                    continue
+                if cal.lock.locked():
+                    # Mid-booking: a fresh copy would let the next request check it in parallel
+                    cal.stale = True
+                else:
+                    del self._calendars[fid]
+
+    def _evict(self):
+        while len(self._calendars) > self.max_freelancers:
+            victim = next((fid for fid, cal in self._calendars.items() if not cal.lock.locked()), None)
+            if victim is None:
+                return
+            del self._calendars[victim]
+            self.evictions += 1
+
+    def __len__(self):
+        return len(self._calendars)
+
+
+def has_db_conflict(db: Session, freelancer_id: int, start_at: datetime, end_at: datetime,
+                    ignore_id: int | None = None) -> bool:
+    """Authoritative overlap check against the database."""
+    return db.scalar(db_conflict_query(freelancer_id, start_at, end_at, ignore_id))
+
+
+def db_conflict_query(freelancer_id: int, start_at: datetime, end_at: datetime, ignore_id: int | None = None):
+    conditions = [
+        Booking.freelancer_id == freelancer_id,
+        Booking.status.in_(ACTIVE_STATUSES),
+        Booking.start_at < end_at,
+        Booking.end_at > start_at,
+    ]
+    if ignore_id is not None:
+        conditions.append(Booking.id != ignore_id)
+    return select(exists().where(*conditions))
+
+
+booking_index = BookingIntervalIndex(max_freelancers=settings.BOOKING_INDEX_MAX_FREELANCERS)
@@ -0,0 +1,273 @@
+# app/utils/calendar_cache.py
+
+import threading
+import time as clock
+from collections import OrderedDict
+from datetime import date, datetime, time, timedelta, timezone
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.availability import AvailabilitySlot
+from app.models.booking import Booking
+from app.utils.booking_index import ACTIVE_STATUSES, has_db_conflict
+from app.utils.free_slots import utc
+
+GRANULARITY = 5  # minutes per cell
+CELLS_PER_DAY = 24 * 60 // GRANULARITY
+
+
+def cell_span(start: datetime, end: datetime) -> list[tuple[date, int, int]]:
+    """Split [start, end) into (day, first_cell, last_cell_exclusive) pieces.
+
+    Partial cells are rounded outwards so an occupied minute always marks its cell.
+    """
+    start, end = utc(start), utc(end)
+    pieces = []
+    day = start.date()
+    while True:
+        day_start = datetime.combine(day, time(0), tzinfo=timezone.utc)
+        lo = max(start, day_start) - day_start
+        hi = min(end, day_start + timedelta(days=1)) - day_start
+        first = int(lo.total_seconds() // (GRANULARITY * 60))
+        last = -int(-hi.total_seconds() // (GRANULARITY * 60))
+        if last > first:
+            pieces.append((day, first, last))
+        day += timedelta(days=1)
+        if datetime.combine(day, time(0), tzinfo=timezone.utc) >= end:
+            return pieces
+
+
+def slot_cells(start_time: time, end_time: time) -> tuple[int, int]:
+    """Availability cells (first, last_exclusive) of a weekly slot.
+
+    Partial cells are rounded inwards, the opposite of cell_span: a cell is
+    available only if the whole of it is. Ranges touching a slot's
+    unaligned edge are answered "not free", never wrongly "free".
+    """
+    cell = GRANULARITY * 60
+    start = start_time.hour * 3600 + start_time.minute * 60 + start_time.second
+    end = end_time.hour * 3600 + end_time.minute * 60 + end_time.second
+    # An end time of 00:00 means "until midnight"
+    first, last = -(-start // cell), (CELLS_PER_DAY if end == 0 else end // cell)
+    return first, max(first, last)
+
+
+class FreelancerBitmaps:
+    """Occupancy of one freelancer at GRANULARITY-minute resolution.
+
+    Cells are uint8 counters rather than bits so removing one of two
+    overlapping bookings/slots leaves the other one's cells marked.
+    """
+
+    def __init__(self):
+        self.loaded_at = clock.monotonic()
+        self.weekly: np.ndarray | None = None       # (7, CELLS_PER_DAY) availability template
+        self.days: OrderedDict[date, np.ndarray] = OrderedDict()  # booked cells per UTC day
+
+    @property
+    def nbytes(self) -> int:
+        weekly = self.weekly.nbytes if self.weekly is not None else 0
+        return weekly + sum(day.nbytes for day in self.days.values())
+
+
+class CalendarCache:
+    """Bounded LRU of per-freelancer day bitmaps.
+
+    Bitmaps are built lazily from SQL and then updated incrementally by the
+    booking and availability write paths. Loads happen outside the lock; a
+    per-freelancer version counter drops a load that raced with a write so a
+    stale snapshot is never cached.
+
+    Only this worker's write paths update its bitmaps. Entries are reloaded
+    after `ttl` seconds, which bounds how long another worker's changes go
+    unseen, and a "free" answer is confirmed against the bookings table so
+    a booking made elsewhere is never reported as free.
+    """
+
+    def __init__(self, max_freelancers: int, max_days: int, ttl: float):
+        self.max_freelancers = max_freelancers
+        self.max_days = max_days
+        self.ttl = ttl
+        self._entries: OrderedDict[int, FreelancerBitmaps] = OrderedDict()
+        self._versions: dict[int, int] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.confirm_misses = 0
+
+    # ---- reads -------------------------------------------------------------
+
+    def is_free(self, db: Session, freelancer_id: int, start: datetime, end: datetime) -> bool:
+        """True if [start, end) lies inside availability and overlaps no active booking."""
+        pieces = cell_span(start, end)
+        weekly = self._weekly(db, freelancer_id)
+        busy = self._days(db, freelancer_id, [day for day, _, _ in pieces])
+        for day, first, last in pieces:
+            if not weekly[day.weekday(), first:last].all():
+                return False
+            if busy[day][first:last].any():
+                return False
+        # The bitmaps may predate a booking made on another worker
+        if has_db_conflict(db, freelancer_id, utc(start), utc(end)):
+            self.confirm_misses += 1
+            return False
+        return True
+
+    def _weekly(self, db: Session, freelancer_id: int) -> np.ndarray:
+        with self._lock:
+            entry = self._touch(freelancer_id)
+            if entry is not None and entry.weekly is not None:
+                self.hits += 1
+                return entry.weekly
+            self.misses += 1
+            version = self._versions.get(freelancer_id, 0)
+
+        weekly = np.zeros((7, CELLS_PER_DAY), dtype=np.uint8)
+        rows = (
+            db.query(AvailabilitySlot.day_of_week, AvailabilitySlot.start_time, AvailabilitySlot.end_time)
+            .filter(AvailabilitySlot.freelancer_id == freelancer_id)
+            .all()
+        )
+        for day_of_week, start_time, end_time in rows:
+            first, last = slot_cells(start_time, end_time)
+            weekly[day_of_week, first:last] += 1
+
+        with self._lock:
+            if self._versions.get(freelancer_id, 0) == version:
+                self._entry(freelancer_id).weekly = weekly
+        return weekly
+
+    def _days(self, db: Session, freelancer_id: int, days: list[date]) -> dict[date, np.ndarray]:
+        result: dict[date, np.ndarray] = {}
+        with self._lock:
+            entry = self._touch(freelancer_id)
+            for day in days:
+                if entry is not None and day in entry.days:
+                    entry.days.move_to_end(day)
+                    result[day] = entry.days[day]
+                    self.hits += 1
+            missing = [day for day in days if day not in result]
+            self.misses += len(missing)
+            version = self._versions.get(freelancer_id, 0)
+        if not missing:
+            return result
+
+        # One query covers every missing day
+        loaded = {day: np.zeros(CELLS_PER_DAY, dtype=np.uint8) for day in missing}
+        lo = datetime.combine(min(missing), time(0), tzinfo=timezone.utc)
+        hi = datetime.combine(max(missing) + timedelta(days=1), time(0), tzinfo=timezone.utc)
+        rows = (
+            db.query(Booking.start_at, Booking.end_at)
+            .filter(
+                Booking.freelancer_id == freelancer_id,
+                Booking.status.in_(ACTIVE_STATUSES),
+                Booking.start_at < hi,
+                Booking.end_at > lo,
+            )
+            .all()
+        )
+        for start_at, end_at in rows:
+            for day, first, last in cell_span(start_at, end_at):
+                if day in loaded:
+                    loaded[day][first:last] += 1
+        result.update(loaded)
+
+        with self._lock:
+            if self._versions.get(freelancer_id, 0) == version:
+                entry = self._entry(freelancer_id)
+                entry.days.update(loaded)
+                while len(entry.days) > self.max_days:
+                    entry.days.popitem(last=False)
+        return result
+
+    # ---- incremental updates from write paths --------------------------------
+
+    def apply_booking(self, freelancer_id: int, start: datetime, end: datetime, delta: int):
+        """Add (+1) or remove (-1) an active booking from cached days."""
+        with self._lock:
+            self._versions[freelancer_id] = self._versions.get(freelancer_id, 0) + 1
+            entry = self._entries.get(freelancer_id)
+            if entry is None:
+                return
+            for day, first, last in cell_span(start, end):
+                bitmap = entry.days.get(day)
+                if bitmap is not None:
+                    self._bump(bitmap[first:last], delta)
+
+    def apply_slot(self, freelancer_id: int, day_of_week: int, start_time: time, end_time: time, delta: int):
+        """Add (+1) or remove (-1) a weekly availability slot."""
+        with self._lock:
+            self._versions[freelancer_id] = self._versions.get(freelancer_id, 0) + 1
+            entry = self._entries.get(freelancer_id)
+            if entry is None or entry.weekly is None:
+                return
+            first, last = slot_cells(start_time, end_time)
+            self._bump(entry.weekly[day_of_week, first:last], delta)
+
+    def invalidate(self, freelancer_id: int | None = None):
+        with self._lock:
+            if freelancer_id is None:
+                self._entries.clear()
+            else:
+                self._versions[freelancer_id] = self._versions.get(freelancer_id, 0) + 1
+                self._entries.pop(freelancer_id, None)
+
+    @staticmethod
+    def _bump(cells: np.ndarray, delta: int):
+        if delta > 0:
+            cells += 1
+        else:
+            # Never wrap below zero if a removal arrives for a row the load already missed
+            np.subtract(cells, 1, out=cells, where=cells > 0)
+
+    # ---- LRU bookkeeping (caller holds the lock) -----------------------------
+
+    def _touch(self, freelancer_id: int) -> FreelancerBitmaps | None:
+        entry = self._entries.get(freelancer_id)
+        if entry is not None:
+            if clock.monotonic() - entry.loaded_at >= self.ttl:
+                del self._entries[freelancer_id]
+                self.expirations += 1
+                return None
+            self._entries.move_to_end(freelancer_id)
+        return entry
+
+    def _entry(self, freelancer_id: int) -> FreelancerBitmaps:
+        entry = self._entries.get(freelancer_id)
+        if entry is None:
+            entry = self._entries[freelancer_id] = FreelancerBitmaps()
+            while len(self._entries) > self.max_freelancers:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        self._entries.move_to_end(freelancer_id)
+        return entry
+
+    def stats(self) -> dict:
+        with self._lock:
+            per_freelancer = {fid: entry.nbytes for fid, entry in self._entries.items()}
+            lookups = self.hits + self.misses
+            return {
+                "granularity_minutes": GRANULARITY,
+                "freelancers": len(self._entries),
+                "max_freelancers": self.max_freelancers,
+                "days_cached": sum(len(entry.days) for entry in self._entries.values()),
+                "bytes": sum(per_freelancer.values()),
+                "bytes_per_freelancer": per_freelancer,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "confirm_misses": self.confirm_misses,
+            }
+
+
+calendar_cache = CalendarCache(
+    max_freelancers=settings.CALENDAR_CACHE_MAX_FREELANCERS,
+    max_days=settings.CALENDAR_CACHE_MAX_DAYS,
+    ttl=settings.CALENDAR_CACHE_TTL_S,
+)
@@ -0,0 +1,175 @@
+# app/utils/catalog_search.py
+
+import enum
+from bisect import bisect_right
+from datetime import datetime
+
+from fastapi import HTTPException
+from sqlalchemy import Double, and_, bindparam, case, cast, false, func, select, tuple_
+from sqlalchemy.orm import Session
+
+from app.models.rating import ServiceRating
+from app.models.service import SEARCH_CONFIG, Service, search_document
+from app.utils.pagination import PageParams, decode_key, encode_key, instant
+from app.utils.search_index import catalog_index
+
+# Facet bucket lower edges; the last bucket is open-ended
+PRICE_BUCKETS = (0, 25, 50, 100, 250, 500)
+DURATION_BUCKETS = (0, 30, 60, 120, 240)
+
+
+class SearchSort(str, enum.Enum):
+    relevance = "relevance"
+    price_asc = "price_asc"
+    price_desc = "price_desc"
+    rating = "rating"
+    newest = "newest"
+
+
+def bucket_ranges(edges) -> list[tuple[float, float | None]]:
+    return list(zip(edges, list(edges[1:]) + [None]))
+
+
+def in_bucket(column, low, high):
+    return column >= low if high is None else and_(column >= low, column < high)
+
+
+def filter_conditions(min_price=None, max_price=None, min_duration=None, max_duration=None,
+                      freelancer_id=None) -> list:
+    conditions = []
+    if min_price is not None:
+        conditions.append(Service.price >= min_price)
+    if max_price is not None:
+        conditions.append(Service.price <= max_price)
+    if min_duration is not None:
+        conditions.append(Service.duration >= min_duration)
+    if max_duration is not None:
+        conditions.append(Service.duration <= max_duration)
+    if freelancer_id is not None:
+        conditions.append(Service.freelancer_id == freelancer_id)
+    return conditions
+
+
+def facet_counts(db: Session, conditions: list) -> dict:
+    """Total matches plus price/duration bucket counts, in one pass."""
+    price = bucket_ranges(PRICE_BUCKETS)
+    duration = bucket_ranges(DURATION_BUCKETS)
+    columns = [func.count()]
+    columns += [func.sum(case((in_bucket(Service.price, low, high), 1), else_=0)) for low, high in price]
+    columns += [func.sum(case((in_bucket(Service.duration, low, high), 1), else_=0)) for low, high in duration]
+    row = db.execute(select(*columns).select_from(Service).where(*conditions)).one()
+    counts = [count or 0 for count in row]
+    return {
+        "total": counts[0],
+        "price": [{"min": low, "max": high, "count": count}
+                  for (low, high), count in zip(price, counts[1:1 + len(price)])],
+        "duration": [{"min": low, "max": high, "count": count}
+                     for (low, high), count in zip(duration, counts[1 + len(price):])],
+    }
+
+
+def read_cursor(page: PageParams, sort: SearchSort) -> tuple | None:
+    if not page.cursor:
+        return None
+    key = decode_key(page.cursor)
+    if len(key) != 3 or key[0] != sort.value:
+        raise HTTPException(status_code=400, detail="Cursor does not match this search")
+    value, row_id = key[1], key[2]
+    try:
+        if sort == SearchSort.newest:
+            value = datetime.fromisoformat(value)
+        return value, int(row_id)
+    except (TypeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def write_cursor(sort: SearchSort, value, row_id: int) -> str:
+    return encode_key([sort.value, value.isoformat() if isinstance(value, datetime) else value, row_id])
+
+
+def sql_page(db: Session, conditions: list, sort: SearchSort, rank, page: PageParams) -> tuple[list, str | None]:
+    """Keyset page ordered in SQL by (sort value, id)."""
+    stmt = select(Service)
+    if sort == SearchSort.relevance:
+        key, descending = rank, True
+    elif sort == SearchSort.rating:
+        stmt = stmt.outerjoin(ServiceRating, ServiceRating.service_id == Service.id)
+        average = cast(ServiceRating.total, Double) / func.nullif(ServiceRating.count, 0)
+        key, descending = func.coalesce(average, 0.0), True
+    elif sort == SearchSort.newest:
+        key, descending = Service.created_at, True
+    else:
+        key, descending = Service.price, sort == SearchSort.price_desc
+
+    stmt = stmt.add_columns(key.label("sort_value")).where(*conditions)
+    cursor = read_cursor(page, sort)
+    if cursor is not None:
+        value, row_id = cursor
+        if sort == SearchSort.newest:
+            left, right = tuple_(instant(key), Service.id), tuple_(instant(value, type_=key.type), row_id)
+        else:
+            left, right = tuple_(key, Service.id), tuple_(value, row_id)
+        stmt = stmt.where(left < right if descending else left > right)
+    order = (key.desc(), Service.id.desc()) if descending else (key.asc(), Service.id.asc())
+    rows = db.execute(stmt.order_by(*order).limit(page.limit + 1)).all()
+
+    items = [service for service, _ in rows[:page.limit]]
+    next_cursor = None
+    if len(rows) > page.limit:
+        last, value = rows[page.limit - 1]
+        next_cursor = write_cursor(sort, value, last.id)
+    return items, next_cursor
+
+
+def scored_page(db: Session, conditions: list, scores: dict[int, float], page: PageParams) -> tuple[list, str | None]:
+    """Relevance page for the in-process index: SQL filters, ordering in Python."""
+    matching = db.scalars(select(Service.id).where(*conditions)).all()
+    # Ascending on (-score, -id) == descending on (score, id)
+    ordered = sorted((-scores[sid], -sid) for sid in matching)
+    start = 0
+    cursor = read_cursor(page, SearchSort.relevance)
+    if cursor is not None:
+        start = bisect_right(ordered, (-cursor[0], -cursor[1]))
+    window = ordered[start:start + page.limit + 1]
+
+    ids = [-neg_id for _, neg_id in window[:page.limit]]
+    by_id = {svc.id: svc for svc in db.scalars(select(Service).where(Service.id.in_(ids)))} if ids else {}
+    items = [by_id[sid] for sid in ids if sid in by_id]
+    next_cursor = None
+    if len(window) > page.limit:
+        neg_score, neg_id = window[page.limit - 1]
+        next_cursor = write_cursor(SearchSort.relevance, -neg_score, -neg_id)
+    return items, next_cursor
+
+
+def search_catalog(db: Session, q: str | None, sort: SearchSort, page: PageParams,
+                   with_facets: bool = True, **filters) -> dict:
+    conditions = filter_conditions(**filters)
+    terms = (q or "").strip()
+    if not terms and sort == SearchSort.relevance:
+        sort = SearchSort.newest
+
+    rank = scores = None
+    if terms and db.get_bind().dialect.name == "postgresql":
+        tsquery = func.websearch_to_tsquery(SEARCH_CONFIG, terms)
+        conditions.append(search_document().bool_op("@@")(tsquery))
+        # float8 so the rank round-trips exactly through the cursor
+        rank = cast(func.ts_rank_cd(search_document(), tsquery), Double)
+    elif terms:
+        scores = catalog_index.search(db, terms)
+        # Inline the ids: the candidate set can exceed SQLite's bound-parameter limit
+        conditions.append(
+            Service.id.in_(bindparam("catalog_ids", list(scores), expanding=True, literal_execute=True))
+            if scores else false()
+        )
+
+    if scores is not None and sort == SearchSort.relevance:
+        items, next_cursor = scored_page(db, conditions, scores, page)
+    else:
+        items, next_cursor = sql_page(db, conditions, sort, rank, page)
+
+    return {
+        "items": items,
+        "next_cursor": next_cursor,
+        "facets": facet_counts(db, conditions) if with_facets else None,
+    }
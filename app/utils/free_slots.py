@@ -0,0 +1,126 @@
+# app/utils/free_slots.py
+
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+MINUTES_PER_DAY = 24 * 60
+
+# Longest range a single free-slot query may cover
+MAX_RANGE = timedelta(days=92)
+
+
+def utc(value: datetime) -> datetime:
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+
+
+def time_to_minutes(value, is_end: bool = False) -> int:
+    minutes = value.hour * 60 + value.minute
+    # An end time of 00:00 means "until midnight"
+    return MINUTES_PER_DAY if is_end and minutes == 0 else minutes
+
+
+def day_floor(value: datetime) -> datetime:
+    return value.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def to_minutes(values: list[datetime], origin: datetime, round_up: bool = False) -> np.ndarray:
+    """Datetimes -> integer minute offsets from `origin`, floored (or ceiled with `round_up`).
+
+    Naive values are treated as UTC.
+    """
+    base = origin.timestamp()
+    seconds = np.fromiter(
+        ((v if v.tzinfo else v.replace(tzinfo=timezone.utc)).timestamp() - base for v in values),
+        dtype=np.float64,
+        count=len(values),
+    )
+    return (np.ceil(seconds / 60) if round_up else np.floor(seconds / 60)).astype(np.int64)
+
+
+def expand_weekly(slots: list[tuple[int, int, int]], origin: datetime, days: int) -> tuple[np.ndarray, np.ndarray]:
+    """Expand weekly (day_of_week, start_min, end_min) rows into concrete windows.
+
+    Returns minute offsets from `origin` (midnight of its first day).
+    day_of_week follows AvailabilityCreate: 0=Monday, 6=Sunday.
+    """
+    if not slots or days <= 0:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty
+    dow, start, end = (np.asarray(col, dtype=np.int64) for col in zip(*slots))
+    day_idx = np.arange(days, dtype=np.int64)
+    weekday = (origin.weekday() + day_idx) % 7
+    hit_day, hit_slot = np.nonzero(weekday[:, None] == dow[None, :])
+    base = hit_day * MINUTES_PER_DAY
+    win_start, win_end = base + start[hit_slot], base + end[hit_slot]
+    valid = win_end > win_start
+    return win_start[valid], win_end[valid]
+
+
+def subtract_intervals(win_start: np.ndarray, win_end: np.ndarray,
+                       busy_start: np.ndarray, busy_end: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Union of windows minus union of busy intervals, as merged half-open segments.
+
+    A single sweep over all boundary points: a point is free when at least one
+    window is open and no busy interval is.
+    """
+    points = np.concatenate([win_start, win_end, busy_start, busy_end])
+    if points.size == 0:
+        return points, points
+    n_win, n_busy = win_start.size, busy_start.size
+    avail_delta = np.concatenate([np.ones(n_win), -np.ones(n_win), np.zeros(2 * n_busy)]).astype(np.int64)
+    busy_delta = np.concatenate([np.zeros(2 * n_win), np.ones(n_busy), -np.ones(n_busy)]).astype(np.int64)
+
+    order = np.argsort(points, kind="stable")
+    points = points[order]
+    avail = np.cumsum(avail_delta[order])
+    busy = np.cumsum(busy_delta[order])
+
+    free = ((avail > 0) & (busy == 0))[:-1]
+    seg_start = points[:-1][free]
+    seg_end = points[1:][free]
+    keep = seg_end > seg_start
+    seg_start, seg_end = seg_start[keep], seg_end[keep]
+    if seg_start.size == 0:
+        return seg_start, seg_end
+
+    # Glue touching pieces back together so the duration grid isn't reset mid-window
+    new_group = np.concatenate([[True], seg_start[1:] != seg_end[:-1]])
+    group_end_idx = np.concatenate([np.nonzero(new_group)[0][1:] - 1, [seg_end.size - 1]])
+    return seg_start[new_group], seg_end[group_end_idx]
+
+
+def grid_starts(seg_start: np.ndarray, seg_end: np.ndarray, duration: int) -> np.ndarray:
+    """Start minutes of every `duration`-long slot that fits in each segment."""
+    counts = (seg_end - seg_start) // duration
+    total = int(counts.sum())
+    if total == 0:
+        return np.empty(0, dtype=np.int64)
+    first = np.repeat(seg_start, counts)
+    step = np.arange(total, dtype=np.int64) - np.repeat(np.cumsum(counts) - counts, counts)
+    return first + step * duration
+
+
+def free_slot_starts(slots: list[tuple[int, int, int]], bookings: list[tuple[datetime, datetime]],
+                     start: datetime, end: datetime, duration: int) -> list[str]:
+    """Bookable start times in [start, end) as ISO-8601 UTC strings."""
+    origin = day_floor(start)
+    days = (day_floor(end) - origin).days + 1
+
+    win_start, win_end = expand_weekly(slots, origin, days)
+    lo = to_minutes([start], origin, round_up=True)[0]
+    hi = to_minutes([end], origin)[0]
+    # Only the ends are clipped: the grid runs from the window's own start
+    # (09:00, 09:30, ...) and starts before `lo` are dropped afterwards
+    win_start, win_end = np.minimum(win_start, hi), np.minimum(win_end, hi)
+
+    # Partial minutes count as busy: starts round down, ends up
+    busy_start = to_minutes([b[0] for b in bookings], origin)
+    busy_end = to_minutes([b[1] for b in bookings], origin, round_up=True)
+
+    seg_start, seg_end = subtract_intervals(win_start, win_end, busy_start, busy_end)
+    starts = grid_starts(seg_start, seg_end, duration)
+    starts = starts[starts >= lo]
+
+    stamps = np.datetime64(origin.replace(tzinfo=None), "m") + starts.astype("timedelta64[m]")
+    return np.char.add(np.datetime_as_string(stamps, unit="m"), "Z").tolist()
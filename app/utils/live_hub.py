@@ -0,0 +1,301 @@
+# app/utils/live_hub.py
+#
+# Live updates for booking pages. Routers publish booking and availability
+# changes after they commit; the GET /live/... streams (app/routers/live.py)
+# subscribe per freelancer. The hub lives on the event loop: publish() is
+# safe from the threadpool that runs sync routes. Each subscriber holds at
+# most LIVE_QUEUE_SIZE undelivered events; one that falls further behind is
+# sent a single "resync" instead of buffering without bound.
+#
+# Delivery is best effort. A client that reconnects or gets "resync"
+# refetches /services/{id}/free-slots or /bookings/ and carries on.
+
+import asyncio
+import json
+import logging
+from datetime import datetime, time
+
+from sqlalchemy.engine import make_url
+
+from app.core.config import settings
+
+logger = logging.getLogger("app.live")
+
+AVAILABILITY_SLOT_CREATED = "availability.slot_created"
+AVAILABILITY_SLOT_DELETED = "availability.slot_deleted"
+AVAILABILITY_REPLACED = "availability.replaced"
+
+RESYNC = "event: resync\ndata: {}\n\n"
+# Postgres channel shared by all workers; payloads stay far below NOTIFY's 8000-byte limit
+PG_CHANNEL = "live_events"
+RECONNECT_MAX_S = 30
+
+
+def sse_frame(event_type: str, data: dict) -> str:
+    return f"event: {event_type}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n"
+
+
+def _wake(waiter: asyncio.Future):
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class Subscription:
+    """One stream's pending frames. Touched only on the event loop."""
+
+    __slots__ = ("freelancer_id", "maxsize", "pending", "lagged", "_waiter")
+
+    def __init__(self, freelancer_id: int, maxsize: int):
+        self.freelancer_id = freelancer_id
+        self.maxsize = maxsize
+        self.pending: list[str] = []
+        self.lagged = False
+        self._waiter: asyncio.Future | None = None
+
+    def push(self, frame: str) -> bool:
+        """Queue a frame; False if the subscriber was too far behind and must resync."""
+        if self.lagged:
+            return False
+        if len(self.pending) >= self.maxsize:
+            self.pending.clear()
+            self.lagged = True
+        else:
+            self.pending.append(frame)
+        if self._waiter is not None:
+            _wake(self._waiter)
+        return not self.lagged
+
+    def resync(self):
+        self.pending.clear()
+        self.lagged = True
+        if self._waiter is not None:
+            _wake(self._waiter)
+
+    async def wait(self, timeout: float) -> list[str]:
+        """Frames queued since the last call (just RESYNC after an overflow); [] after `timeout` seconds."""
+        if not self.pending and not self.lagged:
+            # A bare timer is cheaper than asyncio.wait_for, which matters at thousands of streams
+            loop = asyncio.get_running_loop()
+            self._waiter = loop.create_future()
+            timer = loop.call_later(timeout, _wake, self._waiter)
+            try:
+                await self._waiter
+            finally:
+                timer.cancel()
+                self._waiter = None
+        if self.lagged:
+            self.lagged = False
+            return [RESYNC]
+        frames, self.pending = self.pending, []
+        return frames
+
+
+class LocalBackend:
+    """Fan-out inside this worker only."""
+
+    name = "local"
+
+    async def start(self, deliver):
+        self.deliver = deliver
+
+    async def stop(self):
+        pass
+
+    def publish(self, freelancer_id: int, frame: str):
+        self.deliver(freelancer_id, frame)
+
+
+class PostgresBackend:
+    """Fan-out across workers with LISTEN/NOTIFY on one asyncpg connection.
+
+    Every worker, the publishing one included, delivers what it hears on
+    PG_CHANNEL. Notifications sent while the connection was down are lost,
+    so local subscribers are told to resync once it is back.
+    """
+
+    name = "postgres"
+
+    def __init__(self, dsn: str):
+        self.dsn = dsn
+        self._outgoing: asyncio.Queue[str] = asyncio.Queue()
+        self._unsent: str | None = None
+        self._task: asyncio.Task | None = None
+
+    async def start(self, deliver):
+        self.deliver = deliver
+        self._task = asyncio.create_task(self._run(), name="live-postgres")
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+
+    def publish(self, freelancer_id: int, frame: str):
+        self._outgoing.put_nowait(json.dumps([freelancer_id, frame]))
+
+    def _on_notify(self, _conn, _pid, _channel, payload: str):
+        try:
+            freelancer_id, frame = json.loads(payload)
+        except ValueError:
+            logger.warning("ignoring malformed live notification %r", payload[:200])
+            return
+        self.deliver(freelancer_id, frame)
+
+    async def _run(self):
+        import asyncpg
+
+        delay, first = 1.0, True
+        while True:
+            conn = None
+            try:
+                conn = await asyncpg.connect(self.dsn)
+                await conn.add_listener(PG_CHANNEL, self._on_notify)
+                if not first:
+                    logger.info("live notifications reconnected")
+                    self.deliver(None, RESYNC)
+                first, delay = False, 1.0
+                # Sends go out in publish order; a NOTIFY that fails is retried after reconnecting
+                while True:
+                    if self._unsent is None:
+                        self._unsent = await self._outgoing.get()
+                    await conn.execute("SELECT pg_notify($1, $2)", PG_CHANNEL, self._unsent)
+                    self._unsent = None
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("live notifications connection failed, retrying in %.0fs", delay)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, RECONNECT_MAX_S)
+            finally:
+                if conn is not None and not conn.is_closed():
+                    conn.terminate()
+
+
+def postgres_dsn(url) -> str:
+    # asyncpg takes a plain libpq URL, without the SQLAlchemy driver suffix
+    return make_url(url).set(drivername="postgresql").render_as_string(hide_password=False)
+
+
+class LiveHub:
+    """Per-freelancer fan-out of pre-rendered SSE frames to this worker's subscribers."""
+
+    def __init__(self):
+        self._subscribers: dict[int, set[Subscription]] = {}
+        self._count = 0
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._backend = None
+        self.published = 0
+        self.delivered = 0
+        self.lagged = 0
+
+    async def start(self):
+        if settings.LIVE_BACKEND == "postgres":
+            from app.database.connection import engine
+            backend = PostgresBackend(postgres_dsn(engine.url))
+        elif settings.LIVE_BACKEND == "local":
+            backend = LocalBackend()
+        else:
+            raise RuntimeError(f"Unknown LIVE_BACKEND {settings.LIVE_BACKEND!r} (expected local or postgres)")
+        await backend.start(self.deliver)
+        self._backend = backend
+        self._loop = asyncio.get_running_loop()
+
+    async def stop(self):
+        self._loop = None
+        if self._backend is not None:
+            await self._backend.stop()
+        # Wake every stream: it sends "resync" and ends, and the client reconnects elsewhere
+        self.deliver(None, RESYNC)
+
+    @property
+    def running(self) -> bool:
+        return self._loop is not None
+
+    @property
+    def full(self) -> bool:
+        return self._count >= settings.LIVE_MAX_SUBSCRIBERS
+
+    def subscribe(self, freelancer_id: int) -> Subscription:
+        sub = Subscription(freelancer_id, settings.LIVE_QUEUE_SIZE)
+        self._subscribers.setdefault(freelancer_id, set()).add(sub)
+        self._count += 1
+        return sub
+
+    def unsubscribe(self, sub: Subscription):
+        subs = self._subscribers.get(sub.freelancer_id)
+        if subs is not None and sub in subs:
+            subs.discard(sub)
+            self._count -= 1
+            if not subs:
+                del self._subscribers[sub.freelancer_id]
+
+    def publish(self, freelancer_id: int, event_type: str, data: dict):
+        """Send an event to the freelancer's subscribers on every worker. Any thread; never blocks."""
+        loop, backend = self._loop, self._backend
+        if loop is None:
+            return  # lifespan not running (scripts, shutdown)
+        # Nobody to tell in this worker, and no other worker to tell either
+        if backend.name == "local" and freelancer_id not in self._subscribers:
+            return
+        frame = sse_frame(event_type, {"freelancer_id": freelancer_id, **data})
+        try:
+            loop.call_soon_threadsafe(self._publish, backend, freelancer_id, frame)
+        except RuntimeError:
+            pass  # loop closed during shutdown
+
+    def _publish(self, backend, freelancer_id: int, frame: str):
+        self.published += 1
+        backend.publish(freelancer_id, frame)
+
+    def deliver(self, freelancer_id: int | None, frame: str):
+        """Fan a frame out to local subscribers; None means all of them (used for RESYNC)."""
+        if freelancer_id is None:
+            targets = [sub for subs in self._subscribers.values() for sub in subs]
+        else:
+            targets = self._subscribers.get(freelancer_id, ())
+        for sub in targets:
+            if frame is RESYNC:
+                sub.resync()
+            elif sub.push(frame):
+                self.delivered += 1
+            else:
+                self.lagged += 1
+
+    def stats(self) -> dict:
+        return {
+            "backend": self._backend.name if self._backend else None,
+            "subscribers": self._count,
+            "freelancers": len(self._subscribers),
+            "published": self.published,
+            "delivered": self.delivered,
+            "lagged": self.lagged,
+        }
+
+
+live_hub = LiveHub()
+
+
+# Event helpers: routers call these after the commit ------------------------
+
+def _iso(value):
+    return value.isoformat() if isinstance(value, (datetime, time)) else value
+
+
+def publish_booking(event_type: str, booking_id: int, *, freelancer_id: int, service_id: int, start_at: datetime,
+                    end_at: datetime, status, client_id: int | None = None, **extra):
+    """Booking change; takes booking_fields() so the client id stays out of the public stream."""
+    live_hub.publish(freelancer_id, event_type, {
+        "booking_id": booking_id,
+        "service_id": service_id,
+        "start_at": _iso(start_at),
+        "end_at": _iso(end_at),
+        "status": getattr(status, "value", status),
+        **{key: getattr(value, "value", value) for key, value in extra.items()},
+    })
+
+
+def publish_slot(event_type: str, freelancer_id: int, day_of_week: int, start_time: time, end_time: time,
+                 slot_id: int | None = None):
+    live_hub.publish(freelancer_id, event_type, {
+        "slot_id": slot_id, "day_of_week": day_of_week, "start_time": _iso(start_time), "end_time": _iso(end_time),
+    })
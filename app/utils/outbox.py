@@ -0,0 +1,295 @@
+# app/utils/outbox.py
+#
+# Transactional outbox. Request handlers add an OutboxEvent to the session
+# that carries the booking change, so both commit (or roll back) together;
+# scripts/outbox_worker.py later runs the subscribed handlers. Delivery is
+# at least once: a crash or a failing handler re-runs every handler of the
+# event, so handlers must be idempotent (key on message.id).
+
+import importlib
+import logging
+import random
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Callable
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.outbox import OutboxEvent
+
+logger = logging.getLogger("app.outbox")
+
+BOOKING_CREATED = "booking.created"
+BOOKING_STATUS_CHANGED = "booking.status_changed"
+BOOKING_DELETED = "booking.deleted"
+
+# Upper bounds (seconds) of the commit-to-processed lag histogram
+LAG_BUCKETS_S = (0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 300, 900, 3600)
+PURGE_BATCH = 5000
+PURGE_INTERVAL_S = 60
+ERROR_CHARS = 2000
+
+
+def utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def as_utc(value: datetime) -> datetime:
+    # SQLite hands timestamps back naive (they are stored as UTC)
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def booking_event(topic: str, booking_id: int, *, client_id: int, freelancer_id: int, service_id: int,
+                  start_at: datetime, end_at: datetime, status, **extra) -> OutboxEvent:
+    """Event for one booking; `extra` is merged into the payload (e.g. previous_status)."""
+    return OutboxEvent(topic=topic, aggregate_id=booking_id, payload={
+        "booking_id": booking_id,
+        "client_id": client_id,
+        "freelancer_id": freelancer_id,
+        "service_id": service_id,
+        "start_at": start_at.isoformat(),
+        "end_at": end_at.isoformat(),
+        "status": getattr(status, "value", status),
+        **{key: getattr(value, "value", value) for key, value in extra.items()},
+    })
+
+
+def booking_fields(booking) -> dict:
+    """booking_event() keyword arguments from a Booking (read them before the commit expires it)."""
+    return {"client_id": booking.client_id, "freelancer_id": booking.freelancer_id, "service_id": booking.service_id,
+            "start_at": booking.start_at, "end_at": booking.end_at, "status": booking.status}
+
+
+def enqueue(db, *events: OutboxEvent):
+    """Add events to the caller's transaction (sync Session or AsyncSession); they commit with it."""
+    if settings.OUTBOX_ENABLED:
+        db.add_all(events)
+
+
+# Handlers ----------------------------------------------------------------
+
+@dataclass(frozen=True, slots=True)
+class Message:
+    """What a handler sees of an OutboxEvent."""
+    id: int
+    topic: str
+    aggregate_id: int | None
+    payload: dict
+    created_at: datetime
+    attempt: int  # 1 on the first delivery
+
+
+Handler = Callable[[Message], None]
+_handlers: defaultdict[str, list[Handler]] = defaultdict(list)
+
+
+def subscribe(*topics: str):
+    """Decorator registering a handler for these topics; "*" matches every topic."""
+    def register(handler: Handler) -> Handler:
+        for topic in topics:
+            _handlers[topic].append(handler)
+        return handler
+    return register
+
+
+def handlers_for(topic: str) -> list[Handler]:
+    return [*_handlers.get(topic, ()), *_handlers.get("*", ())]
+
+
+def load_handlers(modules: str):
+    """Import comma-separated modules so their @subscribe handlers register."""
+    for name in filter(None, (part.strip() for part in modules.split(","))):
+        importlib.import_module(name)
+
+
+@subscribe("*")
+def log_event(message: Message):
+    logger.info("outbox %s #%s %s", message.topic, message.id, message.payload)
+
+
+# Worker ------------------------------------------------------------------
+
+class OutboxMetrics:
+    """Counters for this worker process, served by render_prometheus()."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.batches = 0
+        self.processed = 0
+        self.retried = 0
+        self.failed = 0
+        self.handler_seconds = 0.0
+        self.lag_seconds_total = 0.0
+        self.lag_buckets = [0] * (len(LAG_BUCKETS_S) + 1)
+
+    def observe(self, outcome: str, handler_seconds: float, lag_seconds: float | None = None):
+        with self._lock:
+            self.handler_seconds += handler_seconds
+            if outcome == "processed":
+                self.processed += 1
+                self.lag_seconds_total += lag_seconds
+                self.lag_buckets[next((i for i, bound in enumerate(LAG_BUCKETS_S) if lag_seconds <= bound),
+                                      len(LAG_BUCKETS_S))] += 1
+            elif outcome == "retried":
+                self.retried += 1
+            else:
+                self.failed += 1
+
+
+def backoff_s(attempts: int) -> float:
+    """Exponential backoff with jitter before attempt `attempts + 1`."""
+    delay = min(settings.OUTBOX_BACKOFF_MAX_S, settings.OUTBOX_BACKOFF_BASE_S * 2 ** (attempts - 1))
+    return delay * random.uniform(0.5, 1.0)
+
+
+def pending_filter():
+    return OutboxEvent.processed_at.is_(None), OutboxEvent.failed_at.is_(None)
+
+
+def claim_query(now: datetime, limit: int):
+    """Due pending events, oldest first. Rows locked by another worker are skipped (Postgres)."""
+    return (
+        select(OutboxEvent)
+        .where(*pending_filter(), OutboxEvent.available_at <= now)
+        .order_by(OutboxEvent.available_at, OutboxEvent.id)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+
+
+def outbox_backlog(db: Session) -> dict:
+    """Pending/failed counts and the age of the oldest pending event, from the table."""
+    pending, oldest = db.execute(select(func.count(), func.min(OutboxEvent.created_at))
+                                 .where(*pending_filter())).one()
+    failed = db.scalar(select(func.count()).where(OutboxEvent.failed_at.is_not(None)))
+    return {
+        "pending": pending,
+        "failed": failed,
+        "oldest_pending_age_s": round((utcnow() - as_utc(oldest)).total_seconds(), 3) if oldest else 0.0,
+    }
+
+
+class OutboxWorker:
+    """Drains outbox_events in batches; run several for throughput (Postgres).
+
+    Each batch is one transaction: the claimed rows stay locked while their
+    handlers run, and the outcomes commit together.
+    """
+
+    def __init__(self, session_factory, batch_size: int | None = None, max_attempts: int | None = None,
+                 metrics: OutboxMetrics | None = None):
+        self.session_factory = session_factory
+        self.batch_size = batch_size or settings.OUTBOX_BATCH_SIZE
+        self.max_attempts = max_attempts or settings.OUTBOX_MAX_ATTEMPTS
+        self.metrics = metrics or OutboxMetrics()
+        self._last_purge = 0.0
+
+    def run_once(self) -> int:
+        """Process one batch; returns how many events it claimed."""
+        db = self.session_factory()
+        try:
+            events = db.scalars(claim_query(utcnow(), self.batch_size)).all()
+            for event in events:
+                self.process(event)
+            db.commit()
+        finally:
+            db.close()
+        if events:
+            with self.metrics._lock:
+                self.metrics.batches += 1
+        return len(events)
+
+    def process(self, event: OutboxEvent):
+        event.attempts += 1
+        message = Message(id=event.id, topic=event.topic, aggregate_id=event.aggregate_id, payload=event.payload,
+                          created_at=as_utc(event.created_at), attempt=event.attempts)
+        t0 = time.perf_counter()
+        try:
+            for handler in handlers_for(event.topic):
+                handler(message)
+        except Exception as e:
+            elapsed = time.perf_counter() - t0
+            event.last_error = f"{type(e).__name__}: {e}"[:ERROR_CHARS]
+            if event.attempts >= self.max_attempts:
+                event.failed_at = utcnow()
+                self.metrics.observe("failed", elapsed)
+                logger.exception("outbox %s #%s failed permanently after %d attempts",
+                                 event.topic, event.id, event.attempts)
+            else:
+                delay = backoff_s(event.attempts)
+                event.available_at = utcnow() + timedelta(seconds=delay)
+                self.metrics.observe("retried", elapsed)
+                logger.warning("outbox %s #%s attempt %d failed (%s), retrying in %.1fs",
+                               event.topic, event.id, event.attempts, event.last_error, delay)
+            return
+        event.processed_at = utcnow()
+        event.last_error = None
+        self.metrics.observe("processed", time.perf_counter() - t0,
+                             (event.processed_at - message.created_at).total_seconds())
+
+    def purge(self) -> int:
+        """Delete processed events older than OUTBOX_RETENTION_H, in bounded batches."""
+        cutoff = utcnow() - timedelta(hours=settings.OUTBOX_RETENTION_H)
+        deleted = 0
+        while True:
+            db = self.session_factory()
+            try:
+                ids = select(OutboxEvent.id).where(OutboxEvent.processed_at < cutoff).limit(PURGE_BATCH)
+                count = db.execute(delete(OutboxEvent).where(OutboxEvent.id.in_(ids))).rowcount
+                db.commit()
+            finally:
+                db.close()
+            deleted += count
+            if count < PURGE_BATCH:
+                return deleted
+
+    def run_forever(self, stop: threading.Event, poll_interval_s: float | None = None):
+        """Loop until `stop` is set: full batches back to back, otherwise poll every poll_interval_s."""
+        poll_interval_s = settings.OUTBOX_POLL_INTERVAL_S if poll_interval_s is None else poll_interval_s
+        while not stop.is_set():
+            try:
+                claimed = self.run_once()
+                if time.monotonic() - self._last_purge >= PURGE_INTERVAL_S:
+                    self._last_purge = time.monotonic()
+                    if deleted := self.purge():
+                        logger.info("outbox purged %d processed events", deleted)
+            except Exception:
+                # Database unavailable or similar: the batch rolled back, its events stay pending
+                logger.exception("outbox batch failed")
+                claimed = 0
+            if claimed < self.batch_size:
+                stop.wait(poll_interval_s)
+
+
+def render_prometheus(metrics: OutboxMetrics, backlog: dict | None) -> str:
+    """Prometheus text exposition of the worker counters and, if given, the table backlog."""
+    lines = []
+
+    def sample(name: str, kind: str, help_text: str, value):
+        lines.extend((f"# HELP {name} {help_text}", f"# TYPE {name} {kind}", f"{name} {value}"))
+
+    with metrics._lock:
+        sample("outbox_batches_total", "counter", "Non-empty batches claimed by this worker.", metrics.batches)
+        sample("outbox_events_processed_total", "counter", "Events whose handlers all succeeded.", metrics.processed)
+        sample("outbox_events_retried_total", "counter", "Failed attempts scheduled for a retry.", metrics.retried)
+        sample("outbox_events_failed_total", "counter", "Events given up after OUTBOX_MAX_ATTEMPTS.", metrics.failed)
+        sample("outbox_handler_seconds_total", "counter", "Time spent in handlers.", f"{metrics.handler_seconds:.6f}")
+        lines.extend(("# HELP outbox_lag_seconds Delay from the booking change to processing, per processed event.",
+                      "# TYPE outbox_lag_seconds histogram"))
+        cumulative = 0
+        for bound, count in zip((*LAG_BUCKETS_S, "+Inf"), metrics.lag_buckets):
+            cumulative += count
+            lines.append(f'outbox_lag_seconds_bucket{{le="{bound}"}} {cumulative}')
+        lines.append(f"outbox_lag_seconds_sum {metrics.lag_seconds_total:.6f}")
+        lines.append(f"outbox_lag_seconds_count {metrics.processed}")
+    if backlog is not None:
+        sample("outbox_pending_events", "gauge", "Events not yet processed.", backlog["pending"])
+        sample("outbox_failed_events", "gauge", "Events given up on, kept for inspection.", backlog["failed"])
+        sample("outbox_oldest_pending_age_seconds", "gauge", "Age of the oldest pending event.",
+               backlog["oldest_pending_age_s"])
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,124 @@
+# app/utils/page_cache.py
+
+import gzip
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Callable
+
+from fastapi import Request, Response
+from fastapi.templating import Jinja2Templates
+
+from app.core.config import settings
+from app.utils.etags import etag_matches, make_etag
+from app.utils.ttl_cache import TTLCache
+
+# Bodies smaller than this are not worth a gzip member
+MIN_COMPRESS_BYTES = 512
+
+
+@dataclass(frozen=True, slots=True)
+class CachedPage:
+    body: bytes
+    gzipped: bytes | None
+    etag: str
+
+
+@dataclass(slots=True)
+class RouteStats:
+    hits: int = 0
+    misses: int = 0
+    not_modified: int = 0
+    render_ms_total: float = 0.0
+
+    def snapshot(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "not_modified": self.not_modified,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+            "avg_render_ms": round(self.render_ms_total / self.misses, 3) if self.misses else None,
+        }
+
+
+class PageCache:
+    """Rendered Jinja2 pages, keyed by (route, *key) and stored precompressed.
+
+    The key must carry every dimension the template output depends on (e.g.
+    the caller's role, a path parameter). Entries expire after the route's
+    TTL; service writes drop the affected entries through
+    app/utils/service_cache.invalidate_service. Only this worker's copy is
+    cleared, so other workers converge within the route TTL.
+    """
+
+    def __init__(self, maxsize: int):
+        self._store = TTLCache(maxsize=maxsize, ttl=60)
+        self._stats: defaultdict[str, RouteStats] = defaultdict(RouteStats)
+        self._lock = threading.Lock()
+
+    def render(self, templates: Jinja2Templates, request: Request, route: str, template: str,
+               context: Callable[[], dict] = dict, *, ttl: float, key: tuple = (),
+               public: bool = False) -> Response:
+        """Serve `template` from the cache, rendering it with `context()` on a miss.
+
+        `context` is only called on a miss, so the queries behind it are
+        skipped on hits. `public` pages may be stored by shared caches,
+        everything else is private; either way the copy is revalidated with
+        the ETag. HTML embeds fingerprinted asset URLs, so a page kept past a
+        deploy would point at assets that no longer exist; only the assets
+        themselves are immutable (app/utils/static_assets.py).
+        """
+        cache_key = (route, *key)
+        page = self._store.get(cache_key) if settings.PAGE_CACHE_ENABLED else None
+        if page is None:
+            t0 = time.perf_counter()
+            body = templates.get_template(template).render({"request": request, **context()}).encode()
+            elapsed = (time.perf_counter() - t0) * 1000
+            page = CachedPage(
+                body=body,
+                gzipped=gzip.compress(body, compresslevel=6, mtime=0) if len(body) >= MIN_COMPRESS_BYTES else None,
+                etag=make_etag(body),
+            )
+            self._store.set(cache_key, page, ttl=ttl)
+            with self._lock:
+                stats = self._stats[route]
+                stats.misses += 1
+                stats.render_ms_total += elapsed
+        else:
+            with self._lock:
+                self._stats[route].hits += 1
+
+        headers = {
+            "ETag": page.etag,
+            "Cache-Control": "public, no-cache" if public else "private, no-cache",
+            "Vary": "Accept-Encoding",
+        }
+        if etag_matches(request.headers.get("if-none-match"), page.etag):
+            with self._lock:
+                self._stats[route].not_modified += 1
+            return Response(status_code=304, headers=headers)
+        if page.gzipped is not None and "gzip" in request.headers.get("accept-encoding", ""):
+            headers["Content-Encoding"] = "gzip"
+            return Response(content=page.gzipped, media_type="text/html; charset=utf-8", headers=headers)
+        return Response(content=page.body, media_type="text/html; charset=utf-8", headers=headers)
+
+    def invalidate(self, route: str, *key):
+        self._store.pop((route, *key))
+
+    def invalidate_route(self, route: str) -> int:
+        return self._store.pop_where(lambda cache_key: cache_key[0] == route)
+
+    def clear(self):
+        self._store.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            routes = {route: stats.snapshot() for route, stats in sorted(self._stats.items())}
+        stats = self._store.stats()
+        del stats["ttl_seconds"]  # per route, see app/routers/pages.py
+        return {**stats, "routes": routes}
+
+
+page_cache = PageCache(maxsize=settings.PAGE_CACHE_SIZE)
@@ -0,0 +1,103 @@
+# app/utils/pagination.py
+
+import base64
+import binascii
+import json
+from datetime import datetime, timedelta
+
+from fastapi import HTTPException, Query
+from sqlalchemy import tuple_
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import GenericFunction
+
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 200
+
+
+def encode_key(key: list) -> str:
+    """Opaque cursor for any JSON-serializable sort key."""
+    raw = json.dumps(key, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_key(cursor: str) -> list:
+    try:
+        key = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (binascii.Error, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if not isinstance(key, list):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return key
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    """Opaque cursor pointing just past the row (created_at, id)."""
+    return encode_key([created_at.isoformat(), row_id])
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        created_at, row_id = decode_key(cursor)
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+class instant(GenericFunction):
+    """A timestamp column or value, rendered so it compares correctly.
+
+    Plain passthrough everywhere except SQLite, where `server_default=now()`
+    stores "YYYY-MM-DD HH:MM:SS" but bound datetimes carry microseconds, so
+    string comparison would put a row before its own cursor.
+    """
+
+    name = "instant"
+    inherit_cache = True
+
+
+@compiles(instant)
+def _compile_instant(element, compiler, **kw):
+    return compiler.process(element.clauses, **kw)
+
+
+@compiles(instant, "sqlite")
+def _compile_instant_sqlite(element, compiler, **kw):
+    return f"julianday({compiler.process(element.clauses, **kw)})"
+
+
+class PageParams:
+    """`?cursor=&limit=` query parameters shared by the list endpoints."""
+
+    def __init__(
+        self,
+        cursor: str | None = Query(None, description="next_cursor from the previous page"),
+        limit: int = Query(DEFAULT_LIMIT, ge=1, le=MAX_LIMIT),
+    ):
+        self.cursor = cursor
+        self.limit = limit
+
+
+def keyset(stmt, created_col, id_col, page: PageParams):
+    """Newest-first page of `stmt` starting after `page.cursor`.
+
+    Works on both select() and legacy Query objects. One extra row is fetched
+    so `page_result` can tell whether a next page exists; the (created_at, id)
+    row comparison lets Postgres seek straight into the composite index, so
+    page 1000 costs the same as page 1.
+    """
+    if page.cursor:
+        created_at, row_id = decode_cursor(page.cursor)
+        cursor_at = instant(created_at, type_=created_col.type)
+        stmt = stmt.where(
+            # Redundant on Postgres; lets SQLite range-scan the index despite julianday()
+            created_col < created_at + timedelta(seconds=1),
+            tuple_(instant(created_col), id_col) < tuple_(cursor_at, row_id),
+        )
+    return stmt.order_by(created_col.desc(), id_col.desc()).limit(page.limit + 1)
+
+
+def page_result(rows: list, page: PageParams, key=lambda row: (row.created_at, row.id)) -> dict:
+    """{"items", "next_cursor"} from rows fetched with `keyset`."""
+    items = rows[:page.limit]
+    next_cursor = encode_cursor(*key(items[-1])) if len(rows) > page.limit else None
+    return {"items": items, "next_cursor": next_cursor}
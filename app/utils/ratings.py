@@ -0,0 +1,98 @@
+# app/utils/ratings.py
+
+from collections import Counter
+
+from sqlalchemy import case, delete, func, insert, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.models.booking import Booking
+from app.models.rating import FreelancerRating, ServiceRating
+from app.models.review import Review
+from app.models.service import Service
+
+SUMMARY_COLUMNS = ("count", "total", "stars_1", "stars_2", "stars_3", "stars_4", "stars_5")
+
+
+def rating_delta(old: int | None, new: int | None) -> dict[str, int]:
+    """Column increments for a review going from `old` to `new` stars (None = absent)."""
+    delta = Counter()
+    if old is not None:
+        delta["count"] -= 1
+        delta["total"] -= old
+        delta[f"stars_{old}"] -= 1
+    if new is not None:
+        delta["count"] += 1
+        delta["total"] += new
+        delta[f"stars_{new}"] += 1
+    return {column: value for column, value in delta.items() if value}
+
+
+def upsert_delta(dialect: str, model, key: dict, delta: dict[str, int]):
+    """One atomic INSERT ... ON CONFLICT DO UPDATE adding `delta` to the summary row."""
+    insert_ = postgresql.insert if dialect == "postgresql" else sqlite.insert
+    table = model.__table__
+    stmt = insert_(table).values(**key, **{column: delta.get(column, 0) for column in SUMMARY_COLUMNS})
+    return stmt.on_conflict_do_update(
+        index_elements=list(key),
+        set_={**{column: table.c[column] + value for column, value in delta.items()}, "updated_at": func.now()},
+    )
+
+
+def summary_statements(dialect: str, service_id: int, freelancer_id: int, old: int | None, new: int | None) -> list:
+    delta = rating_delta(old, new)
+    if not delta:
+        return []
+    return [
+        upsert_delta(dialect, ServiceRating, {"service_id": service_id}, delta),
+        upsert_delta(dialect, FreelancerRating, {"freelancer_id": freelancer_id}, delta),
+    ]
+
+
+def apply_review_change(db: Session, booking: Booking, old: int | None, new: int | None):
+    """Fold a review create/update/delete into the summaries; call before the review's commit."""
+    dialect = db.get_bind().dialect.name
+    for stmt in summary_statements(dialect, booking.service_id, booking.freelancer_id, old, new):
+        db.execute(stmt)
+
+
+def detach_service_ratings(db: Session, service: Service):
+    """Take a service's reviews out of its freelancer's summary before the service is deleted."""
+    summary = db.get(ServiceRating, service.id)
+    if summary is None or not summary.count:
+        return
+    db.execute(
+        FreelancerRating.__table__.update()
+        .where(FreelancerRating.freelancer_id == service.freelancer_id)
+        .values({column: FreelancerRating.__table__.c[column] - getattr(summary, column)
+                 for column in SUMMARY_COLUMNS})
+    )
+
+
+def summary_select(group_column):
+    """Aggregate reviews into summary columns grouped by `group_column`."""
+    return (
+        select(
+            group_column,
+            func.count(Review.id),
+            func.coalesce(func.sum(Review.rating), 0),
+            *(func.sum(case((Review.rating == stars, 1), else_=0)) for stars in range(1, 6)),
+        )
+        .join(Booking, Booking.id == Review.booking_id)
+        .group_by(group_column)
+    )
+
+
+def rebuild_rating_summaries(db: Session) -> dict[str, int]:
+    """Recompute both summary tables from `reviews` in one transaction."""
+    db.execute(delete(ServiceRating))
+    db.execute(delete(FreelancerRating))
+    db.execute(insert(ServiceRating).from_select(["service_id", *SUMMARY_COLUMNS], summary_select(Booking.service_id)))
+    db.execute(insert(FreelancerRating).from_select(
+        ["freelancer_id", *SUMMARY_COLUMNS], summary_select(Booking.freelancer_id)
+    ))
+    db.commit()
+    return {
+        "services": db.scalar(select(func.count()).select_from(ServiceRating)),
+        "freelancers": db.scalar(select(func.count()).select_from(FreelancerRating)),
+    }
@@ -0,0 +1,131 @@
+# app/utils/search_index.py
+
+import re
+import threading
+import time as clock
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.service import Service
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+STOPWORDS = frozenset(
+    "a an and are as at be by for from in is it of on or the to with".split()
+)
+# Same relative weights as ts_rank's defaults for 'A' (title) and 'B' (description)
+TITLE_WEIGHT = 1.0
+DESCRIPTION_WEIGHT = 0.4
+
+
+def tokenize(text: str | None) -> list[str]:
+    return [token for token in TOKEN_RE.findall((text or "").lower()) if token not in STOPWORDS]
+
+
+class InvertedIndex:
+    """In-process token -> {service_id: weight} index over title/description.
+
+    Fallback for databases without full-text search (SQLite dev and test
+    runs). Built from the table on first use and kept current by this
+    worker's service write endpoints. Other workers' writes are picked up by
+    a rebuild once the index is `ttl` seconds old; searches keep using the
+    old index while the new one is built.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._postings: dict[str, dict[int, float]] = {}
+        self._tokens: dict[int, set[str]] = {}
+        self._lock = threading.Lock()
+        self._build_lock = threading.Lock()
+        self.loaded = False
+        self.loaded_at = 0.0
+        # Writes made while a rebuild reads the table, replayed onto the new index
+        self._pending: list[tuple] | None = None
+
+    def _add(self, service_id: int, title: str | None, description: str | None):
+        weights: dict[str, float] = {}
+        for token in tokenize(title):
+            weights[token] = weights.get(token, 0.0) + TITLE_WEIGHT
+        for token in tokenize(description):
+            weights[token] = weights.get(token, 0.0) + DESCRIPTION_WEIGHT
+        for token, weight in weights.items():
+            self._postings.setdefault(token, {})[service_id] = weight
+        self._tokens[service_id] = set(weights)
+
+    def _remove(self, service_id: int):
+        for token in self._tokens.pop(service_id, ()):
+            postings = self._postings.get(token)
+            if postings is not None:
+                postings.pop(service_id, None)
+                if not postings:
+                    del self._postings[token]
+
+    def _fresh(self) -> bool:
+        return self.loaded and clock.monotonic() - self.loaded_at < self.ttl
+
+    def ensure_loaded(self, db: Session):
+        if self._fresh():
+            return
+        with self._build_lock:
+            if self._fresh():
+                return
+            # Built aside and swapped in, so searches don't wait on a rebuild
+            fresh = InvertedIndex(self.ttl)
+            with self._lock:
+                self._pending = []
+            rows = db.execute(
+                select(Service.id, Service.title, Service.description).execution_options(yield_per=5000)
+            )
+            for service_id, title, description in rows:
+                fresh._add(service_id, title, description)
+            with self._lock:
+                for service_id, *text in self._pending:
+                    fresh._remove(service_id)
+                    if text:
+                        fresh._add(service_id, *text)
+                self._pending = None
+                self._postings, self._tokens = fresh._postings, fresh._tokens
+                self.loaded_at = clock.monotonic()
+                self.loaded = True
+
+    def upsert(self, service_id: int, title: str | None, description: str | None):
+        with self._lock:
+            if self._pending is not None:
+                self._pending.append((service_id, title, description))
+            if self.loaded:
+                self._remove(service_id)
+                self._add(service_id, title, description)
+
+    def remove(self, service_id: int):
+        with self._lock:
+            if self._pending is not None:
+                self._pending.append((service_id,))
+            if self.loaded:
+                self._remove(service_id)
+
+    def invalidate(self):
+        with self._lock:
+            self._postings.clear()
+            self._tokens.clear()
+            self.loaded = False
+
+    def search(self, db: Session, query: str) -> dict[int, float]:
+        """Services containing every query token, with a summed weight score."""
+        self.ensure_loaded(db)
+        tokens = set(tokenize(query))
+        if not tokens:
+            return {}
+        with self._lock:
+            postings = sorted((self._postings.get(token, {}) for token in tokens), key=len)
+            # Intersect starting from the rarest token
+            scores = dict(postings[0])
+            for posting in postings[1:]:
+                scores = {sid: score + posting[sid] for sid, score in scores.items() if sid in posting}
+                if not scores:
+                    break
+        return scores
+
+
+catalog_index = InvertedIndex(ttl=settings.SEARCH_INDEX_TTL_S)
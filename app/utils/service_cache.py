@@ -0,0 +1,61 @@
+# app/utils/service_cache.py
+
+from dataclasses import dataclass
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.database.replicas import primary_session
+from app.models.service import Service
+from app.schemas.service import ServiceOut
+from app.utils.etags import make_etag
+from app.utils.page_cache import page_cache
+from app.utils.ttl_cache import TTLCache
+
+
+@dataclass(frozen=True, slots=True)
+class CachedService:
+    """A serialized ServiceOut plus its strong validator."""
+    payload: dict
+    body: bytes
+    etag: str
+
+
+def cache_control() -> str:
+    return f"public, max-age={settings.SERVICE_CACHE_MAX_AGE_S}"
+
+
+# Keyed by service id. Only this worker's copy is invalidated on writes;
+# other workers converge within SERVICE_CACHE_TTL_S.
+service_cache = TTLCache(maxsize=settings.SERVICE_CACHE_SIZE, ttl=settings.SERVICE_CACHE_TTL_S)
+
+
+def get_cached_service(db: Session, service_id: int) -> CachedService | None:
+    """Read-through: the serialized service, or None if it does not exist. Misses read the primary."""
+    cached = service_cache.get(service_id)
+    if cached is not None:
+        return cached
+    # From the primary even on a replica session: a lagging replica could hand back
+    # the row invalidate_service just dropped, and it would be cached for the TTL
+    with primary_session(db) as primary:
+        svc = primary.scalar(select(Service).where(Service.id == service_id))
+        if svc is None:
+            return None
+        out = ServiceOut.model_validate(svc)
+    body = out.model_dump_json().encode()
+    cached = CachedService(payload=out.model_dump(), body=body, etag=make_etag(body))
+    service_cache.set(service_id, cached)
+    return cached
+
+
+def invalidate_service(service_id: int | None = None):
+    """Call after committing a change to the service or its rating summary.
+
+    Also drops the rendered pages that show it; pass no id after creating
+    a service, which only changes the listing.
+    """
+    if service_id is not None:
+        service_cache.pop(service_id)
+        page_cache.invalidate("service_detail", service_id)
+    page_cache.invalidate_route("services_list")
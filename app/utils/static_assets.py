@@ -0,0 +1,94 @@
+# app/utils/static_assets.py
+#
+# Fingerprinted, precompressed static files. scripts/build_static.py writes
+# hashed copies (plus .br/.gz variants) under app/static/dist and a
+# manifest; this module maps source paths to those URLs for templates and
+# serves the variants. Without a build, everything falls back to the
+# plain /static/<path> files.
+
+import json
+import os
+from mimetypes import guess_type
+
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+
+STATIC_DIR = "app/static"
+BUILD_DIR = "dist"
+MANIFEST = os.path.join(STATIC_DIR, BUILD_DIR, "manifest.json")
+
+# Preference order when the client accepts several
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+IMMUTABLE = "public, max-age=31536000, immutable"
+
+
+def load_manifest(path: str = MANIFEST) -> dict[str, dict]:
+    """{source path: {"path": built path, "encodings": [...]}}; empty if not built."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)["files"]
+    except FileNotFoundError:
+        return {}
+
+
+manifest = load_manifest()
+# Built path -> available encodings, for the handler
+variants = {entry["path"]: frozenset(entry["encodings"]) for entry in manifest.values()}
+
+
+def static_url(path: str) -> str:
+    """Template helper: the fingerprinted URL for `path` (relative to app/static)."""
+    entry = manifest.get(path)
+    return f"/static/{entry['path'] if entry else path}"
+
+
+def accepted_encodings(header: str) -> set[str]:
+    accepted = set()
+    for part in header.split(","):
+        coding, _, params = part.strip().partition(";")
+        q = params.strip().removeprefix("q=")
+        try:
+            if params and float(q) == 0:
+                continue
+        except ValueError:
+            continue
+        if coding:
+            accepted.add(coding.strip().lower())
+    return accepted
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """StaticFiles that serves prebuilt .br/.gz variants and marks hashed files immutable.
+
+    Variants are known from the manifest, so only a chosen variant costs an
+    extra stat call. Bodies go out through FileResponse, which uses the server's
+    zero-copy path (http.response.pathsend) where the ASGI server offers it.
+    """
+
+    def file_response(self, full_path, stat_result, scope, status_code: int = 200):
+        request_headers = Headers(scope=scope)
+        relative = os.path.relpath(full_path, os.path.realpath(self.directory)).replace(os.sep, "/")
+        available = variants.get(relative, frozenset())
+
+        response = None
+        if available:
+            accepted = accepted_encodings(request_headers.get("accept-encoding", ""))
+            for encoding, suffix in ENCODINGS:
+                if encoding in available and encoding in accepted:
+                    response = FileResponse(
+                        full_path + suffix, status_code=status_code, stat_result=os.stat(full_path + suffix),
+                        media_type=guess_type(full_path)[0] or "application/octet-stream",
+                        headers={"Content-Encoding": encoding},
+                    )
+                    break
+        if response is None:
+            response = FileResponse(full_path, status_code=status_code, stat_result=stat_result)
+
+        if available:
+            response.headers["Vary"] = "Accept-Encoding"
+        # Hashed names never change content; everything else must revalidate
+        response.headers["Cache-Control"] = IMMUTABLE if relative in variants else "no-cache"
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
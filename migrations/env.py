@@ -12,6 +12,10 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from app.database.connection import Base
 from app.models import User, Service, Booking, Review
+import app.models.availability  # noqa: F401
+import app.models.favorite  # noqa: F401
+import app.models.rating  # noqa: F401
+import app.models.outbox  # noqa: F401
 
 # this is the Alembic Config object
 config = context.config
@@ -22,7 +26,7 @@ if database_url:
     config.set_main_option("sqlalchemy.url", database_url)
 
 # Interpret the config file for Python logging.
-if config.config_file_name is not None:
+if config.config_file_name is not None and config.attributes.get("configure_logger", True):
     fileConfig(config.config_file_name)
 
 # add your model's MetaData object here for 'autogenerate' support
@@ -0,0 +1,44 @@
+"""Prevent overlapping active bookings per freelancer
+
+Revision ID: 002_booking_no_overlap
+Revises: 001_initial
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '002_booking_no_overlap'
+down_revision: Union[str, None] = '001_initial'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Backs the overlap lookup in app/utils/booking_index.has_db_conflict; concurrently, like 007
+    with op.get_context().autocommit_block():
+        op.create_index('ix_bookings_freelancer_start', 'bookings', ['freelancer_id', 'start_at'], unique=False,
+                        postgresql_concurrently=True)
+
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    # Existing double-bookings must be resolved (canceled) before this runs,
+    # otherwise Postgres refuses to build the constraint.
+    op.execute('CREATE EXTENSION IF NOT EXISTS btree_gist')
+    op.execute(
+        "ALTER TABLE bookings ADD CONSTRAINT bookings_no_overlap "
+        "EXCLUDE USING gist (freelancer_id WITH =, tstzrange(start_at, end_at, '[)') WITH &&) "
+        "WHERE (status IN ('pending', 'confirmed'))"
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute('ALTER TABLE bookings DROP CONSTRAINT IF EXISTS bookings_no_overlap')
+
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_bookings_freelancer_start', table_name='bookings', postgresql_concurrently=True)
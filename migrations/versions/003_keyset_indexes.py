@@ -0,0 +1,43 @@
+"""Composite indexes for keyset pagination of bookings and reviews
+
+Built concurrently, outside a transaction, like 007. The favorites index
+is created by 006, which also creates the table where it is missing.
+
+Revision ID: 003_keyset_indexes
+Revises: 002_booking_no_overlap
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '003_keyset_indexes'
+down_revision: Union[str, None] = '002_booking_no_overlap'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (name, table, columns); back the (created_at, id) ordering used by app/utils/pagination.keyset
+INDEXES = (
+    ('ix_bookings_client_created', 'bookings', ['client_id', 'created_at', 'id']),
+    ('ix_bookings_freelancer_created', 'bookings', ['freelancer_id', 'created_at', 'id']),
+    ('ix_bookings_created', 'bookings', ['created_at', 'id']),
+    ('ix_reviews_created', 'reviews', ['created_at', 'id']),
+)
+
+
+def upgrade() -> None:
+    # A failed CONCURRENTLY build leaves an INVALID index behind: drop it
+    # by hand before re-running.
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, unique=False, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
@@ -0,0 +1,52 @@
+"""Catalog search indexes on services
+
+Built concurrently, outside a transaction, like 007.
+
+Revision ID: 004_service_search
+Revises: 003_keyset_indexes
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '004_service_search'
+down_revision: Union[str, None] = '003_keyset_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (name, columns): filters and keyset sorts of GET /services/ (app/utils/catalog_search.py)
+INDEXES = (
+    ('ix_services_price', ['price', 'id']),
+    ('ix_services_created', ['created_at', 'id']),
+    ('ix_services_freelancer', ['freelancer_id']),
+)
+
+
+def upgrade() -> None:
+    # A failed CONCURRENTLY build leaves an INVALID index behind: drop it
+    # by hand before re-running.
+    with op.get_context().autocommit_block():
+        for name, columns in INDEXES:
+            op.create_index(name, 'services', columns, unique=False, postgresql_concurrently=True)
+
+        if op.get_bind().dialect.name != 'postgresql':
+            return
+
+        # Must stay identical to app.models.service.search_document() or the planner won't use it
+        op.execute(
+            "CREATE INDEX CONCURRENTLY ix_services_search ON services USING gin ("
+            "(setweight(to_tsvector('english'::regconfig, title), 'A') || "
+            "setweight(to_tsvector('english'::regconfig, description), 'B')))"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        if op.get_bind().dialect.name == 'postgresql':
+            op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_services_search')
+        for name, _ in reversed(INDEXES):
+            op.drop_index(name, table_name='services', postgresql_concurrently=True)
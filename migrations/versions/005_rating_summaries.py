@@ -0,0 +1,58 @@
+"""Per-service and per-freelancer rating summary tables
+
+Revision ID: 005_rating_summaries
+Revises: 004_service_search
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '005_rating_summaries'
+down_revision: Union[str, None] = '004_service_search'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SUMMARY_COLUMNS = ('count', 'total', 'stars_1', 'stars_2', 'stars_3', 'stars_4', 'stars_5')
+
+
+def summary_columns():
+    return [sa.Column(name, sa.Integer(), server_default='0', nullable=False) for name in SUMMARY_COLUMNS] + [
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    ]
+
+
+def backfill(table: str, key: str):
+    # Same aggregation as app/utils/ratings.rebuild_rating_summaries
+    op.execute(
+        f"INSERT INTO {table} ({key}, count, total, stars_1, stars_2, stars_3, stars_4, stars_5) "
+        f"SELECT b.{key}, count(r.id), coalesce(sum(r.rating), 0), "
+        + ", ".join(f"sum(CASE WHEN r.rating = {stars} THEN 1 ELSE 0 END)" for stars in range(1, 6))
+        + f" FROM reviews r JOIN bookings b ON b.id = r.booking_id GROUP BY b.{key}"
+    )
+
+
+def upgrade() -> None:
+    op.create_table('service_ratings',
+        sa.Column('service_id', sa.Integer(), nullable=False),
+        *summary_columns(),
+        sa.ForeignKeyConstraint(['service_id'], ['services.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('service_id')
+    )
+    op.create_table('freelancer_ratings',
+        sa.Column('freelancer_id', sa.Integer(), nullable=False),
+        *summary_columns(),
+        sa.ForeignKeyConstraint(['freelancer_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('freelancer_id')
+    )
+    backfill('service_ratings', 'service_id')
+    backfill('freelancer_ratings', 'freelancer_id')
+
+
+def downgrade() -> None:
+    op.drop_table('freelancer_ratings')
+    op.drop_table('service_ratings')
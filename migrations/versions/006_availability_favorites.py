@@ -0,0 +1,67 @@
+"""availability_slots and favorites tables
+
+Both were only ever created by the import-time create_all in app/main.py,
+which is gone; installs that already have them just get the missing
+keyset index. Offline (alembic upgrade --sql) there is nothing to
+inspect, so the script creates both tables.
+
+Revision ID: 006_availability_favorites
+Revises: 005_rating_summaries
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '006_availability_favorites'
+down_revision: Union[str, None] = '005_rating_summaries'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    inspector = None if context.is_offline_mode() else sa.inspect(op.get_bind())
+
+    def missing(table: str) -> bool:
+        return inspector is None or not inspector.has_table(table)
+
+    if missing('availability_slots'):
+        op.create_table('availability_slots',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('freelancer_id', sa.Integer(), nullable=False),
+            sa.Column('day_of_week', sa.Integer(), nullable=False),
+            sa.Column('start_time', sa.Time(), nullable=False),
+            sa.Column('end_time', sa.Time(), nullable=False),
+            sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+            sa.ForeignKeyConstraint(['freelancer_id'], ['users.id'], ondelete='CASCADE'),
+            sa.PrimaryKeyConstraint('id')
+        )
+        op.create_index(op.f('ix_availability_slots_id'), 'availability_slots', ['id'], unique=False)
+
+    if missing('favorites'):
+        op.create_table('favorites',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('user_id', sa.Integer(), nullable=False),
+            sa.Column('service_id', sa.Integer(), nullable=False),
+            sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+            sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+            sa.ForeignKeyConstraint(['service_id'], ['services.id'], ondelete='CASCADE'),
+            sa.PrimaryKeyConstraint('id'),
+            sa.UniqueConstraint('user_id', 'service_id', name='unique_user_service_favorite')
+        )
+        op.create_index(op.f('ix_favorites_id'), 'favorites', ['id'], unique=False)
+
+    # Keyset index for GET /favorites/; 003 used to create it where the table already existed
+    op.execute('CREATE INDEX IF NOT EXISTS ix_favorites_user_created ON favorites (user_id, created_at, id)')
+
+
+def downgrade() -> None:
+    op.drop_index('ix_favorites_user_created', table_name='favorites')
+    op.drop_index(op.f('ix_favorites_id'), table_name='favorites')
+    op.drop_table('favorites')
+    op.drop_index(op.f('ix_availability_slots_id'), table_name='availability_slots')
+    op.drop_table('availability_slots')
@@ -0,0 +1,51 @@
+"""Indexes for the remaining hot lookups, built concurrently
+
+Covers availability by freelancer, the per-freelancer catalog ordered by
+created_at, and the foreign keys that cascading deletes and the
+Booking.review / favorited_by relationships look up. Every statement
+runs outside a transaction so Postgres can use CREATE/DROP INDEX
+CONCURRENTLY and never block writes. scripts/check_query_plans.py
+verifies the plans.
+
+Revision ID: 007_hot_query_indexes
+Revises: 006_availability_favorites
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '007_hot_query_indexes'
+down_revision: Union[str, None] = '006_availability_favorites'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (name, table, columns); must match the Index() declarations on the models
+INDEXES = (
+    ('ix_availability_slots_freelancer_day', 'availability_slots', ['freelancer_id', 'day_of_week', 'start_time']),
+    ('ix_services_freelancer_created', 'services', ['freelancer_id', 'created_at', 'id']),
+    ('ix_bookings_service', 'bookings', ['service_id']),
+    ('ix_reviews_booking', 'reviews', ['booking_id']),
+    ('ix_favorites_service', 'favorites', ['service_id']),
+)
+
+
+def upgrade() -> None:
+    # A failed CONCURRENTLY build leaves an INVALID index behind: drop it
+    # by hand before re-running.
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, unique=False, postgresql_concurrently=True)
+        # Superseded by the (freelancer_id, created_at, id) prefix
+        op.drop_index('ix_services_freelancer', table_name='services', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index('ix_services_freelancer', 'services', ['freelancer_id'], unique=False,
+                        postgresql_concurrently=True)
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
@@ -0,0 +1,52 @@
+"""outbox_events table for booking lifecycle side effects
+
+Revision ID: 008_outbox_events
+Revises: 007_hot_query_indexes
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '008_outbox_events'
+down_revision: Union[str, None] = '007_hot_query_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PENDING = 'processed_at IS NULL AND failed_at IS NULL'
+PROCESSED = 'processed_at IS NOT NULL'
+FAILED = 'failed_at IS NOT NULL'
+
+
+def upgrade() -> None:
+    op.create_table('outbox_events',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('topic', sa.String(), nullable=False),
+        sa.Column('aggregate_id', sa.Integer(), nullable=True),
+        sa.Column('payload', sa.JSON().with_variant(postgresql.JSONB(), 'postgresql'), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('available_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('attempts', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('last_error', sa.Text(), nullable=True),
+        sa.Column('processed_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('failed_at', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_outbox_events_pending', 'outbox_events', ['available_at', 'id'], unique=False,
+                    postgresql_where=sa.text(PENDING), sqlite_where=sa.text(PENDING))
+    op.create_index('ix_outbox_events_processed', 'outbox_events', ['processed_at'], unique=False,
+                    postgresql_where=sa.text(PROCESSED), sqlite_where=sa.text(PROCESSED))
+    op.create_index('ix_outbox_events_failed', 'outbox_events', ['failed_at'], unique=False,
+                    postgresql_where=sa.text(FAILED), sqlite_where=sa.text(FAILED))
+
+
+def downgrade() -> None:
+    op.drop_index('ix_outbox_events_failed', table_name='outbox_events')
+    op.drop_index('ix_outbox_events_processed', table_name='outbox_events')
+    op.drop_index('ix_outbox_events_pending', table_name='outbox_events')
+    op.drop_table('outbox_events')
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Benchmark: building a weekly availability template with PUT /availability/
+vs one POST /availability/ per slot.
+
+Registers a freelancer and times, in-process:
+
+  post loop     --slots disjoint slots, one POST (and one commit) each
+  put (fresh)   the same slots as one template on a second freelancer
+  put (edit)    re-upload with --edit-pct of the slots moved; only the
+                changed rows are deleted/inserted
+  put (messy)   every slot sent three times with overlapping copies; the
+                sweep-line merge stores the same rows as the clean upload
+
+Also prints GET /services/{id}/free-slots over 90 days for the messy
+template, which reads the merged rows. Uses DATABASE_URL; the schema must
+already exist. Requires httpx.
+
+    python scripts/bench_availability_template.py --slots 300
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+import uuid
+from datetime import time as dtime
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+
+def register(client: TestClient, role: str) -> dict:
+    tag = uuid.uuid4().hex[:8]
+    username = f"bench_{role[:2]}_{tag}"
+    client.post("/auth/register", json={"username": username, "email": f"{username}@example.com",
+                                        "password": "bench-pass", "role": role}).raise_for_status()
+    r = client.post("/auth/login", data={"username": username, "password": "bench-pass"})
+    r.raise_for_status()
+    return {"Authorization": f"Bearer {r.json()['access_token']}"}
+
+
+def clock(minutes: int) -> str:
+    return dtime(minutes // 60, minutes % 60).isoformat(timespec="minutes")
+
+
+def weekly_slots(count: int, rng: random.Random, shift: float = 0.0) -> list[dict]:
+    # Per day: `count / 7` slots of 15 minutes, 5-minute gaps, so nothing touches
+    per_day = -(-count // 7)
+    if per_day * 20 > 24 * 60:
+        raise SystemExit(f"--slots {count} does not fit in a week of 15-minute slots")
+    slots = []
+    for i in range(count):
+        day, n = i % 7, i // 7
+        start = n * 20 + (5 if rng.random() < shift else 0)
+        slots.append({"day_of_week": day, "start_time": clock(start), "end_time": clock(start + 15)})
+    return slots
+
+
+def timed(fn) -> float:
+    t0 = time.perf_counter()
+    fn()
+    return (time.perf_counter() - t0) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--slots", type=int, default=300)
+    parser.add_argument("--edit-pct", type=float, default=10.0)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+
+    with TestClient(app) as client:
+        slots = weekly_slots(args.slots, rng)
+
+        headers = register(client, "freelancer")
+
+        def post_loop():
+            for slot in slots:
+                client.post("/availability/", json=slot, headers=headers).raise_for_status()
+
+        print(f"post loop    {args.slots:5} slots  {timed(post_loop):9.1f}ms")
+
+        headers = register(client, "freelancer")
+        put = lambda body: client.put("/availability/", json={"slots": body}, headers=headers)  # noqa: E731
+        result = {}
+
+        def run(body):
+            r = put(body)
+            r.raise_for_status()
+            result.update(r.json())
+
+        for label, body in (
+            ("put (fresh)", slots),
+            ("put (edit)", weekly_slots(args.slots, random.Random(args.seed), shift=args.edit_pct / 100)),
+            ("put (messy)", [dict(slot, end_time=clock(int(slot["end_time"][:2]) * 60 + int(slot["end_time"][3:]) - k))
+                             for slot in slots for k in (0, 5, 10)]),
+        ):
+            ms = timed(lambda: run(body))
+            print(f"{label:12} {len(body):5} slots  {ms:9.1f}ms  inserted={result['inserted']} "
+                  f"deleted={result['deleted']} unchanged={result['unchanged']} stored={len(result['slots'])}")
+
+        r = client.post("/services/", json={"title": "Bench", "description": "bench", "price": 10, "duration": 15},
+                        headers=headers)
+        r.raise_for_status()
+        params = {"from": "2030-01-07T00:00:00Z", "to": "2030-04-07T00:00:00Z"}
+        client.get(f"/services/{r.json()['id']}/free-slots", params=params).raise_for_status()
+        ms = timed(lambda: client.get(f"/services/{r.json()['id']}/free-slots", params=params).raise_for_status())
+        print(f"free-slots over 90 days on the merged template  {ms:7.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
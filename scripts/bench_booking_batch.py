@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Benchmark: POST /bookings/batch vs one POST /bookings/ per item.
+
+Creates --freelancers freelancers with one service each and a client, then
+books --items non-overlapping slots spread over them twice: once as a loop
+of single POSTs, once as batches of --batch-size. Both runs go through the
+app in-process, so the gap is round trips, per-item service lookups and
+per-item commits. Uses DATABASE_URL; the schema must already exist.
+Requires httpx.
+
+    python scripts/bench_booking_batch.py --items 2000 --batch-size 500
+"""
+
+import argparse
+import os
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+
+def register(client: TestClient, role: str) -> dict:
+    tag = uuid.uuid4().hex[:8]
+    username = f"bench_{role[:2]}_{tag}"
+    client.post("/auth/register", json={"username": username, "email": f"{username}@example.com",
+                                        "password": "bench-pass", "role": role}).raise_for_status()
+    r = client.post("/auth/login", data={"username": username, "password": "bench-pass"})
+    r.raise_for_status()
+    return {"Authorization": f"Bearer {r.json()['access_token']}"}
+
+
+def slots(service_ids: list[int], count: int, origin: datetime) -> list[dict]:
+    # Round-robin over services, one hour apart per service: never overlapping
+    return [
+        {"service_id": service_ids[i % len(service_ids)],
+         "start_at": (origin + timedelta(hours=i // len(service_ids))).isoformat()}
+        for i in range(count)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=2000)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--freelancers", type=int, default=20)
+    args = parser.parse_args()
+
+    with TestClient(app) as client:
+        service_ids = []
+        for _ in range(args.freelancers):
+            headers = register(client, "freelancer")
+            r = client.post("/services/", json={"title": "Bench", "description": "bench", "price": 10,
+                                                "duration": 30}, headers=headers)
+            r.raise_for_status()
+            service_ids.append(r.json()["id"])
+        client_headers = register(client, "client")
+
+        # Far-future, disjoint windows so reruns against the same database don't collide
+        origin = datetime(2100, 1, 1, tzinfo=timezone.utc) + timedelta(days=uuid.uuid4().int % 5000 * 400)
+
+        items = slots(service_ids, args.items, origin)
+        t0 = time.perf_counter()
+        for item in items:
+            client.post("/bookings/", json=item, headers=client_headers).raise_for_status()
+        loop_s = time.perf_counter() - t0
+
+        items = slots(service_ids, args.items, origin + timedelta(days=200))
+        t0 = time.perf_counter()
+        created = 0
+        for offset in range(0, len(items), args.batch_size):
+            r = client.post("/bookings/batch", json={"items": items[offset:offset + args.batch_size]},
+                            headers=client_headers)
+            r.raise_for_status()
+            created += r.json()["created"]
+        batch_s = time.perf_counter() - t0
+
+    print(f"per-item loop  {args.items} bookings in {loop_s:7.2f}s  ({args.items / loop_s:8.0f}/s)")
+    print(f"batch of {args.batch_size:<5} {created} bookings in {batch_s:7.2f}s  ({created / batch_s:8.0f}/s)  "
+          f"x{loop_s / batch_s:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Concurrency benchmark for booking conflict detection.
+
+Fires hundreds of simultaneous POST /bookings/ requests at a single freelancer
+with heavily overlapping start times, then checks the bookings table for
+overlaps and reports latency percentiles.
+
+By default the app is driven in-process; pass --base-url to target a running
+server (e.g. `uvicorn app.main:app --workers 4`) sharing the same DATABASE_URL.
+Requires httpx.
+
+    python scripts/bench_booking_conflicts.py --requests 500 --concurrency 15
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+
+from app.database.connection import SessionLocal
+from app.core.security import create_access_token
+from app.models.user import User, UserRole
+from app.models.service import Service
+from app.models.booking import Booking
+from app.utils.booking_index import ACTIVE_STATUSES, to_epoch
+
+
+def seed(duration: int):
+    """Create a throwaway freelancer, client and service for this run."""
+    db = SessionLocal()
+    try:
+        tag = uuid.uuid4().hex[:8]
+        freelancer = User(username=f"bench_fr_{tag}", email=f"bench_fr_{tag}@bench.local",
+                          password="!", role=UserRole.freelancer)
+        client = User(username=f"bench_cl_{tag}", email=f"bench_cl_{tag}@bench.local",
+                      password="!", role=UserRole.client)
+        db.add_all([freelancer, client])
+        db.commit()
+        service = Service(freelancer_id=freelancer.id, title="Bench service", description="bench",
+                          price=1.0, duration=duration, created_by_role=UserRole.freelancer)
+        db.add(service)
+        db.commit()
+        token = create_access_token(data={"sub": str(client.id), "username": client.username, "role": "client"})
+        return freelancer.id, service.id, token
+    finally:
+        db.close()
+
+
+def count_overlaps(freelancer_id: int) -> tuple[int, int]:
+    db = SessionLocal()
+    try:
+        rows = (
+            db.query(Booking.start_at, Booking.end_at)
+            .filter(Booking.freelancer_id == freelancer_id, Booking.status.in_(ACTIVE_STATUSES))
+            .order_by(Booking.start_at)
+            .all()
+        )
+    finally:
+        db.close()
+    overlaps = 0
+    last_end = None
+    for start_at, end_at in rows:
+        if last_end is not None and to_epoch(start_at) < last_end:
+            overlaps += 1
+        last_end = max(last_end or 0, to_epoch(end_at))
+    return len(rows), overlaps
+
+
+def percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+async def run(args):
+    freelancer_id, service_id, token = seed(args.duration)
+    day = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=30)
+    rng = random.Random(args.seed)
+    # 15-minute grid over `--hours` hours: with 60-minute services most requests collide
+    starts = [day + timedelta(minutes=15 * rng.randrange(args.hours * 4)) for _ in range(args.requests)]
+
+    if args.base_url:
+        transport, base_url = None, args.base_url
+    else:
+        from app.main import app
+        transport, base_url = httpx.ASGITransport(app=app), "http://bench"
+
+    latencies: list[float] = []
+    statuses: dict[int, int] = {}
+    gate = asyncio.Semaphore(args.concurrency)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    async with httpx.AsyncClient(transport=transport, base_url=base_url, timeout=60) as client:
+        async def book(start_at: datetime):
+            async with gate:
+                t0 = time.perf_counter()
+                r = await client.post("/bookings/", json={"service_id": service_id, "start_at": start_at.isoformat()},
+                                      headers=headers)
+                latencies.append((time.perf_counter() - t0) * 1000)
+                statuses[r.status_code] = statuses.get(r.status_code, 0) + 1
+
+        t0 = time.perf_counter()
+        await asyncio.gather(*(book(s) for s in starts))
+        elapsed = time.perf_counter() - t0
+
+    active, overlaps = count_overlaps(freelancer_id)
+    print(f"requests={args.requests} concurrency={args.concurrency} elapsed={elapsed:.2f}s "
+          f"rps={args.requests / elapsed:.1f}")
+    print(f"status codes: {dict(sorted(statuses.items()))}")
+    print(f"latency ms: p50={percentile(latencies, 50):.1f} p95={percentile(latencies, 95):.1f} "
+          f"p99={percentile(latencies, 99):.1f} max={max(latencies):.1f}")
+    print(f"active bookings={active} overlaps={overlaps}")
+    return overlaps
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=300)
+    # Keep at or below the app's pool_size + max_overflow, otherwise requests queue on the pool
+    parser.add_argument("--concurrency", type=int, default=15)
+    parser.add_argument("--duration", type=int, default=60, help="service duration in minutes")
+    parser.add_argument("--hours", type=int, default=24, help="width of the contested window")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--base-url", default=None)
+    args = parser.parse_args()
+
+    overlaps = asyncio.run(run(args))
+    if overlaps:
+        print("✗ Overlapping bookings detected")
+        sys.exit(1)
+    print("✓ No overlapping bookings")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Benchmark: calendar bitmap lookups vs. the SQL path.
+
+Seeds one freelancer with weekday availability and a few bookings per day,
+then answers the same random "is the freelancer free?" questions through
+app.utils.calendar_cache and through plain SQL over availability_slots and
+bookings. "Free" answers from the cache still include the one-row
+bookings lookup that confirms them. Uses DATABASE_URL; the schema must
+already exist.
+
+    python scripts/bench_calendar_cache.py --days 90 --queries 5000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+import uuid
+from datetime import datetime, time as dtime, timedelta, timezone
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.database.connection import SessionLocal
+from app.models.user import User, UserRole
+from app.models.service import Service
+from app.models.availability import AvailabilitySlot
+from app.models.booking import Booking, BookingStatus
+from app.utils.booking_index import has_db_conflict
+from app.utils.calendar_cache import CalendarCache
+
+
+def seed(db, days: int, per_day: int, rng: random.Random, start: datetime) -> int:
+    tag = uuid.uuid4().hex[:8]
+    freelancer = User(username=f"bench_fr_{tag}", email=f"bench_fr_{tag}@bench.local", password="!",
+                      role=UserRole.freelancer)
+    client = User(username=f"bench_cl_{tag}", email=f"bench_cl_{tag}@bench.local", password="!",
+                  role=UserRole.client)
+    db.add_all([freelancer, client])
+    db.commit()
+    service = Service(freelancer_id=freelancer.id, title="Bench", description="bench", price=1.0, duration=60,
+                      created_by_role=UserRole.freelancer)
+    db.add(service)
+    db.add_all(AvailabilitySlot(freelancer_id=freelancer.id, day_of_week=dow, start_time=dtime(9),
+                                end_time=dtime(17)) for dow in range(5))
+    db.commit()
+
+    bookings = []
+    for day in range(days):
+        # Non-overlapping hours picked per day
+        for hour in rng.sample(range(9, 17), per_day):
+            at = start + timedelta(days=day, hours=hour)
+            bookings.append(Booking(client_id=client.id, freelancer_id=freelancer.id, service_id=service.id,
+                                    start_at=at, end_at=at + timedelta(hours=1), status=BookingStatus.confirmed))
+    db.add_all(bookings)
+    db.commit()
+    return freelancer.id
+
+
+def sql_is_free(db, freelancer_id: int, start_at: datetime, end_at: datetime) -> bool:
+    # Same question the bitmap answers; single-day windows only
+    inside = db.query(AvailabilitySlot.id).filter(
+        AvailabilitySlot.freelancer_id == freelancer_id,
+        AvailabilitySlot.day_of_week == start_at.weekday(),
+        AvailabilitySlot.start_time <= start_at.time(),
+        AvailabilitySlot.end_time >= end_at.time(),
+    )
+    if not db.query(inside.exists()).scalar():
+        return False
+    return not has_db_conflict(db, freelancer_id, start_at, end_at)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--days", type=int, default=90)
+    parser.add_argument("--bookings-per-day", type=int, default=4)
+    parser.add_argument("--queries", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    start = datetime(2030, 1, 7, tzinfo=timezone.utc)
+    db = SessionLocal()
+    try:
+        freelancer_id = seed(db, args.days, args.bookings_per_day, rng, start)
+        questions = []
+        for _ in range(args.queries):
+            at = start + timedelta(days=rng.randrange(args.days), minutes=rng.randrange(8 * 60, 17 * 60, 15))
+            questions.append((at, at + timedelta(minutes=rng.choice([30, 60]))))
+
+        t0 = time.perf_counter()
+        sql_answers = [sql_is_free(db, freelancer_id, s, e) for s, e in questions]
+        sql_time = time.perf_counter() - t0
+
+        cache = CalendarCache(max_freelancers=10, max_days=args.days + 1, ttl=3600)
+        t0 = time.perf_counter()
+        cache_answers = [cache.is_free(db, freelancer_id, s, e) for s, e in questions]
+        cache_time = time.perf_counter() - t0
+    finally:
+        db.close()
+
+    stats = cache.stats()
+    mismatches = sum(a != b for a, b in zip(sql_answers, cache_answers))
+    print(f"queries={args.queries} days={args.days} bookings={args.days * args.bookings_per_day}")
+    print(f"sql:    {sql_time * 1e6 / args.queries:8.1f} us/lookup")
+    print(f"bitmap: {cache_time * 1e6 / args.queries:8.1f} us/lookup "
+          f"(hit_rate={stats['hit_rate']}, bytes={stats['bytes']})")
+    print(f"speedup x{sql_time / cache_time:.1f}, mismatches={mismatches}")
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
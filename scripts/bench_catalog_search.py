@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Benchmark: GET /services/ catalog search over a large synthetic catalog.
+
+Bulk-inserts --rows services (titles/descriptions drawn from a small
+vocabulary so terms have realistic selectivity), then times a mix of
+searches in-process: text queries with each sort, filter-only browsing,
+facets on and off, and a deep page reached by following cursors. On
+Postgres the queries hit the GIN/btree indexes from migration
+004_service_search; on SQLite they use the in-process inverted index.
+Uses DATABASE_URL; the schema must already exist. Requires httpx.
+
+    python scripts/bench_catalog_search.py --rows 1000000
+    python scripts/bench_catalog_search.py --skip-seed      # reuse an earlier seed
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+import uuid
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.testclient import TestClient
+from sqlalchemy import insert
+
+from app.database.connection import SessionLocal
+from app.models.user import User, UserRole
+from app.models.service import Service
+from app.main import app
+
+BATCH = 10_000
+SKILLS = ["logo", "brand", "python", "fastapi", "react", "seo", "copywriting", "photography", "video", "editing",
+          "wordpress", "shopify", "mobile", "android", "ios", "data", "analysis", "excel", "translation", "voice",
+          "illustration", "animation", "marketing", "ads", "consulting", "tax", "legal", "resume", "tutoring", "music"]
+NOUNS = ["design", "development", "audit", "strategy", "setup", "review", "coaching", "production", "support", "plan"]
+
+SCENARIOS = [
+    ("text, relevance", {"q": "logo design"}),
+    ("text, price_asc", {"q": "python", "sort": "price_asc"}),
+    ("text, rating", {"q": "seo audit", "sort": "rating"}),
+    ("text + filters", {"q": "video", "min_price": 50, "max_price": 200, "max_duration": 120}),
+    ("browse newest", {"sort": "newest"}),
+    ("browse price filter", {"sort": "price_desc", "min_price": 100, "max_price": 150}),
+    ("browse, no facets", {"sort": "newest", "facets": "false"}),
+]
+
+
+def seed(rows: int):
+    rng = random.Random(42)
+    db = SessionLocal()
+    try:
+        freelancers = []
+        for _ in range(50):
+            tag = uuid.uuid4().hex[:8]
+            freelancers.append(User(username=f"bench_fr_{tag}", email=f"bench_fr_{tag}@bench.local", password="!",
+                                    role=UserRole.freelancer))
+        db.add_all(freelancers)
+        db.commit()
+        freelancer_ids = [f.id for f in freelancers]
+        for offset in range(0, rows, BATCH):
+            batch = []
+            for _ in range(min(BATCH, rows - offset)):
+                skill, noun = rng.choice(SKILLS), rng.choice(NOUNS)
+                extra = " ".join(rng.sample(SKILLS, 4))
+                batch.append({
+                    "freelancer_id": rng.choice(freelancer_ids),
+                    "title": f"{skill.title()} {noun}",
+                    "description": f"Professional {skill} {noun} with {extra} experience",
+                    "price": round(rng.lognormvariate(4, 1), 2),
+                    "duration": rng.choice([15, 30, 45, 60, 90, 120, 180, 240, 480]),
+                    "created_by_role": UserRole.freelancer,
+                })
+            db.execute(insert(Service), batch)
+            db.commit()
+    finally:
+        db.close()
+
+
+def timed(client: TestClient, params: dict, repeat: int) -> tuple[float, float, dict]:
+    samples, body = [], None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        r = client.get("/services/", params=params)
+        samples.append((time.perf_counter() - t0) * 1000)
+        r.raise_for_status()
+        body = r.json()
+    samples.sort()
+    return statistics.median(samples), samples[min(len(samples) - 1, int(len(samples) * 0.95))], body
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--depth", type=int, default=50, help="pages to follow for the deep-page row")
+    parser.add_argument("--skip-seed", action="store_true")
+    args = parser.parse_args()
+
+    if not args.skip_seed:
+        t0 = time.perf_counter()
+        seed(args.rows)
+        print(f"seeded {args.rows} services in {time.perf_counter() - t0:.1f}s")
+
+    with TestClient(app) as client:
+        t0 = time.perf_counter()
+        client.get("/services/", params={"q": "warmup", "facets": "false"}).raise_for_status()
+        print(f"first search (index warm-up) {(time.perf_counter() - t0) * 1000:.0f}ms")
+
+        for label, params in SCENARIOS:
+            p50, p95, body = timed(client, {"limit": 24, **params}, args.repeat)
+            total = body["facets"]["total"] if body["facets"] else "-"
+            print(f"{label:22} p50={p50:8.1f}ms p95={p95:8.1f}ms  matches={total}")
+
+        params = {"q": "marketing", "sort": "price_asc", "limit": 24, "facets": "false"}
+        cursor = None
+        for _ in range(args.depth):
+            body = client.get("/services/", params={**params, **({"cursor": cursor} if cursor else {})}).json()
+            cursor = body["next_cursor"]
+            if not cursor:
+                break
+        if cursor:
+            p50, p95, _ = timed(client, {**params, "cursor": cursor}, args.repeat)
+            print(f"{'page ' + str(args.depth + 1) + ', price_asc':22} p50={p50:8.1f}ms p95={p95:8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
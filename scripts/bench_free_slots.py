@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the free-slot computation behind GET /services/{id}/free-slots.
+
+Builds a synthetic busy freelancer (split weekly availability, a booking in
+most free hours) and times the interval arithmetic over a 90-day range.
+No database needed.
+
+    python scripts/bench_free_slots.py --days 90 --bookings-per-day 8
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils.free_slots import free_slot_starts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--days", type=int, default=90)
+    parser.add_argument("--bookings-per-day", type=int, default=8)
+    parser.add_argument("--duration", type=int, default=30, help="service duration in minutes")
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    # Mon-Sat, 08:00-12:00 and 13:00-20:00
+    slots = [(dow, 8 * 60, 12 * 60) for dow in range(6)] + [(dow, 13 * 60, 20 * 60) for dow in range(6)]
+
+    start = datetime(2030, 1, 7, tzinfo=timezone.utc)
+    end = start + timedelta(days=args.days)
+    bookings = []
+    for day in range(args.days):
+        base = start + timedelta(days=day)
+        for _ in range(args.bookings_per_day):
+            at = base + timedelta(minutes=rng.randrange(8 * 60, 20 * 60, 15))
+            bookings.append((at, at + timedelta(minutes=rng.choice([30, 45, 60, 90]))))
+
+    timings = []
+    for _ in range(args.repeat):
+        t0 = time.perf_counter()
+        result = free_slot_starts(slots, bookings, start, end, args.duration)
+        timings.append((time.perf_counter() - t0) * 1000)
+    timings.sort()
+
+    print(f"days={args.days} weekly_slots={len(slots)} bookings={len(bookings)} free_slots={len(result)}")
+    print(f"ms: min={timings[0]:.2f} p50={timings[len(timings) // 2]:.2f} max={timings[-1]:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Benchmark: GET /bookings/ latency by page depth with keyset pagination.
+
+Seeds --rows bookings, then for each depth fetches the page that starts
+`depth * limit` rows in, once through the API with an opaque cursor and once
+as the equivalent LIMIT/OFFSET query. Keyset latency should stay flat while
+OFFSET grows with depth. Uses DATABASE_URL; the schema (including migration
+003_keyset_indexes) must already exist. Requires httpx.
+
+    python scripts/bench_keyset_pagination.py --rows 200000 --depths 0,10,100,1000
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.testclient import TestClient
+from sqlalchemy import insert, select
+
+from app.database.connection import SessionLocal
+from app.core.security import create_access_token
+from app.models.user import User, UserRole
+from app.models.service import Service
+from app.models.booking import Booking, BookingStatus
+from app.utils.pagination import encode_cursor
+from app.main import app
+
+BATCH = 10_000
+
+
+def seed(rows: int) -> str:
+    """`rows` bookings for a fresh client/freelancer pair; returns an admin token."""
+    db = SessionLocal()
+    try:
+        tag = uuid.uuid4().hex[:8]
+        admin = User(username=f"bench_ad_{tag}", email=f"bench_ad_{tag}@bench.local", password="!",
+                     role=UserRole.admin)
+        freelancer = User(username=f"bench_fr_{tag}", email=f"bench_fr_{tag}@bench.local", password="!",
+                          role=UserRole.freelancer)
+        client = User(username=f"bench_cl_{tag}", email=f"bench_cl_{tag}@bench.local", password="!",
+                      role=UserRole.client)
+        db.add_all([admin, freelancer, client])
+        db.commit()
+        service = Service(freelancer_id=freelancer.id, title="Bench", description="bench", price=10.0, duration=30,
+                          created_by_role=UserRole.freelancer)
+        db.add(service)
+        db.commit()
+
+        start = datetime.now(timezone.utc) + timedelta(days=365)
+        created = datetime.now(timezone.utc) - timedelta(seconds=rows)
+        for offset in range(0, rows, BATCH):
+            db.execute(insert(Booking), [
+                {"client_id": client.id, "freelancer_id": freelancer.id, "service_id": service.id,
+                 "start_at": start + timedelta(hours=i), "end_at": start + timedelta(hours=i, minutes=30),
+                 "status": BookingStatus.completed, "created_at": created + timedelta(seconds=i)}
+                for i in range(offset, min(offset + BATCH, rows))
+            ])
+            db.commit()
+        return create_access_token(data={"sub": str(admin.id), "username": admin.username, "role": "admin"})
+    finally:
+        db.close()
+
+
+def newest_first():
+    return select(Booking).order_by(Booking.created_at.desc(), Booking.id.desc())
+
+
+def cursor_at(skip: int) -> str | None:
+    """Cursor that resumes after the first `skip` rows (what page depth N would hand back)."""
+    if skip == 0:
+        return None
+    db = SessionLocal()
+    try:
+        row = db.execute(newest_first().with_only_columns(Booking.created_at, Booking.id)
+                         .offset(skip - 1).limit(1)).one()
+        return encode_cursor(row.created_at, row.id)
+    finally:
+        db.close()
+
+
+def time_keyset(client: TestClient, headers: dict, cursor: str | None, limit: int, repeat: int) -> float:
+    params = {"limit": limit, **({"cursor": cursor} if cursor else {})}
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        client.get("/bookings/", params=params, headers=headers).raise_for_status()
+        samples.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(samples)
+
+
+def time_offset(skip: int, limit: int, repeat: int) -> float:
+    db = SessionLocal()
+    try:
+        samples = []
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            db.scalars(newest_first().offset(skip).limit(limit)).all()
+            samples.append((time.perf_counter() - t0) * 1000)
+        return statistics.median(samples)
+    finally:
+        db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--depths", default="0,10,100,1000", help="comma-separated page numbers")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    depths = [int(d) for d in args.depths.split(",")]
+
+    t0 = time.perf_counter()
+    headers = {"Authorization": f"Bearer {seed(args.rows)}"}
+    print(f"seeded {args.rows} bookings in {time.perf_counter() - t0:.1f}s")
+
+    with TestClient(app) as client:
+        for depth in depths:
+            skip = depth * args.limit
+            keyset_ms = time_keyset(client, headers, cursor_at(skip), args.limit, args.repeat)
+            offset_ms = time_offset(skip, args.limit, args.repeat)
+            print(f"page {depth:>6}  keyset (API) p50={keyset_ms:8.2f}ms   offset (SQL only) p50={offset_ms:8.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
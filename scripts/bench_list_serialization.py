@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Benchmark: serialization cost of the list endpoints, schema path vs FAST_JSON_LISTS.
+
+Seeds --rows bookings with one review each, then for both GET /bookings/
+(BookingOut) and GET /reviews/ (ReviewOut) measures, per 10k rows:
+
+  * in process: fetching the rows (ORM instances vs Core tuples) and
+    turning them into the response body (FastAPI's response-model
+    validation + dump_json vs app/utils/fast_json.py), checking that both
+    bodies are byte-identical;
+  * end to end: paging through all rows with ?limit=200 via the API, with
+    FAST_JSON_LISTS off and on (same bodies required again).
+
+Uses DATABASE_URL; the schema must already exist.
+
+    python scripts/bench_list_serialization.py --rows 10000
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.testclient import TestClient
+from pydantic import TypeAdapter
+from sqlalchemy import insert, select
+
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.database.connection import SessionLocal
+from app.models.booking import Booking, BookingStatus
+from app.models.review import Review
+from app.models.service import Service
+from app.models.user import User, UserRole
+from app.routers.Booking import BOOKING_OUT_COLUMNS
+from app.routers.review import REVIEW_OUT_COLUMNS
+from app.schemas.booking import BookingPage
+from app.schemas.review import ReviewPage
+from app.utils import fast_json
+from app.main import app
+
+BATCH = 5_000
+PAGE_LIMIT = 200
+STATUSES = list(BookingStatus)
+
+
+def seed(rows: int) -> tuple[int, str]:
+    """`rows` bookings of one fresh freelancer, each with a review; returns (freelancer id, admin token)."""
+    db = SessionLocal()
+    try:
+        tag = uuid.uuid4().hex[:8]
+        admin = User(username=f"bench_ad_{tag}", email=f"bench_ad_{tag}@bench.local", password="!",
+                     role=UserRole.admin)
+        freelancer = User(username=f"bench_fr_{tag}", email=f"bench_fr_{tag}@bench.local", password="!",
+                          role=UserRole.freelancer)
+        client = User(username=f"bench_cl_{tag}", email=f"bench_cl_{tag}@bench.local", password="!",
+                      role=UserRole.client)
+        db.add_all([admin, freelancer, client])
+        db.commit()
+        service = Service(freelancer_id=freelancer.id, title="Bench", description="bench", price=10.0, duration=30,
+                          created_by_role=UserRole.freelancer)
+        db.add(service)
+        db.commit()
+
+        start = datetime.now(timezone.utc) + timedelta(days=365)
+        created = datetime.now(timezone.utc) - timedelta(seconds=rows)
+        for offset in range(0, rows, BATCH):
+            ids = db.scalars(insert(Booking).returning(Booking.id), [
+                {"client_id": client.id, "freelancer_id": freelancer.id, "service_id": service.id,
+                 "start_at": start + timedelta(hours=i), "end_at": start + timedelta(hours=i, minutes=30),
+                 "status": STATUSES[i % len(STATUSES)], "created_at": created + timedelta(seconds=i)}
+                for i in range(offset, min(offset + BATCH, rows))
+            ]).all()
+            db.execute(insert(Review), [
+                {"booking_id": booking_id, "rating": 1 + i % 5, "comment": f"Bench review {i} – ok" if i % 3 else None,
+                 "created_at": created + timedelta(seconds=offset + i, microseconds=i)}
+                for i, booking_id in enumerate(ids)
+            ])
+            db.commit()
+        token = create_access_token(data={"sub": str(admin.id), "username": admin.username, "role": "admin"})
+        return freelancer.id, token
+    finally:
+        db.close()
+
+
+def listings(freelancer_id: int) -> dict:
+    """Per endpoint: (ORM select, Core select, page schema, API path)."""
+    bookings = (Booking.freelancer_id == freelancer_id,)
+    reviews = (Booking.id == Review.booking_id, Booking.freelancer_id == freelancer_id)
+    order = {"bookings": (Booking.created_at.desc(), Booking.id.desc()),
+             "reviews": (Review.created_at.desc(), Review.id.desc())}
+    return {
+        "GET /bookings/": (select(Booking).where(*bookings).order_by(*order["bookings"]),
+                           select(*BOOKING_OUT_COLUMNS).where(*bookings).order_by(*order["bookings"]),
+                           BookingPage, "/bookings/"),
+        "GET /reviews/": (select(Review).join(Booking, reviews[0]).where(reviews[1]).order_by(*order["reviews"]),
+                          select(*REVIEW_OUT_COLUMNS).join(Booking, reviews[0]).where(reviews[1])
+                          .order_by(*order["reviews"]),
+                          ReviewPage, "/reviews/"),
+    }
+
+
+def timed(call, repeat: int):
+    samples, result = [], None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = call()
+        samples.append(time.perf_counter() - t0)
+    return statistics.median(samples), result
+
+
+def in_process(orm_stmt, core_stmt, page_schema, repeat: int) -> tuple[dict, int]:
+    adapter = TypeAdapter(page_schema)
+
+    def fetch_orm():
+        db = SessionLocal()
+        try:
+            return db.scalars(orm_stmt).all()
+        finally:
+            db.close()
+
+    def fetch_core():
+        db = SessionLocal()
+        try:
+            return db.execute(core_stmt).all()
+        finally:
+            db.close()
+
+    fetch_orm_s, instances = timed(fetch_orm, repeat)
+    fetch_core_s, rows = timed(fetch_core, repeat)
+    # What FastAPI does with a response_model: validate from attributes, then dump to JSON
+    schema_s, schema_body = timed(lambda: adapter.dump_json(
+        adapter.validate_python({"items": instances, "next_cursor": None}, from_attributes=True)), repeat)
+    fast_s, fast_body = timed(lambda: fast_json.dumps(
+        {"items": fast_json.as_dicts(rows), "next_cursor": None}), repeat)
+    if schema_body != fast_body:
+        sys.exit(f"bodies differ:\n{schema_body[:300]!r}\n{fast_body[:300]!r}")
+    return {"fetch": (fetch_orm_s, fetch_core_s), "serialize": (schema_s, fast_s)}, len(rows)
+
+
+def end_to_end(client: TestClient, path: str, params: dict, headers: dict) -> tuple[float, list[bytes]]:
+    bodies, cursor = [], None
+    t0 = time.perf_counter()
+    while True:
+        r = client.get(path, params={**params, "limit": PAGE_LIMIT, **({"cursor": cursor} if cursor else {})},
+                       headers=headers)
+        r.raise_for_status()
+        bodies.append(r.content)
+        cursor = r.json()["next_cursor"]
+        if cursor is None:
+            return time.perf_counter() - t0, bodies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    freelancer_id, token = seed(args.rows)
+    headers = {"Authorization": f"Bearer {token}"}
+    print(f"seeded {args.rows} bookings and reviews in {time.perf_counter() - t0:.1f}s "
+          f"(encoder: {'orjson' if fast_json.orjson else 'stdlib json'})")
+
+    def per_10k(seconds: float, rows: int) -> str:
+        return f"{seconds * 1000 * 10_000 / rows:8.1f}ms"
+
+    with TestClient(app) as client:
+        for name, (orm_stmt, core_stmt, page_schema, path) in listings(freelancer_id).items():
+            stages, rows = in_process(orm_stmt, core_stmt, page_schema, args.repeat)
+            print(f"\n{name}  ({rows} rows; per 10k rows, median of {args.repeat})")
+            print(f"  {'':<22}{'schema path':>12}{'fast path':>12}{'speedup':>9}")
+            for stage, (slow, fast) in stages.items():
+                print(f"  {stage:<22}{per_10k(slow, rows):>12}{per_10k(fast, rows):>12}{slow / fast:8.1f}x")
+            slow, fast = (sum(column) for column in zip(*stages.values()))
+            print(f"  {'fetch + serialize':<22}{per_10k(slow, rows):>12}{per_10k(fast, rows):>12}{slow / fast:8.1f}x")
+
+            timings = {}
+            for enabled in (False, True):
+                settings.FAST_JSON_LISTS = enabled
+                end_to_end(client, path, {"freelancer_id": freelancer_id}, headers)  # warm up
+                timings[enabled] = [end_to_end(client, path, {"freelancer_id": freelancer_id}, headers)
+                                    for _ in range(args.repeat)]
+            if timings[False][0][1] != timings[True][0][1]:
+                sys.exit(f"{name}: API responses differ between the two paths")
+            slow, fast = (statistics.median(seconds for seconds, _ in timings[enabled]) for enabled in (False, True))
+            pages = len(timings[True][0][1])
+            print(f"  {f'API, {pages} pages':<22}{per_10k(slow, rows):>12}{per_10k(fast, rows):>12}{slow / fast:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Benchmark: idle live-stream subscribers per worker and event fan-out.
+
+Starts one uvicorn worker, opens raw SSE connections to
+GET /live/freelancers/{id} in steps (--steps), and after each step prints
+the worker's RSS and the cost per subscriber over the idle baseline. Then
+creates and deletes an availability slot --events times and reports how
+long it takes until every subscriber has received each event, and the
+worker's CPU time per delivery. Linux only (reads /proc). Uses
+DATABASE_URL; the schema must already exist. Requires httpx.
+
+    python scripts/bench_live_subscribers.py --steps 1000,5000,10000
+"""
+
+import argparse
+import asyncio
+import os
+import resource
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+
+import httpx
+
+# Add parent directory to path to import app modules
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+EVENT_MARK = b"event: availability."
+
+
+def seed() -> tuple[int, str]:
+    from app.core.security import create_access_token
+    from app.database.connection import SessionLocal
+    from app.models.user import User, UserRole
+
+    db = SessionLocal()
+    try:
+        tag = uuid.uuid4().hex[:8]
+        freelancer = User(username=f"bench_fr_{tag}", email=f"bench_fr_{tag}@bench.local", password="!",
+                          role=UserRole.freelancer)
+        db.add(freelancer)
+        db.commit()
+        token = create_access_token(data={"sub": str(freelancer.id), "username": freelancer.username,
+                                          "role": "freelancer"})
+        return freelancer.id, token
+    finally:
+        db.close()
+
+
+def rss_mib(pid: int) -> float:
+    with open(f"/proc/{pid}/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    raise RuntimeError("VmRSS not found")
+
+
+def cpu_s(pid: int) -> float:
+    # utime + stime, so the client sharing the machine does not count
+    with open(f"/proc/{pid}/stat") as f:
+        fields = f.read().rsplit(")", 1)[1].split()
+    return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+class Fanout:
+    """Counts deliveries of the current event across all subscribers."""
+
+    def __init__(self):
+        self.expected = 0
+        self.count = 0
+        self.done = asyncio.Event()
+
+    def reset(self, expected: int):
+        self.expected, self.count = expected, 0
+        self.done.clear()
+
+    def hit(self, n: int):
+        self.count += n
+        if self.expected and self.count >= self.expected:
+            self.done.set()
+
+
+async def subscribe(port: int, freelancer_id: int, fanout: Fanout):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(f"GET /live/freelancers/{freelancer_id} HTTP/1.1\r\nHost: bench\r\n"
+                 f"Accept: text/event-stream\r\n\r\n".encode())
+    await reader.readuntil(b"event: ready")
+
+    async def consume():
+        tail = b""
+        while data := await reader.read(65536):
+            data = tail + data
+            fanout.hit(data.count(EVENT_MARK))
+            tail = data[-(len(EVENT_MARK) - 1):]
+
+    return writer, asyncio.create_task(consume())
+
+
+async def run(args, freelancer_id: int, token: str, port: int, server: subprocess.Popen):
+    base = f"http://127.0.0.1:{port}"
+    fanout = Fanout()
+    connections = []
+    async with httpx.AsyncClient(base_url=base, headers={"Authorization": f"Bearer {token}"}) as http:
+        # Warm up the worker (imports, first stream) before taking the baseline
+        connections.append(await subscribe(port, freelancer_id, fanout))
+        await asyncio.sleep(1)
+        baseline = rss_mib(server.pid)
+        print(f"{'subscribers':>11} {'RSS':>9} {'per sub':>9}  (baseline {baseline:.1f} MiB)")
+
+        for step in args.steps:
+            while len(connections) < step:
+                batch = min(args.connect_batch, step - len(connections))
+                connections += await asyncio.gather(*(subscribe(port, freelancer_id, fanout) for _ in range(batch)))
+            await asyncio.sleep(1)
+            live = (await http.get("/health/live")).json()
+            rss = rss_mib(server.pid)
+            print(f"{live['subscribers']:>11} {rss:8.1f}M {(rss - baseline) * 1024 / len(connections):7.2f}KiB")
+
+        latencies = []
+        cpu0 = cpu_s(server.pid)
+        for i in range(args.events):
+            fanout.reset(len(connections))
+            t0 = time.perf_counter()
+            if i % 2 == 0:
+                r = await http.post("/availability/", json={"day_of_week": 6, "start_time": "06:00",
+                                                            "end_time": "07:00"})
+                slot_id = r.raise_for_status().json()["id"]
+            else:
+                (await http.delete(f"/availability/{slot_id}")).raise_for_status()
+            await asyncio.wait_for(fanout.done.wait(), 60)
+            latencies.append((time.perf_counter() - t0) * 1000)
+        cpu = cpu_s(server.pid) - cpu0
+        live = (await http.get("/health/live")).json()
+        print(f"fan-out to {len(connections)}: p50 {statistics.median(latencies):.1f}ms, "
+              f"max {max(latencies):.1f}ms (write request to last delivery, {args.events} events)")
+        print(f"worker CPU {cpu * 1e6 / (args.events * len(connections)):.1f}us per delivery; "
+              f"RSS {rss_mib(server.pid):.1f} MiB, lagged {live['lagged']}")
+
+    for writer, task in connections:
+        task.cancel()
+        writer.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--steps", default="1000,2500,5000,10000", help="comma-separated subscriber counts")
+    parser.add_argument("--events", type=int, default=20)
+    parser.add_argument("--connect-batch", type=int, default=500)
+    args = parser.parse_args()
+    args.steps = sorted(int(n) for n in args.steps.split(","))
+
+    # Both ends of every connection live on this machine
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft < args.steps[-1] + 100:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (min(hard, 2 * args.steps[-1] + 200), hard))
+
+    freelancer_id, token = seed()
+    port = free_port()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning",
+         "--no-access-log", "--backlog", str(max(2048, args.connect_batch))],
+        cwd=ROOT, env={**os.environ, "LIVE_MAX_SUBSCRIBERS": str(args.steps[-1] + 10)},
+    )
+    try:
+        for _ in range(100):
+            try:
+                httpx.get(f"http://127.0.0.1:{port}/health/live").raise_for_status()
+                break
+            except httpx.HTTPError:
+                time.sleep(0.2)
+        asyncio.run(run(args, freelancer_id, token, port, server))
+    finally:
+        server.terminate()
+        try:
+            server.wait(10)
+        except subprocess.TimeoutExpired:
+            server.kill()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Benchmark: latency of a cheap endpoint while /auth/login is hammered.
+
+Starts `uvicorn app.main:app` once with HASH_POOL_ENABLED=0 (bcrypt in the
+request threads) and once with HASH_POOL_ENABLED=1 (bcrypt in the process
+pool), measures GET /users/me latency alone and then during a login storm,
+and reports login throughput. With the pool the /users/me p99 should stay
+close to the idle baseline. Uses DATABASE_URL; the schema must already
+exist. Requires httpx and uvicorn.
+
+    python scripts/bench_login_storm.py --storm 64 --seconds 10
+"""
+
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import time
+import uuid
+
+# Add parent directory to path to import app modules
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import httpx
+
+from app.database.connection import SessionLocal
+from app.core.hash import _hash
+from app.core.security import create_access_token
+from app.models.user import User, UserRole
+
+PASSWORD = "bench-password"
+
+
+def seed() -> tuple[str, str]:
+    """A client with a real bcrypt password; returns (username, token)."""
+    db = SessionLocal()
+    try:
+        tag = uuid.uuid4().hex[:8]
+        user = User(username=f"bench_cl_{tag}", email=f"bench_cl_{tag}@bench.local", password=_hash(PASSWORD),
+                    role=UserRole.client)
+        db.add(user)
+        db.commit()
+        token = create_access_token(data={"sub": str(user.id), "username": user.username, "role": "client"})
+        return user.username, token
+    finally:
+        db.close()
+
+
+def percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return float("nan")
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+async def drive(base_url: str, username: str, token: str, storm: int, probes: int, seconds: float) -> dict:
+    probe_ms: list[float] = []
+    logins = rejected = 0
+    deadline = time.perf_counter() + seconds
+    limits = httpx.Limits(max_connections=storm + probes)
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=60, limits=limits) as client:
+        async def login_worker():
+            nonlocal logins, rejected
+            while time.perf_counter() < deadline:
+                r = await client.post("/auth/login", data={"username": username, "password": PASSWORD})
+                if r.status_code == 503:
+                    rejected += 1
+                    await asyncio.sleep(float(r.headers.get("Retry-After", "1")))
+                    continue
+                r.raise_for_status()
+                logins += 1
+
+        async def probe_worker():
+            while time.perf_counter() < deadline:
+                t0 = time.perf_counter()
+                r = await client.get("/users/me", headers={"Authorization": f"Bearer {token}"})
+                r.raise_for_status()
+                probe_ms.append((time.perf_counter() - t0) * 1000)
+
+        await asyncio.gather(*(login_worker() for _ in range(storm)), *(probe_worker() for _ in range(probes)))
+
+    return {
+        "logins_per_s": logins / seconds,
+        "rejected": rejected,
+        "p50": percentile(probe_ms, 50),
+        "p99": percentile(probe_ms, 99),
+    }
+
+
+def wait_ready(base_url: str, proc: subprocess.Popen):
+    for _ in range(100):
+        if proc.poll() is not None:
+            raise RuntimeError("uvicorn exited during startup")
+        try:
+            if httpx.get(f"{base_url}/health", timeout=1).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError("uvicorn did not become ready")
+
+
+def run_mode(pool: bool, args, username: str, token: str):
+    env = dict(os.environ, HASH_POOL_ENABLED="1" if pool else "0")
+    base_url = f"http://127.0.0.1:{args.port}"
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(args.port), "--log-level", "warning"],
+        cwd=ROOT, env=env,
+    )
+    label = "pool" if pool else "inline"
+    try:
+        wait_ready(base_url, proc)
+        # Warm the worker processes so spawn cost isn't counted as storm latency
+        asyncio.run(drive(base_url, username, token, 1, 0, 1))
+        for name, storm in (("idle", 0), ("storm", args.storm)):
+            stats = asyncio.run(drive(base_url, username, token, storm, args.probes, args.seconds))
+            print(f"[{label:6}] {name:5} /users/me p50={stats['p50']:7.1f}ms p99={stats['p99']:7.1f}ms  "
+                  f"logins/s={stats['logins_per_s']:6.1f} rejected={stats['rejected']}")
+    finally:
+        proc.terminate()
+        proc.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--storm", type=int, default=64, help="concurrent login clients")
+    parser.add_argument("--probes", type=int, default=4, help="concurrent /users/me clients")
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--port", type=int, default=8766)
+    args = parser.parse_args()
+
+    username, token = seed()
+    for pool in (False, True):
+        run_mode(pool, args, username, token)
+
+
+if __name__ == "__main__":
+    main()
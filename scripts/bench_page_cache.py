@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Benchmark: server-rendered pages with and without the page cache.
+
+Seeds --services services, then requests every cached HTML route
+--repeat times in-process, first with PAGE_CACHE_ENABLED off and then on,
+and prints per-route p50 latency, wire bytes (gzip vs identity) and the
+cache's own per-route render time and hit rate. Uses DATABASE_URL; the
+schema must already exist. Requires httpx.
+
+    python scripts/bench_page_cache.py --repeat 200
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+import uuid
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.testclient import TestClient
+from sqlalchemy import insert
+
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.database.connection import SessionLocal
+from app.models.service import Service
+from app.models.user import User, UserRole
+from app.utils.page_cache import page_cache
+from app.main import app
+
+
+def seed(services: int) -> tuple[int, str]:
+    db = SessionLocal()
+    try:
+        tag = uuid.uuid4().hex[:8]
+        freelancer = User(username=f"bench_fr_{tag}", email=f"bench_fr_{tag}@bench.local", password="!",
+                          role=UserRole.freelancer)
+        db.add(freelancer)
+        db.commit()
+        service_id = db.scalars(insert(Service).returning(Service.id), [
+            {"freelancer_id": freelancer.id, "title": f"Bench {i}", "description": "bench " * 40, "price": 10.0,
+             "duration": 30, "created_by_role": UserRole.freelancer}
+            for i in range(services)
+        ]).first()
+        db.commit()
+        token = create_access_token(data={"sub": str(freelancer.id), "username": freelancer.username,
+                                          "role": "freelancer"})
+        return service_id, token
+    finally:
+        db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--services", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    service_id, token = seed(args.services)
+    auth = {"Authorization": f"Bearer {token}"}
+    routes = [
+        ("/", {}), ("/login", {}), ("/register", {}), ("/c/business-coaching", {}),
+        ("/services", auth), (f"/services/{service_id}/view", auth), ("/dashboard/freelancer", auth),
+    ]
+
+    results: dict[str, dict[bool, float]] = {path: {} for path, _ in routes}
+    wire: dict[str, tuple[int, int]] = {}
+    with TestClient(app) as client:
+        for enabled in (False, True):
+            settings.PAGE_CACHE_ENABLED = enabled
+            page_cache.clear()
+            if enabled:
+                # Every request of the uncached run rendered: that's the render cost
+                uncached = page_cache.stats()["routes"]
+            for path, headers in routes:
+                samples = []
+                for _ in range(args.repeat):
+                    t0 = time.perf_counter()
+                    r = client.get(path, headers={**headers, "Accept-Encoding": "gzip"})
+                    samples.append((time.perf_counter() - t0) * 1000)
+                    r.raise_for_status()
+                results[path][enabled] = statistics.median(samples)
+                if enabled:
+                    # httpx decodes the body; Content-Length is the gzip size on the wire
+                    gz = int(r.headers.get("content-length", 0))
+                    wire[path] = (gz, len(r.content))
+
+    cached = page_cache.stats()["routes"]
+    print(f"{'route':32} {'off p50':>9} {'on p50':>9}  {'gzip/raw bytes':>16}  render_ms  hit_rate")
+    for path, _ in routes:
+        gz, raw = wire[path]
+        name = {"/": "index", "/login": "login", "/register": "register", "/services": "services_list",
+                "/dashboard/freelancer": "dashboard"}.get(path, "service_detail" if path.endswith("/view")
+                                                          else path.lstrip("/"))
+        before, after = uncached[name], cached[name]
+        hits, misses = after["hits"] - before["hits"], after["misses"] - before["misses"]
+        print(f"{path:32} {results[path][False]:8.2f}ms {results[path][True]:8.2f}ms  {gz:7}/{raw:<8}  "
+              f"{before['avg_render_ms']:9.2f}  {hits / (hits + misses):.3f}")
+
+
+if __name__ == "__main__":
+    main()
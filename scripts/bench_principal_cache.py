@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Benchmark: SQL statements per authenticated request with and without the
+principal cache in app.core.principal.
+
+Drives GET /favorites/check/{id} in-process and counts statements on the
+engine. "cold" clears the cache before every request, which reproduces the
+old behaviour of loading the User row on each call. Uses DATABASE_URL; the
+schema must already exist. Requires httpx.
+
+    python scripts/bench_principal_cache.py --requests 2000
+"""
+
+import argparse
+import os
+import sys
+import time
+import uuid
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app.database.connection import SessionLocal, engine
+from app.core.principal import principal_cache
+from app.core.security import create_access_token
+from app.models.user import User, UserRole
+from app.main import app
+
+
+def seed() -> str:
+    db = SessionLocal()
+    try:
+        tag = uuid.uuid4().hex[:8]
+        user = User(username=f"bench_cl_{tag}", email=f"bench_cl_{tag}@bench.local", password="!",
+                    role=UserRole.client)
+        db.add(user)
+        db.commit()
+        return create_access_token(data={"sub": str(user.id), "username": user.username, "role": "client"})
+    finally:
+        db.close()
+
+
+def run(client: TestClient, headers: dict, requests: int, cold: bool) -> tuple[float, float]:
+    statements = 0
+
+    def count(*_):
+        nonlocal statements
+        statements += 1
+
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        t0 = time.perf_counter()
+        for _ in range(requests):
+            if cold:
+                principal_cache.clear()
+            client.get("/favorites/check/1", headers=headers).raise_for_status()
+        elapsed = time.perf_counter() - t0
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+    return statements / requests, elapsed * 1000 / requests
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    headers = {"Authorization": f"Bearer {seed()}"}
+    with TestClient(app) as client:
+        for label, cold in (("cold", True), ("cached", False)):
+            queries, ms = run(client, headers, args.requests, cold)
+            print(f"{label:7} queries/request={queries:.2f}  ms/request={ms:.3f}")
+    print(principal_cache.stats())
+
+
+if __name__ == "__main__":
+    main()
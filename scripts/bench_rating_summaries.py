@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Benchmark: listing pages that show ratings, aggregated on the fly vs read
+from the service_ratings summary table.
+
+Seeds --services services with --reviews reviews spread over them, then
+times two listing shapes with both strategies:
+
+  newest page   24 newest services with their average rating
+  top rated     24 services sorted by average rating
+
+"on the fly" joins reviews -> bookings and aggregates per request (what a
+listing had to do before the summaries existed); "summary" joins the
+maintained one-row-per-service table. Uses DATABASE_URL; the schema must
+already exist.
+
+    python scripts/bench_rating_summaries.py --services 20000 --reviews 200000
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import Double, cast, func, insert, select
+
+from app.database.connection import SessionLocal
+from app.models.user import User, UserRole
+from app.models.service import Service
+from app.models.booking import Booking, BookingStatus
+from app.models.review import Review
+from app.models.rating import ServiceRating
+from app.utils.ratings import rebuild_rating_summaries
+
+BATCH = 10_000
+PAGE = 24
+
+
+def seed(services: int, reviews: int):
+    rng = random.Random(7)
+    db = SessionLocal()
+    try:
+        tag = uuid.uuid4().hex[:8]
+        freelancer = User(username=f"bench_fr_{tag}", email=f"bench_fr_{tag}@bench.local", password="!",
+                          role=UserRole.freelancer)
+        client = User(username=f"bench_cl_{tag}", email=f"bench_cl_{tag}@bench.local", password="!",
+                      role=UserRole.client)
+        db.add_all([freelancer, client])
+        db.commit()
+
+        first = db.scalar(select(func.coalesce(func.max(Service.id), 0))) + 1
+        for offset in range(0, services, BATCH):
+            db.execute(insert(Service), [
+                {"freelancer_id": freelancer.id, "title": f"Bench {i}", "description": "bench", "price": 10.0,
+                 "duration": 30, "created_by_role": UserRole.freelancer}
+                for i in range(offset, min(offset + BATCH, services))
+            ])
+        db.commit()
+        service_ids = list(range(first, first + services))
+
+        start = datetime.now(timezone.utc) + timedelta(days=365)
+        for offset in range(0, reviews, BATCH):
+            size = min(BATCH, reviews - offset)
+            booking_ids = db.scalars(insert(Booking).returning(Booking.id), [
+                {"client_id": client.id, "freelancer_id": freelancer.id, "service_id": rng.choice(service_ids),
+                 "start_at": start + timedelta(hours=offset + i), "end_at": start + timedelta(hours=offset + i, minutes=30),
+                 "status": BookingStatus.completed}
+                for i in range(size)
+            ]).all()
+            db.execute(insert(Review), [{"booking_id": bid, "rating": rng.randint(1, 5)} for bid in booking_ids])
+            db.commit()
+        rebuild_rating_summaries(db)
+    finally:
+        db.close()
+
+
+def on_the_fly():
+    return (
+        select(Booking.service_id, cast(func.avg(Review.rating), Double).label("avg_rating"))
+        .join(Review, Review.booking_id == Booking.id)
+        .group_by(Booking.service_id)
+        .subquery()
+    )
+
+
+def newest_page_on_the_fly(db):
+    page = select(Service.id).order_by(Service.created_at.desc(), Service.id.desc()).limit(PAGE).subquery()
+    ratings = (
+        select(Booking.service_id, func.avg(Review.rating))
+        .join(Review, Review.booking_id == Booking.id)
+        .where(Booking.service_id.in_(select(page.c.id)))
+        .group_by(Booking.service_id)
+    )
+    services = db.scalars(select(Service).where(Service.id.in_(select(page.c.id)))).all()
+    return services, dict(db.execute(ratings).all())
+
+
+def newest_page_summary(db):
+    # Service.rating_summary is joined eagerly
+    services = db.scalars(select(Service).order_by(Service.created_at.desc(), Service.id.desc()).limit(PAGE)).all()
+    return [(svc.id, svc.rating_avg) for svc in services]
+
+
+def top_rated_on_the_fly(db):
+    ratings = on_the_fly()
+    return db.execute(
+        select(Service.id, ratings.c.avg_rating).join(ratings, ratings.c.service_id == Service.id)
+        .order_by(ratings.c.avg_rating.desc(), Service.id.desc()).limit(PAGE)
+    ).all()
+
+
+def top_rated_summary(db):
+    average = cast(ServiceRating.total, Double) / func.nullif(ServiceRating.count, 0)
+    return db.execute(
+        select(Service.id, average).join(ServiceRating, ServiceRating.service_id == Service.id)
+        .order_by(average.desc(), Service.id.desc()).limit(PAGE)
+    ).all()
+
+
+def timed(fn, repeat: int) -> float:
+    db = SessionLocal()
+    try:
+        samples = []
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            fn(db)
+            samples.append((time.perf_counter() - t0) * 1000)
+            db.expunge_all()
+        return statistics.median(samples)
+    finally:
+        db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--services", type=int, default=20_000)
+    parser.add_argument("--reviews", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    seed(args.services, args.reviews)
+    print(f"seeded {args.services} services / {args.reviews} reviews in {time.perf_counter() - t0:.1f}s")
+
+    for label, before, after in (
+        ("newest page", newest_page_on_the_fly, newest_page_summary),
+        ("top rated", top_rated_on_the_fly, top_rated_summary),
+    ):
+        before_ms, after_ms = timed(before, args.repeat), timed(after, args.repeat)
+        print(f"{label:12} on the fly p50={before_ms:8.2f}ms   summary p50={after_ms:8.2f}ms   "
+              f"x{before_ms / after_ms:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Benchmark: overhead of the per-request SQL/latency metrics.
+
+Runs the same in-process request loop (GET /services/{id}/free-slots,
+GET /bookings/, GET /favorites/) in fresh interpreters, alternating
+REQUEST_METRICS_ENABLED=0 and 1 for --rounds rounds, and prints each
+endpoint's best median latency per mode (process-to-process jitter is
+larger than the overhead being measured). Uses DATABASE_URL; the schema must
+already exist. Requires httpx.
+
+    python scripts/bench_request_metrics.py --repeat 2000
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+
+# Add parent directory to path to import app modules
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def seed() -> tuple[int, str]:
+    from app.core.security import create_access_token
+    from app.database.connection import SessionLocal
+    from app.models.booking import Booking
+    from app.models.service import Service
+    from app.models.user import User, UserRole
+    from datetime import datetime, timedelta, timezone
+
+    db = SessionLocal()
+    try:
+        tag = uuid.uuid4().hex[:8]
+        freelancer = User(username=f"bench_fr_{tag}", email=f"bench_fr_{tag}@bench.local", password="!",
+                          role=UserRole.freelancer)
+        client = User(username=f"bench_cl_{tag}", email=f"bench_cl_{tag}@bench.local", password="!",
+                      role=UserRole.client)
+        db.add_all([freelancer, client])
+        db.commit()
+        service = Service(freelancer_id=freelancer.id, title="Bench", description="bench", price=10.0, duration=30,
+                          created_by_role=UserRole.freelancer)
+        db.add(service)
+        db.commit()
+        start = datetime(2031, 1, 6, 9, tzinfo=timezone.utc)
+        db.add_all(Booking(client_id=client.id, freelancer_id=freelancer.id, service_id=service.id,
+                           start_at=start + timedelta(hours=i), end_at=start + timedelta(hours=i, minutes=30))
+                   for i in range(20))
+        db.commit()
+        token = create_access_token(data={"sub": str(client.id), "username": client.username, "role": "client"})
+        return service.id, token
+    finally:
+        db.close()
+
+
+def measure(service_id: int, token: str, repeat: int) -> dict:
+    """Child process: median ms per endpoint with the current REQUEST_METRICS_ENABLED."""
+    from fastapi.testclient import TestClient
+    from app.main import app
+
+    headers = {"Authorization": f"Bearer {token}"}
+    paths = [f"/services/{service_id}/free-slots?from=2031-01-06T00:00:00Z", "/bookings/?limit=20", "/favorites/"]
+    results = {}
+    with TestClient(app) as client:
+        for path in paths:
+            for _ in range(50):
+                client.get(path, headers=headers)
+            samples = []
+            for _ in range(repeat):
+                t0 = time.perf_counter()
+                client.get(path, headers=headers).raise_for_status()
+                samples.append((time.perf_counter() - t0) * 1000)
+            results[path.split("?")[0]] = statistics.median(samples)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--child", nargs=2, metavar=("SERVICE_ID", "TOKEN"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(measure(int(args.child[0]), args.child[1], args.repeat)))
+        return
+
+    service_id, token = seed()
+    runs: dict[str, dict[str, float]] = {"0": {}, "1": {}}
+    for _ in range(args.rounds):
+        for enabled in ("0", "1"):
+            proc = subprocess.run(
+                [sys.executable, __file__, "--repeat", str(args.repeat), "--child", str(service_id), token],
+                cwd=ROOT, env={**os.environ, "REQUEST_METRICS_ENABLED": enabled, "SLOW_REQUEST_MS": "0"},
+                capture_output=True, text=True, check=True,
+            )
+            for path, ms in json.loads(proc.stdout.strip().splitlines()[-1]).items():
+                runs[enabled][path] = min(ms, runs[enabled].get(path, ms))
+
+    print(f"{'endpoint':34} {'off p50':>9} {'on p50':>9} {'overhead':>9}  (best of {args.rounds})")
+    for path, off in runs["0"].items():
+        on = runs["1"][path]
+        print(f"{path:34} {off:8.3f}ms {on:8.3f}ms {(on - off) * 1000:7.0f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Benchmark: replayed GET /services/{id} traffic with and without the
+service detail cache.
+
+Seeds --services services, builds a Zipf-skewed trace of --requests views
+(a few popular services take most of the traffic), with --revalidate-pct
+of the repeat views sending the ETag they saw last (If-None-Match) and an
+update every --update-every views. The same trace is replayed twice:
+cache disabled (maxsize 0) and enabled. Reports SQL statements, 304s,
+bytes sent and wall time. Uses DATABASE_URL; the schema must already
+exist. Requires httpx.
+
+    python scripts/bench_service_cache.py --services 2000 --requests 20000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+import uuid
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event, insert
+
+from app.database.connection import SessionLocal, engine
+from app.core.security import create_access_token
+from app.models.user import User, UserRole
+from app.models.service import Service
+from app.utils.service_cache import service_cache
+from app.main import app
+
+BATCH = 10_000
+
+
+def seed(services: int) -> tuple[list[int], str]:
+    db = SessionLocal()
+    try:
+        tag = uuid.uuid4().hex[:8]
+        freelancer = User(username=f"bench_fr_{tag}", email=f"bench_fr_{tag}@bench.local", password="!",
+                          role=UserRole.freelancer)
+        db.add(freelancer)
+        db.commit()
+        ids = []
+        for offset in range(0, services, BATCH):
+            ids += db.scalars(insert(Service).returning(Service.id), [
+                {"freelancer_id": freelancer.id, "title": f"Bench {i}", "description": "bench " * 40,
+                 "price": 10.0, "duration": 30, "created_by_role": UserRole.freelancer}
+                for i in range(offset, min(offset + BATCH, services))
+            ]).all()
+        db.commit()
+        token = create_access_token(data={"sub": str(freelancer.id), "username": freelancer.username,
+                                          "role": "freelancer"})
+        return ids, token
+    finally:
+        db.close()
+
+
+def trace(ids: list[int], requests: int, skew: float, rng: random.Random) -> list[int]:
+    weights = [1 / (rank + 1) ** skew for rank in range(len(ids))]
+    return rng.choices(ids, weights=weights, k=requests)
+
+
+def replay(client: TestClient, views: list[int], token: str, revalidate: float, update_every: int,
+           rng: random.Random) -> dict:
+    statements = 0
+
+    def count(*_):
+        nonlocal statements
+        statements += 1
+
+    seen: dict[int, str] = {}
+    not_modified = sent = 0
+    headers = {"Authorization": f"Bearer {token}"}
+    event.listen(engine, "before_cursor_execute", count)
+    t0 = time.perf_counter()
+    try:
+        for n, service_id in enumerate(views, start=1):
+            if update_every and n % update_every == 0:
+                client.put(f"/services/{service_id}", json={"price": round(rng.uniform(5, 500), 2)},
+                           headers=headers).raise_for_status()
+            conditional = {}
+            if service_id in seen and rng.random() < revalidate:
+                conditional = {"If-None-Match": seen[service_id]}
+            r = client.get(f"/services/{service_id}", headers=conditional)
+            if r.status_code == 304:
+                not_modified += 1
+            else:
+                r.raise_for_status()
+                sent += len(r.content)
+            seen[service_id] = r.headers["etag"]
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+    return {"seconds": time.perf_counter() - t0, "statements": statements, "not_modified": not_modified,
+            "bytes": sent}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--services", type=int, default=2000)
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--skew", type=float, default=1.1, help="Zipf exponent of service popularity")
+    parser.add_argument("--revalidate-pct", type=float, default=50.0)
+    parser.add_argument("--update-every", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    ids, token = seed(args.services)
+    views = trace(ids, args.requests, args.skew, random.Random(args.seed))
+    maxsize = service_cache.maxsize
+
+    with TestClient(app) as client:
+        for label, size in (("no cache", 0), ("cache", maxsize)):
+            service_cache.clear()
+            service_cache.maxsize = size
+            service_cache.hits = service_cache.misses = service_cache.evictions = service_cache.invalidations = 0
+            result = replay(client, views, token, args.revalidate_pct / 100, args.update_every,
+                            random.Random(args.seed))
+            print(f"{label:9} {args.requests} views  {result['seconds']:6.2f}s  "
+                  f"sql={result['statements']:6}  304s={result['not_modified']:6}  "
+                  f"body={result['bytes'] / 1e6:6.2f}MB")
+        print("cache stats:", service_cache.stats())
+
+
+if __name__ == "__main__":
+    main()
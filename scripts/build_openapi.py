@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Write the OpenAPI document to OPENAPI_CACHE_PATH (default app/openapi.json).
+
+The app serves this file instead of walking every route on the first
+/docs or /openapi.json request in each worker; it is ignored once any
+app/*.py file is newer. Needs no database. The sync and async stacks
+(DB_ASYNC) expose identical routes, so one document serves both. The
+Dockerfile runs it.
+
+    python scripts/build_openapi.py
+"""
+
+import argparse
+import os
+import sys
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.config import settings
+from app.core.openapi_cache import write_schema
+from app.main import build_openapi
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", default=settings.OPENAPI_CACHE_PATH)
+    args = parser.parse_args()
+
+    schema = build_openapi()
+    write_schema(args.output, schema)
+    print(f"wrote {args.output}: {len(schema['paths'])} paths")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Build fingerprinted, precompressed static assets.
+
+Copies every file under app/static (except the build output itself) to
+app/static/dist/<dir>/<name>.<hash>.<ext>, writes .gz and, when the
+`brotli` package is installed, .br variants of text assets, and records
+the mapping in app/static/dist/manifest.json. Templates resolve URLs via
+static_url(); the app serves the variants with immutable caching.
+Run after changing anything under app/static (the Dockerfile runs it).
+
+    python scripts/build_static.py
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import sys
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils.static_assets import BUILD_DIR, MANIFEST, STATIC_DIR
+
+try:
+    import brotli
+except ImportError:  # optional: gzip variants only
+    brotli = None
+
+COMPRESSIBLE = {".css", ".js", ".mjs", ".svg", ".json", ".txt", ".html", ".map", ".xml", ".ico"}
+# Below this size a compressed variant rarely pays for its extra request headers
+MIN_COMPRESS_BYTES = 256
+HASH_LENGTH = 10
+
+
+def fingerprinted(relative: str, content: bytes) -> str:
+    stem, ext = os.path.splitext(relative)
+    return f"{stem}.{hashlib.sha256(content).hexdigest()[:HASH_LENGTH]}{ext}"
+
+
+def write_variants(path: str, content: bytes, min_bytes: int) -> list[str]:
+    if os.path.splitext(path)[1] not in COMPRESSIBLE or len(content) < min_bytes:
+        return []
+    encodings = []
+    if brotli is not None:
+        compressed = brotli.compress(content, quality=11)
+        if len(compressed) < len(content):
+            with open(path + ".br", "wb") as f:
+                f.write(compressed)
+            encodings.append("br")
+    compressed = gzip.compress(content, compresslevel=9, mtime=0)
+    if len(compressed) < len(content):
+        with open(path + ".gz", "wb") as f:
+            f.write(compressed)
+        encodings.append("gzip")
+    return encodings
+
+
+def build(static_dir: str, min_bytes: int) -> dict:
+    out_dir = os.path.join(static_dir, BUILD_DIR)
+    shutil.rmtree(out_dir, ignore_errors=True)
+    files = {}
+    for root, dirs, names in os.walk(static_dir):
+        if os.path.abspath(root) == os.path.abspath(static_dir):
+            dirs[:] = [d for d in dirs if d != BUILD_DIR]
+        for name in sorted(names):
+            source = os.path.join(root, name)
+            relative = os.path.relpath(source, static_dir).replace(os.sep, "/")
+            with open(source, "rb") as f:
+                content = f.read()
+            built = f"{BUILD_DIR}/{fingerprinted(relative, content)}"
+            target = os.path.join(static_dir, built)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            with open(target, "wb") as f:
+                f.write(content)
+            files[relative] = {"path": built, "encodings": write_variants(target, content, min_bytes)}
+    with open(os.path.join(static_dir, BUILD_DIR, os.path.basename(MANIFEST)), "w", encoding="utf-8") as f:
+        json.dump({"files": files}, f, indent=2, sort_keys=True)
+    return files
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--static-dir", default=STATIC_DIR)
+    parser.add_argument("--min-bytes", type=int, default=MIN_COMPRESS_BYTES)
+    args = parser.parse_args()
+
+    files = build(args.static_dir, args.min_bytes)
+    for source, entry in sorted(files.items()):
+        print(f"{source:28} -> {entry['path']}  {' '.join(entry['encodings']) or '-'}")
+    if brotli is None:
+        print("brotli not installed: wrote gzip variants only (pip install brotli)")
+
+
+if __name__ == "__main__":
+    main()
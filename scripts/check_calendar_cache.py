@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Regression check for GET /availability/freelancers/{id}/is-free.
+
+Seeds a freelancer available Mondays 09:00-17:00 and Tuesdays 09:03-16:58,
+and asks the endpoint about ranges given with mixed timezone-aware and
+naive datetimes (naive means UTC), which must be answered (200) or
+rejected (400), never 500, and about the edges of the Tuesday slot, which
+do not fall on the cache's 5-minute cells.
+
+Then plays two workers with two CalendarCache instances: a booking or a
+slot removal handled by one must not leave the other answering "free"
+(bookings at once, availability within the cache TTL).
+
+Exits non-zero if any check fails. Uses DATABASE_URL; the schema must
+already exist.
+
+    python scripts/check_calendar_cache.py
+"""
+
+import os
+import sys
+import time
+import uuid
+from datetime import datetime, time as dtime, timezone
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.testclient import TestClient
+
+from app.database.connection import SessionLocal
+from app.models.availability import AvailabilitySlot
+from app.models.booking import Booking, BookingStatus
+from app.models.service import Service
+from app.models.user import User, UserRole
+from app.utils.calendar_cache import CalendarCache
+from app.main import app
+
+# 2030-01-07 is a Monday, 2030-01-08 a Tuesday
+CASES = [
+    # (start_at, end_at, expected status, expected is_free)
+    ("2030-01-07T10:00:00Z", "2030-01-07T11:00:00", 200, True),
+    ("2030-01-07T10:00:00", "2030-01-07T11:00:00+00:00", 200, True),
+    ("2030-01-07T10:00:00", "2030-01-07T11:00:00", 200, True),
+    ("2030-01-07T12:00:00+02:00", "2030-01-07T11:00:00", 200, True),  # 10:00Z to 11:00Z
+    ("2030-01-07T16:30:00Z", "2030-01-07T17:30:00", 200, False),       # runs past availability
+    ("2030-01-07T11:00:00", "2030-01-07T10:00:00Z", 400, None),
+    ("2030-01-08T09:00:00Z", "2030-01-08T09:05:00Z", 200, False),       # starts before 09:03
+    ("2030-01-08T16:55:00Z", "2030-01-08T17:00:00Z", 200, False),       # ends after 16:58
+    ("2030-01-08T09:05:00Z", "2030-01-08T16:55:00Z", 200, True),
+]
+
+
+def seed() -> int:
+    db = SessionLocal()
+    try:
+        tag = uuid.uuid4().hex[:8]
+        freelancer = User(username=f"check_fr_{tag}", email=f"check_fr_{tag}@check.local", password="!",
+                          role=UserRole.freelancer)
+        db.add(freelancer)
+        db.commit()
+        db.add_all([
+            AvailabilitySlot(freelancer_id=freelancer.id, day_of_week=0, start_time=dtime(9), end_time=dtime(17)),
+            AvailabilitySlot(freelancer_id=freelancer.id, day_of_week=1, start_time=dtime(9, 3),
+                             end_time=dtime(16, 58)),
+        ])
+        db.commit()
+        return freelancer.id
+    finally:
+        db.close()
+
+
+def check(ok: bool, message: str) -> bool:
+    print(f"{'ok  ' if ok else 'FAIL'} {message}")
+    return not ok
+
+
+def cross_worker(freelancer_id: int) -> bool:
+    """Worker A handles the writes, worker B only answers; True if B gave a wrong answer."""
+    ttl = 0.5
+    worker_a, worker_b = (CalendarCache(max_freelancers=10, max_days=10, ttl=ttl) for _ in range(2))
+    start, end = datetime(2030, 1, 7, 13, tzinfo=timezone.utc), datetime(2030, 1, 7, 14, tzinfo=timezone.utc)
+    db = SessionLocal()
+    try:
+        failed = check(worker_b.is_free(db, freelancer_id, start, end), "worker B: free before the booking")
+
+        tag = uuid.uuid4().hex[:8]
+        client = User(username=f"check_cl_{tag}", email=f"check_cl_{tag}@check.local", password="!",
+                      role=UserRole.client)
+        service = Service(freelancer_id=freelancer_id, title="Check", description="check", price=10.0, duration=60,
+                          created_by_role=UserRole.freelancer)
+        db.add_all([client, service])
+        db.commit()
+        db.add(Booking(client_id=client.id, freelancer_id=freelancer_id, service_id=service.id, start_at=start,
+                       end_at=end, status=BookingStatus.pending))
+        db.commit()
+        worker_a.apply_booking(freelancer_id, start, end, +1)
+        failed |= check(not worker_b.is_free(db, freelancer_id, start, end), "worker B: booked on worker A")
+
+        later = datetime(2030, 1, 7, 15, tzinfo=timezone.utc), datetime(2030, 1, 7, 16, tzinfo=timezone.utc)
+        failed |= check(worker_b.is_free(db, freelancer_id, *later), "worker B: free later that day")
+        slot = db.query(AvailabilitySlot).filter_by(freelancer_id=freelancer_id, day_of_week=0).one()
+        db.delete(slot)
+        db.commit()
+        worker_a.apply_slot(freelancer_id, 0, dtime(9), dtime(17), -1)
+        time.sleep(ttl)
+        failed |= check(not worker_b.is_free(db, freelancer_id, *later),
+                        "worker B: availability removed on worker A, after the TTL")
+        return failed
+    finally:
+        db.close()
+
+
+def main() -> int:
+    freelancer_id = seed()
+    failed = False
+    with TestClient(app, raise_server_exceptions=False) as client:
+        for start_at, end_at, status, is_free in CASES:
+            r = client.get(f"/availability/freelancers/{freelancer_id}/is-free",
+                           params={"start_at": start_at, "end_at": end_at})
+            ok = r.status_code == status and (is_free is None or r.json()["is_free"] is is_free)
+            failed |= not ok
+            print(f"{'ok  ' if ok else 'FAIL'} {start_at} .. {end_at}: {r.status_code} {r.text[:80]}")
+    failed |= cross_worker(freelancer_id)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Query-count regression check for the favorites endpoints.
+
+Counts SQL statements issued by GET /favorites/ and POST /favorites/check
+for users with few and with many favorites, and exits non-zero if either
+path goes over its budget or starts scaling with the number of rows (an
+N+1 creeping back in). Each user makes one uncounted request first, so
+the principal is cached and only the favorites queries are counted. Uses DATABASE_URL; the schema must already exist.
+Requires httpx.
+
+    python scripts/check_favorites_queries.py
+"""
+
+import os
+import sys
+import uuid
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app.database.connection import SessionLocal, engine
+from app.core.security import create_access_token
+from app.models.user import User, UserRole
+from app.models.service import Service
+from app.models.favorite import Favorite
+from app.main import app
+
+# Statements per request, principal already cached
+BUDGETS = {
+    "GET /favorites/": 1,
+    "POST /favorites/check": 1,
+}
+SIZES = (3, 48)
+
+
+def seed(favorites: int) -> tuple[str, list[int]]:
+    """A client with `favorites` favorited services; returns (token, service ids incl. non-favorites)."""
+    db = SessionLocal()
+    try:
+        tag = uuid.uuid4().hex[:8]
+        freelancer = User(username=f"check_fr_{tag}", email=f"check_fr_{tag}@check.local", password="!",
+                          role=UserRole.freelancer)
+        client = User(username=f"check_cl_{tag}", email=f"check_cl_{tag}@check.local", password="!",
+                      role=UserRole.client)
+        db.add_all([freelancer, client])
+        db.commit()
+        services = [Service(freelancer_id=freelancer.id, title=f"Check {i}", description="check", price=10.0,
+                            duration=30, created_by_role=UserRole.freelancer) for i in range(favorites * 2)]
+        db.add_all(services)
+        db.commit()
+        db.add_all(Favorite(user_id=client.id, service_id=svc.id) for svc in services[:favorites])
+        db.commit()
+        token = create_access_token(data={"sub": str(client.id), "username": client.username, "role": "client"})
+        return token, [svc.id for svc in services]
+    finally:
+        db.close()
+
+
+def count_statements(call) -> int:
+    statements = 0
+
+    def count(*_):
+        nonlocal statements
+        statements += 1
+
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        call().raise_for_status()
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+    return statements
+
+
+def main() -> int:
+    counts: dict[str, list[int]] = {name: [] for name in BUDGETS}
+    with TestClient(app) as client:
+        for size in SIZES:
+            token, service_ids = seed(size)
+            headers = {"Authorization": f"Bearer {token}"}
+            client.get("/favorites/", headers=headers).raise_for_status()  # warms the principal cache
+            counts["GET /favorites/"].append(count_statements(
+                lambda: client.get("/favorites/", params={"limit": 200}, headers=headers)))
+            counts["POST /favorites/check"].append(count_statements(
+                lambda: client.post("/favorites/check", json={"service_ids": service_ids}, headers=headers)))
+
+    failed = False
+    for name, budget in BUDGETS.items():
+        per_size = dict(zip(SIZES, counts[name]))
+        ok = max(counts[name]) <= budget and len(set(counts[name])) == 1
+        failed |= not ok
+        print(f"{'ok  ' if ok else 'FAIL'} {name:24} statements by favorites count {per_size} (budget {budget})")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Regression check for the free-slot computation behind GET /services/{id}/free-slots.
+
+A freelancer available Mondays 09:00-12:00 with a 30-minute service: the
+grid must follow the availability window (09:00, 09:30, ...) whatever the
+query's `from` minute, and a booking ending mid-minute must keep that
+minute busy. No database needed; exits non-zero if any case fails.
+
+    python scripts/check_free_slots.py
+"""
+
+import os
+import sys
+from datetime import datetime, timezone
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils.free_slots import free_slot_starts
+
+SLOTS = [(0, 9 * 60, 12 * 60)]  # Mondays 09:00-12:00
+DURATION = 30
+
+
+def at(hour: int, minute: int, second: int = 0) -> datetime:
+    # 2030-01-07 is a Monday
+    return datetime(2030, 1, 7, hour, minute, second, tzinfo=timezone.utc)
+
+
+CASES = [
+    # (description, bookings, from, to, expected start times)
+    ("whole window", [], at(0, 0), at(23, 0), ["09:00", "09:30", "10:00", "10:30", "11:00", "11:30"]),
+    ("from mid-slot keeps the grid", [], at(9, 37), at(12, 0), ["10:00", "10:30", "11:00", "11:30"]),
+    ("from mid-minute", [], at(9, 30, 30), at(11, 0), ["10:00", "10:30"]),
+    ("to cuts the last slot", [], at(9, 0), at(10, 45), ["09:00", "09:30", "10:00"]),
+    ("booking ends mid-minute", [(at(9, 0), at(9, 29, 30))], at(0, 0), at(10, 30), ["09:30", "10:00"]),
+    ("booking starts mid-minute", [(at(10, 0, 30), at(10, 30))], at(0, 0), at(11, 0), ["09:00", "09:30", "10:30"]),
+]
+
+
+def main() -> int:
+    failed = False
+    for description, bookings, start, end, expected in CASES:
+        got = [value[11:16] for value in free_slot_starts(SLOTS, bookings, start, end, DURATION)]
+        ok = got == expected
+        failed |= not ok
+        print(f"{'ok  ' if ok else 'FAIL'} {description}: {got}" + ("" if ok else f" (expected {expected})"))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Query-plan regression check for the hot queries.
+
+Seeds --freelancers freelancers with services, availability, bookings,
+reviews and favorites, runs ANALYZE, then EXPLAINs each hot query as the
+routers build it and exits non-zero if any of them reads a table with a
+sequential scan. On Postgres the plans are taken with enable_seqscan off,
+so a Seq Scan means no index can serve the query at all, however small
+the seeded tables are. SQLite (EXPLAIN QUERY PLAN) is supported for local
+runs. Uses DATABASE_URL; the schema must already exist (alembic upgrade head).
+
+    python scripts/check_query_plans.py
+    python scripts/check_query_plans.py --skip-seed -v
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import uuid
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import func, insert, select, text
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+from app.database.connection import Base, SessionLocal
+from app.models.availability import AvailabilitySlot
+from app.models.booking import Booking, BookingStatus
+from app.models.favorite import Favorite
+from app.models.outbox import OutboxEvent
+from app.models.review import Review
+from app.models.service import Service
+from app.models.user import User, UserRole
+from app.routers.availability import my_slots_query
+from app.routers.Booking import bookings_listing
+from app.routers.favorites import favorite_ids_query, favorites_listing
+from app.utils.booking_index import active_bookings_query, db_conflict_query
+from app.utils.catalog_search import filter_conditions
+from app.utils.outbox import claim_query, pending_filter
+from app.utils.pagination import PageParams, keyset
+
+
+class explain(Executable, ClauseElement):
+    """EXPLAIN wrapper, so statements keep their normal bind processing."""
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiles(explain, "postgresql")
+def _explain_postgresql(element, compiler, **kw):
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+@compiles(explain, "sqlite")
+def _explain_sqlite(element, compiler, **kw):
+    return "EXPLAIN QUERY PLAN " + compiler.process(element.statement, **kw)
+
+
+def seed(db, freelancers: int, services_each: int, bookings_each: int) -> dict:
+    """Bulk-insert a dataset; returns ids for the query parameters."""
+    rng = random.Random(42)
+    tag = uuid.uuid4().hex[:8]
+    users = db.scalars(insert(User).returning(User.id), [
+        {"username": f"plan_{role}_{tag}_{i}", "email": f"plan_{role}_{tag}_{i}@plan.local", "password": "!",
+         "role": role}
+        for role, count in ((UserRole.freelancer, freelancers), (UserRole.client, freelancers))
+        for i in range(count)
+    ]).all()
+    freelancer_ids, client_ids = users[:freelancers], users[freelancers:]
+
+    service_rows = db.execute(insert(Service).returning(Service.id, Service.freelancer_id), [
+        {"freelancer_id": fid, "title": f"Plan {fid}-{i}", "description": "plan check", "price": 10.0 + i,
+         "duration": 60, "created_by_role": UserRole.freelancer}
+        for fid in freelancer_ids for i in range(services_each)
+    ]).all()
+    db.execute(insert(AvailabilitySlot), [
+        {"freelancer_id": fid, "day_of_week": day, "start_time": datetime.min.time().replace(hour=9),
+         "end_time": datetime.min.time().replace(hour=17)}
+        for fid in freelancer_ids for day in range(5)
+    ])
+
+    # Back-to-back hours per freelancer: never overlapping, whatever the status
+    origin = datetime(2026, 1, 5, 9, tzinfo=timezone.utc)
+    statuses = list(BookingStatus)
+    booking_rows = db.execute(insert(Booking).returning(Booking.id), [
+        {"client_id": rng.choice(client_ids), "freelancer_id": fid, "service_id": sid,
+         "start_at": origin + timedelta(hours=n), "end_at": origin + timedelta(hours=n + 1),
+         "status": rng.choice(statuses)}
+        for n, (sid, fid) in enumerate(service_rows * bookings_each)
+    ]).all()
+    booking_ids = [row.id for row in booking_rows]
+    db.execute(insert(Review), [
+        {"booking_id": bid, "rating": rng.randint(1, 5), "comment": "plan"} for bid in booking_ids[::3]
+    ])
+    db.execute(insert(Favorite), [
+        {"user_id": cid, "service_id": sid}
+        for cid in client_ids for sid, _ in rng.sample(service_rows, min(10, len(service_rows)))
+    ])
+    db.commit()
+    return {"freelancer": freelancer_ids[0], "client": client_ids[0], "service": service_rows[0][0],
+            "booking": booking_ids[0], "services": [sid for sid, _ in service_rows[:20]]}
+
+
+def existing_ids(db) -> dict:
+    """Parameters for --skip-seed: the first row of each kind."""
+    freelancer = db.scalar(select(func.min(Service.freelancer_id)))
+    if freelancer is None:
+        sys.exit("no services in the database; run without --skip-seed")
+    return {
+        "freelancer": freelancer,
+        "client": db.scalar(select(func.min(Booking.client_id))),
+        "service": db.scalar(select(func.min(Service.id))),
+        "booking": db.scalar(select(func.min(Booking.id))),
+        "services": db.scalars(select(Service.id).limit(20)).all(),
+    }
+
+
+def hot_queries(ids: dict) -> list[tuple[str, object]]:
+    """(name, statement) for every query the hot paths issue, built by the same helpers."""
+    page = PageParams(cursor=None, limit=20)
+    client = SimpleNamespace(id=ids["client"], role="client")
+    freelancer = SimpleNamespace(id=ids["freelancer"], role="freelancer")
+    start = datetime(2026, 1, 10, tzinfo=timezone.utc)
+    return [
+        ("GET /bookings/ (client)",
+         keyset(bookings_listing(client, None, None, None, None), Booking.created_at, Booking.id, page)),
+        ("GET /bookings/ (freelancer)",
+         keyset(bookings_listing(freelancer, None, None, None, None), Booking.created_at, Booking.id, page)),
+        ("booking index load", active_bookings_query(ids["freelancer"])),
+        ("booking overlap check", db_conflict_query(ids["freelancer"], start, start + timedelta(hours=1))),
+        # app/routers/services.get_free_slots and app/utils/calendar_cache._days
+        ("free slots: bookings in range", select(Booking.start_at, Booking.end_at).where(
+            Booking.freelancer_id == ids["freelancer"], Booking.status != BookingStatus.canceled,
+            Booking.start_at < start + timedelta(days=7), Booking.end_at > start)),
+        ("GET /availability/me", my_slots_query(ids["freelancer"])),
+        # app/routers/availability.create_slot
+        ("availability same-day overlap", select(AvailabilitySlot.start_time, AvailabilitySlot.end_time).where(
+            AvailabilitySlot.freelancer_id == ids["freelancer"], AvailabilitySlot.day_of_week == 0)),
+        ("GET /services/?freelancer_id= (newest)", select(Service).where(
+            *filter_conditions(freelancer_id=ids["freelancer"])
+        ).order_by(Service.created_at.desc(), Service.id.desc()).limit(page.limit + 1)),
+        ("GET /favorites/", keyset(favorites_listing(ids["client"]), Favorite.created_at, Favorite.id, page)),
+        ("POST /favorites/check", favorite_ids_query(ids["client"], ids["services"])),
+        ("GET /reviews/?freelancer_id=", keyset(
+            select(Review).join(Booking, Booking.id == Review.booking_id)
+            .where(Booking.freelancer_id == ids["freelancer"]), Review.created_at, Review.id, page)),
+        # Lazy loads and ON DELETE CASCADE lookups
+        ("Booking.review", select(Review).where(Review.booking_id == ids["booking"])),
+        ("bookings of a service", select(Booking.id).where(Booking.service_id == ids["service"])),
+        ("Service.favorited_by", select(Favorite).where(Favorite.service_id == ids["service"])),
+        # scripts/outbox_worker.py and GET /health/outbox
+        ("outbox claim", claim_query(start, 100)),
+        ("outbox pending backlog", select(func.count(), func.min(OutboxEvent.created_at)).where(*pending_filter())),
+        ("outbox failed count", select(func.count()).where(OutboxEvent.failed_at.is_not(None))),
+        ("outbox purge", select(OutboxEvent.id).where(OutboxEvent.processed_at < start).limit(5000)),
+    ]
+
+
+def postgres_scans(plan: dict) -> list[str]:
+    found = []
+    if plan.get("Node Type") == "Seq Scan":
+        found.append(plan["Relation Name"])
+    for child in plan.get("Plans", []):
+        found += postgres_scans(child)
+    return found
+
+
+def sequential_scans(db, stmt) -> tuple[list[str], str]:
+    """(tables read by a full scan, plan text) for `stmt`."""
+    # Raw cursor rows: the statement's own result types don't apply to a plan
+    rows = db.execute(explain(stmt)).cursor.fetchall()
+    if db.get_bind().dialect.name == "postgresql":
+        plan = rows[0][0]
+        plan = json.loads(plan) if isinstance(plan, str) else plan
+        return postgres_scans(plan[0]["Plan"]), json.dumps(plan, indent=1)
+    details = [row[-1] for row in rows]
+    # "SCAN <table>" without "USING ... INDEX" reads the whole table
+    scans = [detail.split()[1] for detail in details
+             if detail.startswith("SCAN ") and "USING" not in detail and detail.split()[1] in Base.metadata.tables]
+    return scans, "\n".join(details)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--freelancers", type=int, default=50)
+    parser.add_argument("--services-each", type=int, default=4)
+    parser.add_argument("--bookings-each", type=int, default=25)
+    parser.add_argument("--skip-seed", action="store_true", help="use the rows already in the database")
+    parser.add_argument("-v", "--verbose", action="store_true", help="print every plan")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        ids = existing_ids(db) if args.skip_seed else seed(db, args.freelancers, args.services_each,
+                                                            args.bookings_each)
+        db.execute(text("ANALYZE"))
+        db.commit()
+        postgres = db.get_bind().dialect.name == "postgresql"
+        if postgres:
+            db.execute(text("SET enable_seqscan = off"))
+
+        failed = False
+        for name, stmt in hot_queries(ids):
+            scans, plan = sequential_scans(db, stmt)
+            failed |= bool(scans)
+            print(f"{'FAIL' if scans else 'ok  '} {name:40} {'seq scan on ' + ', '.join(scans) if scans else ''}")
+            if args.verbose or scans:
+                print("     " + plan.replace("\n", "\n     "))
+        if postgres:
+            db.execute(text("RESET enable_seqscan"))
+    finally:
+        db.close()
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
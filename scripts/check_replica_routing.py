@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Local check of read-replica routing (app/database/replicas.py).
+
+Builds three SQLite databases in a temporary directory: a primary and two
+"replicas" copied from it, then diverges them on purpose (the client has
+no bookings on the primary, one on replica A and two on replica B), so
+the length of GET /bookings/ tells which database served it. The
+replicas also hold an outdated title for the service. A third
+replica URL points at a path that cannot be opened. Checks:
+
+  * round robin: the broken replica is marked down, reads alternate A/B
+  * least loaded: with A's connection held, new reads go to B
+  * read-your-writes: after POST /favorites/ the caller reads the primary
+    (token in this worker, cookie on any worker) until the window ends;
+    POST /favorites/check does not count as a write
+  * fallback: with every replica down, reads go to the primary
+
+Exits non-zero on the first failed check. Ignores DATABASE_URL.
+
+    python scripts/check_replica_routing.py
+    python scripts/check_replica_routing.py --async   # DB_ASYNC=1 routers
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+WINDOW_S = 1.0
+SOURCES = {0: "primary", 1: "replica-a", 2: "replica-b"}
+TITLE, STALE_TITLE = "Replica check", "Replica check (before the edit)"
+
+
+def build_databases(workdir: str) -> tuple[list[str], int, int]:
+    """Primary and two diverged replicas; returns (urls, client id, service id)."""
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+
+    from app.database.connection import Base
+    from app.models.booking import Booking, BookingStatus
+    from app.models.service import Service
+    from app.models.user import User, UserRole
+
+    paths = [os.path.join(workdir, f"{name}.db") for name in ("primary", "replica_a", "replica_b")]
+    engine = create_engine(f"sqlite:///{paths[0]}")
+    Base.metadata.create_all(engine)
+    with Session(engine) as db:
+        freelancer = User(username="rr_fr", email="rr_fr@check.local", password="!", role=UserRole.freelancer)
+        client = User(username="rr_cl", email="rr_cl@check.local", password="!", role=UserRole.client)
+        db.add_all([freelancer, client])
+        db.flush()
+        service = Service(freelancer_id=freelancer.id, title=TITLE, description="check", price=10.0,
+                          duration=60, created_by_role=UserRole.freelancer)
+        db.add(service)
+        db.commit()
+        ids = freelancer.id, client.id, service.id
+    engine.dispose()
+
+    freelancer_id, client_id, service_id = ids
+    start = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0) + timedelta(days=1)
+    for bookings, path in enumerate(paths[1:], start=1):
+        shutil.copy(paths[0], path)
+        engine = create_engine(f"sqlite:///{path}")
+        with Session(engine) as db:
+            db.add_all(Booking(client_id=client_id, freelancer_id=freelancer_id, service_id=service_id,
+                               start_at=start + timedelta(hours=i), end_at=start + timedelta(hours=i + 1),
+                               status=BookingStatus.pending) for i in range(bookings))
+            db.get(Service, service_id).title = STALE_TITLE
+            db.commit()
+        engine.dispose()
+    return [f"sqlite:///{path}" for path in paths], client_id, service_id
+
+
+def check(ok: bool, message: str):
+    print(f"{'ok  ' if ok else 'FAIL'} {message}")
+    if not ok:
+        sys.exit(1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--async", dest="async_", action="store_true", help="serve the routers from DB_ASYNC=1")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="replica-check-")
+    try:
+        # The app reads these at import, so set them before the first app import
+        primary, replica_a, replica_b = (f"sqlite:///{os.path.join(workdir, name)}.db"
+                                         for name in ("primary", "replica_a", "replica_b"))
+        os.environ.update({
+            "DATABASE_URL": primary,
+            "DATABASE_REPLICA_URLS": f"{replica_a},{replica_b},sqlite:///{workdir}/missing/replica.db",
+            "DB_REPLICA_SELECTION": "round_robin",
+            "DB_READ_YOUR_WRITES_S": str(WINDOW_S),
+            "DB_REPLICA_RETRY_S": "60",
+            "DB_ASYNC": "1" if args.async_ else "0",
+        })
+        os.environ.pop("ASYNC_DATABASE_URL", None)
+        run(workdir, args.async_)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def run(workdir: str, async_: bool):
+    from fastapi.testclient import TestClient
+
+    from app.core.security import create_access_token
+    from app.database.connection import async_replicas, replicas
+    from app.database.replicas import STICKY_COOKIE, ReplicaSet
+    from app.main import app
+    from app.utils.service_cache import service_cache
+
+    _, client_id, service_id = build_databases(workdir)
+    token = create_access_token(data={"sub": str(client_id), "username": "rr_cl", "role": "client"})
+    auth = {"Authorization": f"Bearer {token}"}
+    stack = "async" if async_ else "sync"
+    replica_set = async_replicas if async_ else replicas
+
+    def source(http) -> str:
+        r = http.get("/bookings/", headers=auth)
+        r.raise_for_status()
+        return SOURCES[len(r.json()["items"])]
+
+    def stats(http) -> dict:
+        return http.get("/health/replicas").json()[stack]
+
+    with TestClient(app) as http:
+        # Round robin; the first rotation finds the broken replica
+        first = [source(http) for _ in range(3)]
+        replica_stats = stats(http)["replicas"]
+        broken = replica_stats[f"{'async-' if async_ else ''}replica-2"]
+        check(not broken["up"] and broken["failures"] == 1 and "unable to open" in broken["last_error"],
+              f"broken replica marked down ({broken['last_error']})")
+        check(set(first) <= {"replica-a", "replica-b"}, f"reads served by replicas: {first}")
+        rotation = [source(http) for _ in range(6)]
+        check(rotation.count("replica-a") == rotation.count("replica-b") == 3
+              and all(a != b for a, b in zip(rotation, rotation[1:])), f"round robin alternates: {rotation}")
+
+        # Least loaded, on the sync engines: hold a connection to A, reads pick B
+        least = ReplicaSet("least_loaded")
+        for replica in replicas.replicas[:2]:
+            least.add(replica.name, replica.engine)
+        held = replicas.replicas[0].engine.connect()
+        try:
+            picks = []
+            for _ in range(4):
+                conn = least.connect()
+                picks.append(conn.engine is replicas.replicas[1].engine)
+                conn.close()
+        finally:
+            held.close()
+        check(all(picks), "least loaded skips the replica with a checked-out connection")
+
+        # Read-your-writes
+        r = http.post("/favorites/check", json={"service_ids": [service_id]}, headers=auth)
+        check(r.status_code == 200 and STICKY_COOKIE not in r.cookies, "read-only POST is not a write")
+        r = http.post("/favorites/", json={"service_id": service_id}, headers=auth)
+        check(r.status_code == 201 and STICKY_COOKIE in r.cookies, "write sets the sticky cookie")
+        check(len(http.get("/favorites/", headers=auth).json()["items"]) == 1, "reads own write (cookie + token)")
+        with TestClient(app) as other:
+            check(len(other.get("/favorites/", headers=auth).json()["items"]) == 1, "reads own write (token only)")
+        with TestClient(app, cookies={STICKY_COOKIE: "1"}) as other:
+            check(source(other) == "primary", "sticky cookie alone reads the primary (another worker)")
+        time.sleep(WINDOW_S + 0.2)
+        http.cookies.clear()
+        check(len(http.get("/favorites/", headers=auth).json()["items"]) == 0
+              and source(http) != "primary", "back on the replicas after the window")
+
+        # Service cache misses read the primary, whichever replica the session picked
+        for _ in range(2):
+            service_cache.pop(service_id)
+            r = http.get(f"/services/{service_id}")
+            check(r.status_code == 200 and r.json()["title"] == TITLE,
+                  f"service cache filled from the primary ({r.json().get('title')!r})")
+
+        # Fallback: every replica down
+        fallbacks = stats(http)["fallbacks_to_primary"]
+        for replica in replica_set.replicas:
+            replica.down_until = time.monotonic() + 60
+        check(source(http) == "primary", "all replicas down: reads go to the primary")
+        check(stats(http)["fallbacks_to_primary"] == fallbacks + 1, "fallback counted in /health/replicas")
+    print(f"replica routing OK ({stack} stack)")
+
+
+if __name__ == "__main__":
+    main()
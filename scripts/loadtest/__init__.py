@@ -0,0 +1,20 @@
+"""
+End-to-end load test for the whole API.
+
+Seeds a tagged dataset at --scale, boots `uvicorn` on the app (wrapped so
+each response reports how many SQL statements it ran), drives a weighted
+mix of user journeys with httpx.AsyncClient at --concurrency, and prints
+per-endpoint throughput, p50/p95/p99 latency and DB queries per request.
+--out writes the results as JSON; --baseline compares against an earlier
+file and exits non-zero on a regression. Uses DATABASE_URL; the schema
+must already exist. Requires httpx and uvicorn. Run from the repo root:
+
+    python -m scripts.loadtest --scale 1 --concurrency 32 --seconds 30 --out results.json
+    python -m scripts.loadtest --baseline results.json
+
+Modules:
+    seed       bulk-inserted users, services, slots, bookings and favorites
+    server     the instrumented ASGI app and the uvicorn subprocess
+    scenarios  the user journeys and their default weights
+    report     aggregation, JSON output and baseline comparison
+"""
@@ -0,0 +1,105 @@
+import argparse
+import asyncio
+import itertools
+import os
+import random
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+
+import httpx
+
+import scripts.loadtest as package
+from scripts.loadtest import report
+from scripts.loadtest.scenarios import DEFAULT_MIX, JOURNEYS, VirtualUser, parse_mix
+from scripts.loadtest.seed import Dataset, seed
+from scripts.loadtest.server import ROOT, serve
+
+
+async def drive(base_url: str, dataset: Dataset, mix: dict[str, int], concurrency: int, seconds: float,
+                rng_seed: int, hours: itertools.count) -> list:
+    """Closed loop: each virtual user runs journeys back to back until the deadline."""
+    names, weights = list(mix), list(mix.values())
+    deadline = time.perf_counter() + seconds
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=60, limits=limits) as client:
+        users = [VirtualUser(client, dataset, random.Random(rng_seed * 1000 + i), hours)
+                 for i in range(concurrency)]
+
+        async def run(vu: VirtualUser):
+            while time.perf_counter() < deadline:
+                await JOURNEYS[vu.rng.choices(names, weights)[0]](vu)
+
+        await asyncio.gather(*(run(vu) for vu in users))
+    return [sample for vu in users for sample in vu.samples]
+
+
+def git_revision() -> str | None:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                              text=True).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m scripts.loadtest", description=package.__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=float, default=1, help="dataset size multiplier (see seed.py)")
+    parser.add_argument("--concurrency", type=int, default=32, help="virtual users")
+    parser.add_argument("--seconds", type=float, default=30)
+    parser.add_argument("--warmup", type=float, default=5, help="seconds run first and discarded")
+    parser.add_argument("--mix", type=parse_mix, default=DEFAULT_MIX,
+                        help="journey weights, e.g. browse=50,booking=20 (default: %(default)s)")
+    parser.add_argument("--seed", type=int, default=0, help="random seed for data and journeys")
+    parser.add_argument("--port", type=int, default=8767)
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn workers")
+    parser.add_argument("--url", help="drive an already running server instead of starting one")
+    parser.add_argument("--out", help="write results JSON here")
+    parser.add_argument("--baseline", help="results JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed p95 / throughput change")
+    args = parser.parse_args()
+
+    dataset = seed(args.scale, args.seed)
+    print(f"seeded dataset {dataset.tag}: {len(dataset.freelancers)} freelancers, {len(dataset.clients)} clients, "
+          f"{len(dataset.services)} services")
+    hours = itertools.count()
+
+    def measure(base_url: str) -> list:
+        if args.warmup > 0:
+            asyncio.run(drive(base_url, dataset, args.mix, args.concurrency, args.warmup, args.seed + 1, hours))
+        return asyncio.run(drive(base_url, dataset, args.mix, args.concurrency, args.seconds, args.seed, hours))
+
+    if args.url:
+        samples = measure(args.url.rstrip("/"))
+    else:
+        with serve(args.port, args.workers) as base_url:
+            samples = measure(base_url)
+
+    results = report.summarize(samples, args.seconds)
+    results["meta"] = {
+        "started": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "git": git_revision(),
+        "database": os.getenv("DATABASE_URL", "").split("://", 1)[0],
+        "db_async": os.getenv("DB_ASYNC", "0"),
+        **{key: value for key, value in vars(args).items() if key not in ("out", "baseline")},
+    }
+    report.print_table(results)
+    if args.out:
+        report.write(args.out, results)
+        print(f"wrote {args.out}")
+
+    if args.baseline:
+        regressions = report.compare(results, report.load(args.baseline), args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            return 1
+        print(f"no regressions against {args.baseline} (tolerance {args.tolerance:.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
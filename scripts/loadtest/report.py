@@ -0,0 +1,83 @@
+"""Aggregation, the results file and baseline comparison."""
+
+import json
+import statistics
+from collections import defaultdict
+
+from scripts.loadtest.scenarios import Sample
+
+# A baseline comparison fails when an endpoint's p95 grows, or total
+# throughput drops, by more than --tolerance; or when an endpoint starts
+# running more queries per request (that is deterministic, so no slack).
+QUERY_SLACK = 0.5
+
+
+def percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return float("nan")
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def summarize(samples: list[Sample], seconds: float) -> dict:
+    by_endpoint: defaultdict[str, list[Sample]] = defaultdict(list)
+    for sample in samples:
+        by_endpoint[sample.endpoint].append(sample)
+
+    def stats(group: list[Sample]) -> dict:
+        ms = [s.ms for s in group]
+        queries = [s.db_queries for s in group if s.db_queries is not None]
+        return {
+            "requests": len(group),
+            "errors": sum(not s.ok for s in group),
+            "rps": round(len(group) / seconds, 2),
+            "p50_ms": round(percentile(ms, 50), 2),
+            "p95_ms": round(percentile(ms, 95), 2),
+            "p99_ms": round(percentile(ms, 99), 2),
+            "mean_ms": round(statistics.fmean(ms), 2),
+            "db_queries": round(statistics.fmean(queries), 2) if queries else None,
+        }
+
+    return {
+        "total": stats(samples) if samples else {},
+        "endpoints": {name: stats(group) for name, group in sorted(by_endpoint.items())},
+    }
+
+
+def print_table(results: dict):
+    print(f"{'endpoint':46} {'req':>7} {'err':>5} {'rps':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'queries':>8}")
+    rows = [*results["endpoints"].items(), ("TOTAL", results["total"])]
+    for name, s in rows:
+        queries = "-" if s["db_queries"] is None else f"{s['db_queries']:.1f}"
+        print(f"{name:46} {s['requests']:7} {s['errors']:5} {s['rps']:8.1f} {s['p50_ms']:7.1f}ms "
+              f"{s['p95_ms']:7.1f}ms {s['p99_ms']:7.1f}ms {queries:>8}")
+
+
+def write(path: str, results: dict):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+
+
+def load(path: str) -> dict:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Human-readable regressions of `results` against `baseline` (empty if none)."""
+    regressions = []
+    now, then = results["total"], baseline["total"]
+    if now["rps"] < then["rps"] * (1 - tolerance):
+        regressions.append(f"total throughput {then['rps']:.1f} -> {now['rps']:.1f} req/s")
+    for name, old in baseline["endpoints"].items():
+        new = results["endpoints"].get(name)
+        if new is None:
+            continue
+        if new["p95_ms"] > old["p95_ms"] * (1 + tolerance):
+            regressions.append(f"{name}: p95 {old['p95_ms']:.1f} -> {new['p95_ms']:.1f}ms")
+        if old["db_queries"] is not None and new["db_queries"] is not None \
+                and new["db_queries"] > old["db_queries"] + QUERY_SLACK:
+            regressions.append(f"{name}: queries/request {old['db_queries']:.1f} -> {new['db_queries']:.1f}")
+        if new["errors"] > old["errors"]:
+            regressions.append(f"{name}: errors {old['errors']} -> {new['errors']}")
+    return regressions
@@ -0,0 +1,163 @@
+"""User journeys. Each one is a short sequence of calls a real client makes.
+
+Endpoints are recorded under their route template (e.g. "GET /services/{id}")
+so runs with different data stay comparable. A status outside a call's
+expected set counts as an error for that endpoint.
+"""
+
+import argparse
+import itertools
+import random
+import time
+from dataclasses import dataclass, field
+from datetime import timedelta
+
+import httpx
+
+from scripts.loadtest.seed import PASSWORD, Account, Dataset
+from scripts.loadtest.server import QUERY_HEADER
+
+SEARCH_TERMS = ("test", "description", "catalog", "realistic")
+SORTS = ("relevance", "newest", "price_asc", "price_desc", "rating")
+
+
+@dataclass(slots=True)
+class Sample:
+    endpoint: str
+    ms: float
+    ok: bool
+    db_queries: int | None
+
+
+@dataclass
+class VirtualUser:
+    client: httpx.AsyncClient
+    dataset: Dataset
+    rng: random.Random
+    # Shared by every virtual user of a run: a unique start slot per new booking
+    hours: itertools.count
+    samples: list[Sample] = field(default_factory=list)
+
+    async def call(self, endpoint: str, path: str, *, expect=(200,), **kwargs) -> httpx.Response:
+        method = endpoint.split(" ", 1)[0]
+        t0 = time.perf_counter()
+        r = await self.client.request(method, path, **kwargs)
+        ms = (time.perf_counter() - t0) * 1000
+        queries = r.headers.get(QUERY_HEADER)
+        self.samples.append(Sample(endpoint, ms, r.status_code in expect, int(queries) if queries else None))
+        return r
+
+    def any_client(self) -> Account:
+        return self.rng.choice(self.dataset.clients)
+
+    def any_service(self) -> int:
+        return self.rng.choice(list(self.dataset.services))
+
+    def freelancer_of(self, service_id: int) -> Account:
+        freelancer_id = self.dataset.services[service_id]
+        return next(f for f in self.dataset.freelancers if f.id == freelancer_id)
+
+
+async def browse(vu: VirtualUser):
+    """Anonymous catalog browsing: search, open a service, look for a slot."""
+    params = {"limit": 20, "sort": vu.rng.choice(SORTS)}
+    if vu.rng.random() < 0.3:
+        params["q"] = vu.rng.choice(SEARCH_TERMS)
+    await vu.call("GET /services/", "/services/", params=params)
+    service_id = vu.any_service()
+    await vu.call("GET /services/{id}", f"/services/{service_id}")
+    await vu.call("GET /reviews/services/{id}/summary", f"/reviews/services/{service_id}/summary")
+    start = vu.dataset.free_from + timedelta(days=vu.rng.randrange(28))
+    await vu.call("GET /services/{id}/free-slots", f"/services/{service_id}/free-slots",
+                  params={"from": start.isoformat(), "to": (start + timedelta(days=7)).isoformat()})
+
+
+async def pages(vu: VirtualUser):
+    """Signed-in client on the server-rendered pages."""
+    client = vu.any_client()
+    await vu.call("GET /", "/")
+    await vu.call("GET /services (page)", "/services", headers=client.headers)
+    await vu.call("GET /services/{id}/view (page)", f"/services/{vu.any_service()}/view", headers=client.headers)
+    await vu.call("GET /dashboard/client (page)", "/dashboard/client", headers=client.headers)
+
+
+async def favorites(vu: VirtualUser):
+    """Client reviews their favorites, checks a result page and toggles one."""
+    client = vu.any_client()
+    await vu.call("GET /favorites/", "/favorites/", headers=client.headers)
+    listing = vu.rng.sample(list(vu.dataset.services), min(20, len(vu.dataset.services)))
+    await vu.call("POST /favorites/check", "/favorites/check", headers=client.headers,
+                  json={"service_ids": listing})
+    service_id = listing[0]
+    await vu.call("GET /favorites/check/{id}", f"/favorites/check/{service_id}", headers=client.headers)
+    # Another virtual user may share this client: duplicates and misses are fine
+    await vu.call("POST /favorites/", "/favorites/", headers=client.headers, json={"service_id": service_id},
+                  expect=(201, 400))
+    await vu.call("DELETE /favorites/{id}", f"/favorites/{service_id}", headers=client.headers, expect=(204, 404))
+
+
+async def booking(vu: VirtualUser):
+    """Book, get confirmed, then either cancel or complete and review."""
+    client = vu.any_client()
+    service_id = vu.any_service()
+    freelancer = vu.freelancer_of(service_id)
+    start = vu.dataset.free_from + timedelta(hours=next(vu.hours) * 2)
+    r = await vu.call("POST /bookings/", "/bookings/", headers=client.headers, expect=(201,),
+                      json={"service_id": service_id, "start_at": start.isoformat()})
+    if r.status_code != 201:
+        return
+    booking_id = r.json()["id"]
+    await vu.call("PUT /bookings/{id}/status", f"/bookings/{booking_id}/status", headers=freelancer.headers,
+                  params={"new_status": "confirmed"})
+    if vu.rng.random() < 0.3:
+        await vu.call("PUT /bookings/{id}/status", f"/bookings/{booking_id}/status", headers=client.headers,
+                      params={"new_status": "canceled"})
+    else:
+        await vu.call("PUT /bookings/{id}/status", f"/bookings/{booking_id}/status", headers=freelancer.headers,
+                      params={"new_status": "completed"})
+        await vu.call("POST /reviews/", "/reviews/", headers=client.headers, expect=(201,),
+                      json={"booking_id": booking_id, "rating": vu.rng.randint(1, 5), "comment": "load test"})
+    await vu.call("GET /bookings/", "/bookings/", headers=client.headers, params={"limit": 20})
+
+
+async def freelancer(vu: VirtualUser):
+    """Freelancer checks their calendar and bookings."""
+    account = vu.rng.choice(vu.dataset.freelancers)
+    await vu.call("GET /availability/", "/availability/", headers=account.headers)
+    await vu.call("GET /bookings/", "/bookings/", headers=account.headers, params={"limit": 20})
+    start = vu.dataset.free_from + timedelta(days=vu.rng.randrange(28), hours=10)
+    await vu.call("GET /availability/freelancers/{id}/is-free", f"/availability/freelancers/{account.id}/is-free",
+                  params={"start_at": start.isoformat(), "end_at": (start + timedelta(hours=1)).isoformat()})
+    await vu.call("GET /reviews/freelancers/{id}/summary", f"/reviews/freelancers/{account.id}/summary")
+
+
+async def login(vu: VirtualUser):
+    """Password login (full bcrypt cost) followed by the profile fetch."""
+    client = vu.any_client()
+    r = await vu.call("POST /auth/login", "/auth/login", data={"username": client.username, "password": PASSWORD})
+    if r.status_code == 200:
+        await vu.call("GET /users/me", "/users/me",
+                      headers={"Authorization": f"Bearer {r.json()['access_token']}"})
+
+
+JOURNEYS = {
+    "browse": browse,
+    "pages": pages,
+    "favorites": favorites,
+    "booking": booking,
+    "freelancer": freelancer,
+    "login": login,
+}
+# Read-heavy by default; override with --mix
+DEFAULT_MIX = {"browse": 45, "pages": 10, "favorites": 15, "booking": 15, "freelancer": 10, "login": 5}
+
+
+def parse_mix(value: str) -> dict[str, int]:
+    """Journey weights from "browse=50,login=5"; unknown journeys are an error."""
+    mix = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        if name.strip() not in JOURNEYS:
+            raise argparse.ArgumentTypeError(f"unknown journey {name!r}; choose from {', '.join(JOURNEYS)}")
+        mix[name.strip()] = int(weight)
+    return mix
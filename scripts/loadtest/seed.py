@@ -0,0 +1,113 @@
+"""Dataset for a load-test run: bulk inserts, one bcrypt hash for every user."""
+
+import random
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, time, timedelta, timezone
+
+from sqlalchemy import insert
+
+from app.core.hash import _hash
+from app.core.security import create_access_token
+from app.database.connection import SessionLocal
+from app.models.availability import AvailabilitySlot
+from app.models.booking import Booking, BookingStatus
+from app.models.favorite import Favorite
+from app.models.service import Service
+from app.models.user import User, UserRole
+
+PASSWORD = "loadtest-password"
+
+# Rows per unit of --scale
+FREELANCERS = 20
+CLIENTS = 100
+SERVICES_PER_FREELANCER = 3
+BOOKINGS_PER_FREELANCER = 20
+FAVORITES_PER_CLIENT = 5
+
+
+@dataclass
+class Account:
+    id: int
+    username: str
+    token: str
+
+    @property
+    def headers(self) -> dict:
+        return {"Authorization": f"Bearer {self.token}"}
+
+
+@dataclass
+class Dataset:
+    tag: str
+    freelancers: list[Account]
+    clients: list[Account]
+    # service id -> freelancer id
+    services: dict[int, int] = field(default_factory=dict)
+    # Seeded bookings end before this; journeys book from here on
+    free_from: datetime = datetime(2030, 1, 7, tzinfo=timezone.utc)
+
+
+def accounts(rows, role: str) -> list[Account]:
+    return [Account(id=row.id, username=row.username,
+                    token=create_access_token(data={"sub": str(row.id), "username": row.username, "role": role}))
+            for row in rows]
+
+
+def seed(scale: float, seed: int = 0) -> Dataset:
+    rng = random.Random(seed)
+    tag = uuid.uuid4().hex[:8]
+    n_freelancers = max(1, int(FREELANCERS * scale))
+    n_clients = max(1, int(CLIENTS * scale))
+    # Real cost so /auth/login does real work, but only computed once
+    password = _hash(PASSWORD)
+
+    db = SessionLocal()
+    try:
+        users = db.execute(insert(User).returning(User.id, User.username, User.role), [
+            {"username": f"lt_{role.value}_{tag}_{i}", "email": f"lt_{role.value}_{tag}_{i}@example.com",
+             "password": password, "role": role}
+            for role, count in ((UserRole.freelancer, n_freelancers), (UserRole.client, n_clients))
+            for i in range(count)
+        ]).all()
+        dataset = Dataset(
+            tag=tag,
+            freelancers=accounts([u for u in users if u.role == UserRole.freelancer], "freelancer"),
+            clients=accounts([u for u in users if u.role == UserRole.client], "client"),
+        )
+
+        services = db.execute(insert(Service).returning(Service.id, Service.freelancer_id), [
+            {"freelancer_id": f.id, "title": f"Load test {i} ({f.username})",
+             "description": "A realistic enough description for the catalog. " * 4,
+             "price": rng.choice((25.0, 40.0, 60.0, 90.0, 150.0)), "duration": rng.choice((30, 60, 90)),
+             "created_by_role": UserRole.freelancer}
+            for f in dataset.freelancers for i in range(SERVICES_PER_FREELANCER)
+        ]).all()
+        dataset.services = {sid: fid for sid, fid in services}
+
+        db.execute(insert(AvailabilitySlot), [
+            {"freelancer_id": f.id, "day_of_week": day, "start_time": time(9), "end_time": time(17)}
+            for f in dataset.freelancers for day in range(5)
+        ])
+
+        # Past bookings, back to back, so listings and reviews have history
+        by_freelancer: dict[int, list[int]] = {}
+        for sid, fid in services:
+            by_freelancer.setdefault(fid, []).append(sid)
+        start = dataset.free_from - timedelta(hours=BOOKINGS_PER_FREELANCER + 1)
+        db.execute(insert(Booking), [
+            {"client_id": rng.choice(dataset.clients).id, "freelancer_id": fid, "service_id": rng.choice(sids),
+             "start_at": start + timedelta(hours=n), "end_at": start + timedelta(hours=n + 1),
+             "status": rng.choice((BookingStatus.completed, BookingStatus.completed, BookingStatus.canceled))}
+            for fid, sids in by_freelancer.items() for n in range(BOOKINGS_PER_FREELANCER)
+        ])
+
+        service_ids = list(dataset.services)
+        db.execute(insert(Favorite), [
+            {"user_id": c.id, "service_id": sid}
+            for c in dataset.clients for sid in rng.sample(service_ids, min(FAVORITES_PER_CLIENT, len(service_ids)))
+        ])
+        db.commit()
+        return dataset
+    finally:
+        db.close()
@@ -0,0 +1,80 @@
+"""The app under test, wrapped to report SQL statements per request, and its uvicorn process.
+
+uvicorn loads `scripts.loadtest.server:app`. Every response carries an
+X-DB-Queries header with the number of statements its request ran, on
+either database stack, so the client side can attribute them per endpoint.
+"""
+
+import contextvars
+import os
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+
+import httpx
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.main import app as target
+
+QUERY_HEADER = "x-db-queries"
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# One mutable counter per request; threadpool and async tasks inherit the context
+_statements: contextvars.ContextVar[list[int] | None] = contextvars.ContextVar("loadtest_statements", default=None)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _count(*_):
+    counter = _statements.get()
+    if counter is not None:
+        counter[0] += 1
+
+
+async def app(scope, receive, send):
+    if scope["type"] != "http":
+        return await target(scope, receive, send)
+    counter = [0]
+    token = _statements.set(counter)
+
+    async def send_with_count(message):
+        if message["type"] == "http.response.start":
+            message = {**message, "headers": [*message.get("headers", []),
+                                              (QUERY_HEADER.encode(), str(counter[0]).encode())]}
+        await send(message)
+
+    try:
+        await target(scope, receive, send_with_count)
+    finally:
+        _statements.reset(token)
+
+
+def wait_ready(base_url: str, proc: subprocess.Popen):
+    for _ in range(150):
+        if proc.poll() is not None:
+            raise RuntimeError("uvicorn exited during startup")
+        try:
+            if httpx.get(f"{base_url}/health", timeout=1).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError("uvicorn did not become ready")
+
+
+@contextmanager
+def serve(port: int, workers: int = 1, env: dict | None = None):
+    """Run the instrumented app under uvicorn; yields its base URL."""
+    base_url = f"http://127.0.0.1:{port}"
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "scripts.loadtest.server:app", "--port", str(port),
+         "--workers", str(workers), "--log-level", "warning", "--no-access-log"],
+        cwd=ROOT, env={**os.environ, **(env or {})},
+    )
+    try:
+        wait_ready(base_url, proc)
+        yield base_url
+    finally:
+        proc.terminate()
+        proc.wait()
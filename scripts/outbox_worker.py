@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Outbox worker: runs the side effects of booking changes (app/utils/outbox.py).
+
+Claims due events from outbox_events in batches (FOR UPDATE SKIP LOCKED on
+Postgres, so any number of workers can run side by side), calls the
+handlers subscribed to each topic, and retries failures with exponential
+backoff until OUTBOX_MAX_ATTEMPTS. Handlers come from the modules listed in
+OUTBOX_HANDLERS / --handlers; app.utils.outbox itself only logs events.
+Serves Prometheus metrics (throughput, retries, commit-to-processed lag,
+backlog) on --metrics-port. Needs only the database. Uses DATABASE_URL.
+
+    python scripts/outbox_worker.py
+    python scripts/outbox_worker.py --once      # drain what is due, then exit
+"""
+
+import argparse
+import logging
+import os
+import signal
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.config import settings
+from app.database.connection import SessionLocal, engine
+import app.models  # noqa: F401  registers the mapped classes
+from app.utils.outbox import OutboxMetrics, OutboxWorker, load_handlers, outbox_backlog, render_prometheus
+
+logger = logging.getLogger("app.outbox")
+
+
+def serve_metrics(port: int, metrics: OutboxMetrics) -> ThreadingHTTPServer:
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path != "/metrics":
+                self.send_error(404)
+                return
+            db = SessionLocal()
+            try:
+                backlog = outbox_backlog(db)
+            except Exception:
+                logger.exception("outbox backlog query failed")
+                backlog = None
+            finally:
+                db.close()
+            body = render_prometheus(metrics, backlog).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("0.0.0.0", port), MetricsHandler)
+    threading.Thread(target=server.serve_forever, name="outbox-metrics", daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--once", action="store_true", help="process due events until none are left, then exit")
+    parser.add_argument("--threads", type=int, default=1, help="worker loops in this process (Postgres only)")
+    parser.add_argument("--batch-size", type=int, default=settings.OUTBOX_BATCH_SIZE)
+    parser.add_argument("--poll-interval", type=float, default=settings.OUTBOX_POLL_INTERVAL_S)
+    parser.add_argument("--metrics-port", type=int, default=settings.OUTBOX_METRICS_PORT, help="0 disables")
+    parser.add_argument("--handlers", default="", help="extra comma-separated handler modules")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    load_handlers(f"{settings.OUTBOX_HANDLERS},{args.handlers}")
+    metrics = OutboxMetrics()
+
+    if args.once:
+        worker = OutboxWorker(SessionLocal, batch_size=args.batch_size, metrics=metrics)
+        t0, total = time.perf_counter(), 0
+        while claimed := worker.run_once():
+            total += claimed
+        print(f"Claimed {total} events in {time.perf_counter() - t0:.2f}s: {metrics.processed} processed, "
+              f"{metrics.retried} retried, {metrics.failed} failed")
+        return
+
+    threads = args.threads
+    if engine.dialect.name != "postgresql" and threads > 1:
+        logger.warning("Without SKIP LOCKED (%s) parallel loops would claim the same events: using 1",
+                       engine.dialect.name)
+        threads = 1
+
+    stop = threading.Event()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, lambda *_: stop.set())
+    if args.metrics_port:
+        serve_metrics(args.metrics_port, metrics)
+        logger.info("outbox metrics on :%d/metrics", args.metrics_port)
+
+    logger.info("outbox worker started: %d loop(s), batch %d, poll %.2fs", threads, args.batch_size,
+                args.poll_interval)
+    loops = [threading.Thread(target=OutboxWorker(SessionLocal, batch_size=args.batch_size, metrics=metrics)
+                              .run_forever, args=(stop, args.poll_interval), name=f"outbox-{i}")
+             for i in range(threads)]
+    for loop in loops:
+        loop.start()
+    # Join with a timeout so the main thread keeps running signal handlers
+    for loop in loops:
+        while loop.is_alive():
+            loop.join(1)
+    logger.info("outbox worker stopped: %d processed, %d retried, %d failed", metrics.processed, metrics.retried,
+                metrics.failed)
+
+
+if __name__ == "__main__":
+    main()
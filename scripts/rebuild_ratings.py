@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Recompute service_ratings and freelancer_ratings from the reviews table.
+
+The summaries are normally maintained in the same transaction as each
+review write; run this after bulk imports, manual SQL edits, or if the
+two ever drift. Safe to run on a live database: the rebuild is a single
+transaction. Uses DATABASE_URL.
+
+    python scripts/rebuild_ratings.py
+"""
+
+import os
+import sys
+import time
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.database.connection import SessionLocal
+import app.models.user  # noqa: F401
+from app.utils.ratings import rebuild_rating_summaries
+
+
+def main():
+    db = SessionLocal()
+    try:
+        t0 = time.perf_counter()
+        counts = rebuild_rating_summaries(db)
+        print(f"Rebuilt rating summaries for {counts['services']} services and "
+              f"{counts['freelancers']} freelancers in {time.perf_counter() - t0:.2f}s")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
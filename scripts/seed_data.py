@@ -2,20 +2,48 @@
 """
 Seed data script for CI testing.
 Creates sample users, services, and bookings for testing.
+
+With --generate it bulk-loads a large synthetic dataset instead: users,
+services, availability, bookings, reviews and favorites with skew (bookings
+per freelancer and favorites per service follow Zipf laws, so a few
+freelancers and services are hot). Rows come from --seed and the sizes
+alone, so the same arguments give the same rows whatever --workers is.
+Chunks load in parallel worker processes with COPY on Postgres (psycopg2)
+and executemany INSERTs elsewhere; SQLite has a single writer, so it loads
+in-process. Every synthetic user shares one precomputed password hash
+(password123). Appends to existing data; rating summaries are rebuilt and
+tables analyzed at the end. Uses DATABASE_URL; the schema must exist.
+
+    python scripts/seed_data.py
+    python scripts/seed_data.py --generate --users 1000000 --bookings 4000000   # ~12M rows
 """
 
+import argparse
+import csv
+import io
+import multiprocessing
 import os
 import sys
-from datetime import datetime, timedelta
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import date, datetime, time as dtime, timedelta, timezone
+from functools import lru_cache
 
 # Add parent directory to path to import app modules
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+import numpy as np
+from sqlalchemy import func, insert, select, text
 from sqlalchemy.orm import Session
 from app.database.connection import SessionLocal, engine
 from app.models.user import User, UserRole
 from app.models.service import Service
 from app.models.booking import Booking, BookingStatus
+from app.models.availability import AvailabilitySlot
+from app.models.favorite import Favorite
+from app.models.review import Review
+from app.utils.ratings import rebuild_rating_summaries
 from passlib.context import CryptContext
 
 # Password hashing
@@ -106,7 +134,7 @@ def seed_data():
         
         db.add(booking)
         db.commit()
-        print(f"Created 1 booking")
+        print("Created 1 booking")
         
         print("✓ Database seeded successfully!")
         
@@ -118,5 +146,366 @@ def seed_data():
         db.close()
 
 
+
+# --generate ---------------------------------------------------------------
+
+GENERATED_PASSWORD = "password123"
+CATEGORIES = ("Web Development", "UI/UX Design", "Logo Design", "Copywriting", "Translation", "SEO Audit",
+              "Video Editing", "Photography", "Tutoring", "Bookkeeping", "Voice Over", "Data Analysis",
+              "Mobile App Development", "Illustration", "Career Coaching", "Music Lessons")
+ADJECTIVES = ("Professional", "Express", "Premium", "Affordable", "Custom", "Beginner-friendly", "Expert",
+              "Same-day", "Complete", "Quick")
+WORDS = ("service", "session", "review", "delivery", "project", "consultation", "support", "quality", "clients",
+         "results", "experience", "revisions", "detailed", "fast", "friendly", "remote", "portfolio", "strategy",
+         "feedback", "report", "design", "content", "business", "personal", "online", "weekly", "plan")
+COMMENTS = ("Great work, would book again.", "Very professional.", "Delivered on time.", "Good value.",
+            "Communication could be better.", "Exceeded expectations!", None)
+PRICES = (15.0, 25.0, 40.0, 60.0, 90.0, 150.0, 250.0)
+DURATIONS = (30, 45, 60)  # minutes; bookings take one-hour slots, so never more
+RATING_WEIGHTS = (0.03, 0.05, 0.12, 0.30, 0.50)
+UPCOMING_SHARE = 0.1  # bookings after the anchor: pending/confirmed, so never overlapping
+SLOTS_PER_DAY = 8  # bookings are laid out 09:00-17:00, back to back
+# (days, ranges) availability templates and their weights
+WEEKLY_TEMPLATES = (
+    (range(5), ((dtime(9), dtime(17)),)),
+    (range(6), ((dtime(10), dtime(18)),)),
+    (range(5), ((dtime(9), dtime(12)), (dtime(13), dtime(18)))),
+)
+TEMPLATE_WEIGHTS = (0.7, 0.2, 0.1)
+PHASES = ("users", "services", "bookings", "favorites")
+
+
+@dataclass(frozen=True)
+class Plan:
+    """Sizes and id ranges of one --generate run, sent to every worker."""
+    seed: int
+    anchor: datetime  # Monday 00:00 UTC; past bookings end before it, upcoming ones start after
+    users: int
+    freelancers: int
+    services_per_freelancer: int
+    bookings: int
+    favorites_per_client: float
+    review_rate: float
+    skew: float
+    favorite_skew: float
+    chunk_size: int
+    password: str
+    first_user_id: int
+    first_service_id: int
+    first_booking_id: int
+
+    @property
+    def clients(self) -> int:
+        return self.users - self.freelancers
+
+    @property
+    def services(self) -> int:
+        return self.freelancers * self.services_per_freelancer
+
+    def chunks(self, phase: str) -> list[tuple[int, int]]:
+        """(start, stop) index ranges of users, freelancers or clients handled by one task."""
+        if phase == "users":
+            return [(i, min(i + self.chunk_size, self.users)) for i in range(0, self.users, self.chunk_size)]
+        if phase == "favorites":
+            per = max(1, int(self.chunk_size / max(1, self.favorites_per_client)))
+            return [(i, min(i + per, self.clients)) for i in range(0, self.clients, per)]
+        if phase == "services":
+            per = max(1, self.chunk_size // (self.services_per_freelancer + 6))
+            return [(i, min(i + per, self.freelancers)) for i in range(0, self.freelancers, per)]
+        # bookings: freelancer ranges holding about chunk_size bookings each (a hot one may exceed it alone)
+        ends = booking_offsets(self.bookings, self.freelancers, self.skew)[1:]
+        cuts = np.unique(np.searchsorted(ends, np.arange(self.chunk_size, self.bookings, self.chunk_size)) + 1)
+        bounds = [0, *(int(c) for c in cuts if c < self.freelancers), self.freelancers]
+        return list(zip(bounds, bounds[1:]))
+
+
+def zipf_weights(n: int, exponent: float):
+    return 1.0 / np.arange(1, n + 1, dtype=np.float64) ** exponent
+
+
+@lru_cache(maxsize=4)
+def booking_offsets(bookings: int, freelancers: int, skew: float):
+    """Start offset of each freelancer's bookings (freelancer 0 is the hottest); the last entry is the total."""
+    weights = zipf_weights(freelancers, skew)
+    counts = np.floor(bookings * weights / weights.sum()).astype(np.int64)
+    counts[: bookings - int(counts.sum())] += 1
+    return np.concatenate(([0], np.cumsum(counts)))
+
+
+@lru_cache(maxsize=4)
+def popularity_cdf(n: int, exponent: float):
+    weights = zipf_weights(n, exponent)
+    return np.cumsum(weights) / weights.sum()
+
+
+def rng_for(plan: Plan, phase: str, start: int):
+    return np.random.default_rng([plan.seed, PHASES.index(phase), start])
+
+
+def minutes_before(anchor: datetime, minutes) -> list[datetime]:
+    return [anchor - timedelta(minutes=int(m)) for m in minutes]
+
+
+def generate_users(plan: Plan, start: int, stop: int) -> dict:
+    rng = rng_for(plan, "users", start)
+    created = minutes_before(plan.anchor, rng.integers(0, 3 * 365 * 24 * 60, stop - start))
+    rows = []
+    for i, created_at in zip(range(start, stop), created):
+        user_id = plan.first_user_id + i
+        role = "freelancer" if i < plan.freelancers else "client"
+        rows.append((user_id, f"gen_{role}_{user_id}", f"gen_{role}_{user_id}@example.com", plan.password, role,
+                     created_at))
+    return {User.__table__: (("id", "username", "email", "password", "role", "created_at"), rows)}
+
+
+def generate_services(plan: Plan, start: int, stop: int) -> dict:
+    """Services and weekly availability of freelancers start..stop."""
+    rng = rng_for(plan, "services", start)
+    n = (stop - start) * plan.services_per_freelancer
+    categories, adjectives = rng.integers(0, len(CATEGORIES), n), rng.integers(0, len(ADJECTIVES), n)
+    words = rng.integers(0, len(WORDS), (n, 24))
+    prices, durations = rng.integers(0, len(PRICES), n), rng.integers(0, len(DURATIONS), n)
+    created = minutes_before(plan.anchor, rng.integers(0, 2 * 365 * 24 * 60, n))
+    services = []
+    for j in range(n):
+        freelancer = start + j // plan.services_per_freelancer
+        category = CATEGORIES[categories[j]]
+        description = f"{category}: " + " ".join(WORDS[w] for w in words[j]) + "."
+        services.append((
+            plan.first_service_id + start * plan.services_per_freelancer + j, plan.first_user_id + freelancer,
+            f"{ADJECTIVES[adjectives[j]]} {category}", description, PRICES[prices[j]], DURATIONS[durations[j]],
+            "freelancer", created[j],
+        ))
+
+    slots = []
+    for freelancer, template in zip(range(start, stop), rng.choice(len(WEEKLY_TEMPLATES), stop - start,
+                                                                   p=TEMPLATE_WEIGHTS)):
+        days, ranges = WEEKLY_TEMPLATES[template]
+        slots.extend((plan.first_user_id + freelancer, day, begin, end) for day in days for begin, end in ranges)
+
+    return {
+        Service.__table__: (("id", "freelancer_id", "title", "description", "price", "duration", "created_by_role",
+                             "created_at"), services),
+        AvailabilitySlot.__table__: (("freelancer_id", "day_of_week", "start_time", "end_time"), slots),
+    }
+
+
+def generate_bookings(plan: Plan, start: int, stop: int) -> dict:
+    """Bookings of freelancers start..stop, and reviews of the completed ones.
+
+    Each freelancer's bookings fill one-hour slots, the first UPCOMING_SHARE
+    forward from the anchor, the rest backward, so pending and confirmed
+    bookings never overlap (the Postgres exclusion constraint holds).
+    """
+    rng = rng_for(plan, "bookings", start)
+    offsets = booking_offsets(plan.bookings, plan.freelancers, plan.skew)
+    first, total = int(offsets[start]), int(offsets[stop] - offsets[start])
+    clients = plan.first_user_id + plan.freelancers + rng.integers(0, plan.clients, total)
+    services = rng.integers(0, plan.services_per_freelancer, total)
+    outcome, review_roll, ratings = rng.random(total), rng.random(total), rng.choice(5, total, p=RATING_WEIGHTS) + 1
+    comments = rng.integers(0, len(COMMENTS), total)
+    lead_minutes, review_minutes = rng.integers(60, 30 * 24 * 60, total), rng.integers(60, 72 * 60, total)
+
+    bookings, reviews, k = [], [], 0
+    for freelancer in range(start, stop):
+        count = int(offsets[freelancer + 1] - offsets[freelancer])
+        upcoming = int(count * UPCOMING_SHARE)
+        for j in range(count):
+            if j < upcoming:
+                day, slot = divmod(j, SLOTS_PER_DAY)
+                status = "pending" if outcome[k] < 0.5 else "confirmed"
+            else:
+                day, slot = divmod(j - upcoming, SLOTS_PER_DAY)
+                day = -day - 1
+                status = "completed" if outcome[k] < 0.8 else "canceled"
+            start_at = plan.anchor + timedelta(days=day, hours=9 + slot)
+            end_at = start_at + timedelta(hours=1)
+            booking_id = plan.first_booking_id + first + k
+            bookings.append((
+                booking_id, int(clients[k]), plan.first_user_id + freelancer,
+                plan.first_service_id + freelancer * plan.services_per_freelancer + int(services[k]),
+                start_at, end_at, status, start_at - timedelta(minutes=int(lead_minutes[k])),
+            ))
+            if status == "completed" and review_roll[k] < plan.review_rate:
+                reviews.append((booking_id, int(ratings[k]), COMMENTS[comments[k]],
+                                end_at + timedelta(minutes=int(review_minutes[k]))))
+            k += 1
+
+    return {
+        Booking.__table__: (("id", "client_id", "freelancer_id", "service_id", "start_at", "end_at", "status",
+                             "created_at"), bookings),
+        Review.__table__: (("booking_id", "rating", "comment", "created_at"), reviews),
+    }
+
+
+def generate_favorites(plan: Plan, start: int, stop: int) -> dict:
+    """Favorites of clients start..stop; services are drawn from a Zipf popularity curve."""
+    rng = rng_for(plan, "favorites", start)
+    cdf = popularity_cdf(plan.services, plan.favorite_skew)
+    wanted = np.minimum(rng.poisson(plan.favorites_per_client, stop - start), plan.services)
+    # Oversample so duplicates can be dropped without a second draw
+    draws = np.searchsorted(cdf, rng.random(int(wanted.sum()) * 2), side="right")
+    created = minutes_before(plan.anchor, rng.integers(0, 365 * 24 * 60, int(wanted.sum())))
+    rows, d = [], 0
+    for client, count in zip(range(start, stop), wanted.tolist()):
+        picks = list(dict.fromkeys(draws[d: d + 2 * count].tolist()))[:count]
+        d += 2 * count
+        user_id = plan.first_user_id + plan.freelancers + client
+        rows.extend([(user_id, plan.first_service_id + s, created[len(rows) + i]) for i, s in enumerate(picks)])
+    return {Favorite.__table__: (("user_id", "service_id", "created_at"), rows)}
+
+
+GENERATORS = {
+    "users": generate_users,
+    "services": generate_services,
+    "bookings": generate_bookings,
+    "favorites": generate_favorites,
+}
+
+
+PLACEHOLDERS = {"qmark": "?", "format": "%s", "pyformat": "%s"}
+
+
+def write_rows(conn, table, columns: tuple[str, ...], rows: list[tuple]):
+    """COPY on psycopg2; otherwise one driver-level executemany INSERT.
+
+    The executemany path applies only the column types' bind processors
+    (e.g. SQLite's datetime formatting), skipping SQLAlchemy's per-row
+    parameter compilation, which costs more than the insert itself.
+    """
+    if not rows:
+        return
+    dialect = conn.dialect
+    if dialect.name == "postgresql" and dialect.driver == "psycopg2":
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(rows)
+        buffer.seek(0)
+        with conn.connection.cursor() as cursor:
+            cursor.copy_expert(f"COPY {table.name} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)", buffer)
+        return
+    if dialect.paramstyle not in PLACEHOLDERS:
+        conn.execute(insert(table), [dict(zip(columns, row)) for row in rows])
+        return
+    processors = [(i, processor) for i, name in enumerate(columns)
+                  if (processor := table.c[name].type.dialect_impl(dialect).bind_processor(dialect))]
+    if processors:
+        converted = []
+        for row in rows:
+            row = list(row)
+            for i, processor in processors:
+                row[i] = processor(row[i])
+            converted.append(tuple(row))
+        rows = converted
+    placeholders = ", ".join([PLACEHOLDERS[dialect.paramstyle]] * len(columns))
+    conn.exec_driver_sql(f"INSERT INTO {table.name} ({', '.join(columns)}) VALUES ({placeholders})", rows)
+
+
+def load_chunk(task: tuple[str, Plan, int, int]) -> dict[str, int]:
+    """Generate and write one chunk in its own transaction; returns rows written per table."""
+    phase, plan, start, stop = task
+    tables = GENERATORS[phase](plan, start, stop)
+    with engine.begin() as conn:
+        for table, (columns, rows) in tables.items():
+            write_rows(conn, table, columns, rows)
+    return {table.name: len(rows) for table, (columns, rows) in tables.items()}
+
+
+def make_plan(args, password: str) -> Plan:
+    with engine.connect() as conn:
+        def next_id(model) -> int:
+            return conn.scalar(select(func.coalesce(func.max(model.id), 0))) + 1
+
+        first_ids = next_id(User), next_id(Service), next_id(Booking)
+    freelancers = max(1, int(args.users * args.freelancer_share))
+    return Plan(
+        seed=args.seed, anchor=args.anchor, users=max(args.users, freelancers + 1), freelancers=freelancers,
+        services_per_freelancer=args.services_per_freelancer, bookings=args.bookings,
+        favorites_per_client=args.favorites_per_client, review_rate=args.review_rate, skew=args.skew,
+        favorite_skew=args.favorite_skew, chunk_size=args.chunk_size, password=password,
+        first_user_id=first_ids[0], first_service_id=first_ids[1], first_booking_id=first_ids[2],
+    )
+
+
+def finish():
+    """Move id sequences past the explicit ids, rebuild rating summaries and refresh planner statistics."""
+    with engine.begin() as conn:
+        if conn.dialect.name == "postgresql":
+            for table in ("users", "services", "bookings"):
+                conn.execute(text(f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+                                  f"(SELECT max(id) FROM {table}))"))
+    db = SessionLocal()
+    try:
+        counts = rebuild_rating_summaries(db)
+        print(f"Rebuilt rating summaries: {counts['services']} services, {counts['freelancers']} freelancers")
+    finally:
+        db.close()
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text("ANALYZE"))
+
+
+def generate(args):
+    plan = make_plan(args, hash_password(GENERATED_PASSWORD))
+    workers = args.workers
+    if engine.dialect.name == "sqlite" and workers > 1:
+        print("SQLite allows one writer at a time: loading in-process")
+        workers = 1
+    print(f"Generating {plan.users} users ({plan.freelancers} freelancers), {plan.services} services, "
+          f"{plan.bookings} bookings; seed {plan.seed}, anchor {plan.anchor:%Y-%m-%d}, {workers} worker(s)")
+
+    t_start = time.perf_counter()
+    # spawn: children build their own engine instead of inheriting pooled connections
+    executor = (ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("spawn"))
+                if workers > 1 else None)
+    try:
+        # Phases run in order (foreign keys); chunks within a phase run in parallel
+        for phase in PHASES:
+            t0 = time.perf_counter()
+            tasks = [(phase, plan, start, stop) for start, stop in plan.chunks(phase)]
+            totals: dict[str, int] = {}
+            for counts in (executor.map(load_chunk, tasks) if executor else map(load_chunk, tasks)):
+                for name, count in counts.items():
+                    totals[name] = totals.get(name, 0) + count
+            elapsed = time.perf_counter() - t0
+            rows = sum(totals.values())
+            print(f"  {phase:10} {rows:>11,} rows in {elapsed:6.1f}s ({rows / max(elapsed, 1e-9):>9,.0f} rows/s)  "
+                  + ", ".join(f"{name}={count:,}" for name, count in totals.items()))
+    finally:
+        if executor:
+            executor.shutdown()
+    finish()
+    print(f"✓ Generated dataset in {time.perf_counter() - t_start:.1f}s "
+          f"(every user's password: {GENERATED_PASSWORD})")
+
+
+def monday(value: str) -> datetime:
+    day = date.fromisoformat(value)
+    return datetime(day.year, day.month, day.day, tzinfo=timezone.utc) - timedelta(days=day.weekday())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--generate", action="store_true", help="bulk-load a synthetic dataset")
+    parser.add_argument("--users", type=int, default=100_000)
+    parser.add_argument("--freelancer-share", type=float, default=0.1)
+    parser.add_argument("--services-per-freelancer", type=int, default=3)
+    parser.add_argument("--bookings", type=int, default=500_000)
+    parser.add_argument("--favorites-per-client", type=float, default=5, help="mean (Poisson)")
+    parser.add_argument("--review-rate", type=float, default=0.6, help="share of completed bookings reviewed")
+    parser.add_argument("--skew", type=float, default=0.8, help="Zipf exponent of bookings per freelancer")
+    parser.add_argument("--favorite-skew", type=float, default=1.0, help="Zipf exponent of favorites per service")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--anchor", type=monday, default=monday(date.today().isoformat()),
+                        help="date splitting past from upcoming bookings, moved back to its Monday "
+                             "(default: this week; pin it to reproduce a dataset exactly)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=50_000, help="rows per task (part of the seed)")
+    args = parser.parse_args()
+
+    if args.generate:
+        generate(args)
+    else:
+        seed_data()
+
+
 if __name__ == "__main__":
-    seed_data()
+    main()